@@ -1,7 +1,13 @@
+from TimeConvert.busday import BusinessCalendar
+from TimeConvert.clock import Clock, CoarseClock, FrozenClock, RealClock
 from TimeConvert.convert import TC, TimeConvert, tc
+from TimeConvert.delta import Delta
+from TimeConvert.interval import TimeRange, TimeRangeIndex
 from TimeConvert.isoweek import ISOWeek
 from TimeConvert.month import Month
-from TimeConvert.quarter import Quarter
+from TimeConvert.profiling import Profiler, profile
+from TimeConvert.quarter import FiscalQuarter, Quarter
+from TimeConvert.ranges import DateRange, MonthRange, PeriodRange, QuarterRange, WeekRange
 from TimeConvert.stopwatch import StopWatch, TimeType
 from TimeConvert.week import Week
 
@@ -12,8 +18,24 @@ __all__ = [
     'TimeConvert',
     'Month',
     'Quarter',
+    'FiscalQuarter',
     'Week',
     'ISOWeek',
+    'BusinessCalendar',
+    'Delta',
+    'Clock',
+    'RealClock',
+    'CoarseClock',
+    'FrozenClock',
+    'Profiler',
+    'profile',
     'StopWatch',
-    'TimeType'
+    'TimeType',
+    'TimeRange',
+    'TimeRangeIndex',
+    'PeriodRange',
+    'DateRange',
+    'WeekRange',
+    'MonthRange',
+    'QuarterRange',
 ]
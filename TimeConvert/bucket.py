@@ -0,0 +1,134 @@
+import calendar
+import datetime
+
+from .isoweek import ISOWeek
+from .month import Month
+from .quarter import Quarter
+from .zonetable import EPOCH_ORDINAL, SECONDS_PER_DAY
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+BUCKET_DAY = 'day'
+BUCKET_WEEK = 'week'
+BUCKET_MONTH = 'month'
+BUCKET_QUARTER = 'quarter'
+BUCKET_GRANULARITIES = (BUCKET_DAY, BUCKET_WEEK, BUCKET_MONTH, BUCKET_QUARTER)
+
+# Bucket ids are the ordinals of the periods, 1 being the period containing 0001-01-01:
+#   day     - ``datetime.date.toordinal``
+#   week    - ``ISOWeek.toordinal``
+#   month   - ``Month.toordinal``
+#   quarter - ``Quarter.toordinal``
+_DECODERS = {
+    BUCKET_DAY: datetime.date.fromordinal,
+    BUCKET_WEEK: ISOWeek.fromordinal,
+    BUCKET_MONTH: Month.fromordinal,
+    BUCKET_QUARTER: Quarter.fromordinal,
+}
+
+
+def _day_bucket(ordinal):
+    return ordinal
+
+
+def _week_bucket(ordinal):
+    # Ordinal 1 (0001-01-01) is a Monday
+    return (ordinal - 1) // 7 + 1
+
+
+def _month_bucket(ordinal):
+    date = datetime.date.fromordinal(ordinal)
+    return (date.year - 1) * 12 + date.month
+
+
+def _quarter_bucket(ordinal):
+    date = datetime.date.fromordinal(ordinal)
+    return (date.year - 1) * 4 + (date.month + 2) // 3
+
+
+_ORDINAL_BUCKETERS = {
+    BUCKET_DAY: _day_bucket,
+    BUCKET_WEEK: _week_bucket,
+    BUCKET_MONTH: _month_bucket,
+    BUCKET_QUARTER: _quarter_bucket,
+}
+
+
+def _check_granularity(granularity):
+    if granularity not in BUCKET_GRANULARITIES:
+        raise ValueError('granularity must be one of %s, got %r' % (', '.join(BUCKET_GRANULARITIES), granularity))
+
+
+def ordinal_to_bucket(ordinal, granularity):
+    """Return the bucket id of the day with the proleptic Gregorian ``ordinal``."""
+    _check_granularity(granularity)
+    return _ORDINAL_BUCKETERS[granularity](ordinal)
+
+
+def bucket_values(values, granularity, table, parse):
+    """Return the bucket ids of ``values`` as a list, one value at a time.
+
+    Numbers are UTC epoch seconds and aware datetimes are instants, both taken
+    to wall-clock time through the ZoneTable ``table``; naive datetimes and dates
+    are wall-clock already; strings go through ``parse`` into naive datetimes.
+    Values that cannot be converted give ``None``.
+    """
+    _check_granularity(granularity)
+    bucketer = _ORDINAL_BUCKETERS[granularity]
+    local_stamp = table.local_stamp
+    buckets = []
+    append = buckets.append
+    for value in values:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            append(bucketer(int(local_stamp(value) // SECONDS_PER_DAY) + EPOCH_ORDINAL))
+            continue
+        if isinstance(value, (str, bytes)):
+            value = parse(value)
+        if isinstance(value, datetime.datetime) and value.utcoffset() is not None:
+            stamp = calendar.timegm(value.utctimetuple())
+            append(bucketer(local_stamp(stamp) // SECONDS_PER_DAY + EPOCH_ORDINAL))
+        elif isinstance(value, datetime.date):
+            append(bucketer(value.toordinal()))
+        else:
+            append(None)
+    return buckets
+
+
+def bucket_epochs(stamps, granularity, table):
+    """Return the bucket ids of a NumPy array of UTC epoch seconds or ``datetime64`` instants."""
+    _check_granularity(granularity)
+    stamps = np.asarray(stamps)
+    if stamps.dtype.kind == 'M':
+        stamps = stamps.astype('datetime64[s]').astype(np.int64)
+    elif stamps.dtype.kind == 'f':
+        stamps = np.floor(stamps).astype(np.int64)
+    else:
+        stamps = stamps.astype(np.int64, copy=False)
+    days = table.local_stamps(stamps) // SECONDS_PER_DAY
+    if granularity == BUCKET_DAY:
+        return days + EPOCH_ORDINAL
+    if granularity == BUCKET_WEEK:
+        return (days + EPOCH_ORDINAL - 1) // 7 + 1
+    # Months since 0001-01, zero based
+    months = days.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64) + 1969 * 12
+    if granularity == BUCKET_MONTH:
+        return months + 1
+    return months // 3 + 1
+
+
+def decode_bucket(bucket, granularity):
+    """Return the ``datetime.date``, ``ISOWeek``, ``Month`` or ``Quarter`` of a bucket id."""
+    _check_granularity(granularity)
+    return _DECODERS[granularity](int(bucket))
+
+
+def decode_buckets(buckets, granularity):
+    """Return the periods of a sequence or array of bucket ids, ``None`` ids stay ``None``."""
+    _check_granularity(granularity)
+    decoder = _DECODERS[granularity]
+    return [None if bucket is None else decoder(int(bucket)) for bucket in buckets]
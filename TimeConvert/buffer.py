@@ -0,0 +1,206 @@
+"""
+Parsing of timestamps in place from bytes, bytearray and memoryview buffers.
+
+    parse(record, 8, 19)                           # datetime of record[8:27]
+    parse(memoryview(record)[8:27])
+    parse_many(buffer, stride=32, offset=8)        # datetime64[s] array, one per record
+
+Fields are read as ASCII digits straight from the buffer, no str is created
+per value. Batches read fixed-width records through a numpy view of the
+buffer, which is never copied whatever its size, window by window.
+
+Formats are made of ``%Y``, ``%m``, ``%d``, ``%H``, ``%M``, ``%S`` and ``%f``
+directives and literal characters, every field has a fixed width: four
+digits for the year, six for the microseconds, two for the other ones.
+"""
+import datetime
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+DATE_FORMAT = '%Y-%m-%d'
+# Formats of a buffer by its length, as ``value_format``
+LEN_FORMAT = {
+    19: DATETIME_FORMAT,
+    10: DATE_FORMAT,
+}
+
+# Field name and width of each directive
+DIRECTIVES = {
+    'Y': ('year', 4),
+    'm': ('month', 2),
+    'd': ('day', 2),
+    'H': ('hour', 2),
+    'M': ('minute', 2),
+    'S': ('second', 2),
+    'f': ('microsecond', 6),
+}
+
+# Records per window of ``parse_many``
+WINDOW = 1 << 16
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_DEFAULTS = {'year': 1900, 'month': 1, 'day': 1, 'hour': 0, 'minute': 0, 'second': 0, 'microsecond': 0}
+_LAYOUTS = {}
+
+
+class BufferLayout(object):
+    """Byte positions of the fields and literals of a format."""
+    __slots__ = ('format', 'fields', 'literals', 'length')
+
+    def __init__(self, format):
+        self.format = format
+        # (name, start, width) and (position, byte)
+        self.fields = []
+        self.literals = []
+        position, index = 0, 0
+        while index < len(format):
+            char = format[index]
+            if char == '%':
+                directive = format[index + 1:index + 2]
+                if directive == '%':
+                    self.literals.append((position, ord('%')))
+                    position += 1
+                elif directive in DIRECTIVES:
+                    name, width = DIRECTIVES[directive]
+                    if any(field[0] == name for field in self.fields):
+                        raise ValueError('directive %%%s is repeated in %r' % (directive, format))
+                    self.fields.append((name, position, width))
+                    position += width
+                else:
+                    raise ValueError('directive %%%s is not supported in buffers, only fixed-width digits: %%%s' % (directive, ', %'.join(DIRECTIVES)))
+                index += 2
+            else:
+                byte = ord(char)
+                if byte > 127:
+                    raise ValueError('format must be ASCII, got %r' % format)
+                self.literals.append((position, byte))
+                position += 1
+                index += 1
+        self.length = position
+
+
+def layout(format):
+    """Return the shared ``BufferLayout`` of ``format``, raise ValueError for unsupported directives."""
+    buffer_layout = _LAYOUTS.get(format)
+    if buffer_layout is None:
+        buffer_layout = _LAYOUTS[format] = BufferLayout(format)
+    return buffer_layout
+
+
+def _bytes_view(buffer):
+    # Indexing a memoryview of another format than unsigned bytes would give bytes or wider ints
+    if isinstance(buffer, memoryview) and buffer.format != 'B':
+        return buffer.cast('B')
+    return buffer
+
+
+def parse(buffer, offset=0, length=None, format=None):
+    """Return the naive datetime of the ``length`` bytes at ``offset`` of ``buffer``, ``None`` when they are not one.
+
+    ``format`` defaults to the one of ``length`` in ``LEN_FORMAT``, ``length``
+    to the rest of the buffer without a format and to the length of the
+    format with one, the record being read out of a longer buffer then.
+    """
+    buffer = _bytes_view(buffer)
+    if length is None:
+        length = len(buffer) - offset if format is None else layout(format).length
+    format = format or LEN_FORMAT.get(length)
+    if format is None:
+        return None
+    buffer_layout = layout(format)
+    if length != buffer_layout.length or offset < 0 or offset + length > len(buffer):
+        return None
+    for position, byte in buffer_layout.literals:
+        if buffer[offset + position] != byte:
+            return None
+    values = dict(_DEFAULTS)
+    for name, start, width in buffer_layout.fields:
+        value = 0
+        for index in range(offset + start, offset + start + width):
+            digit = buffer[index] - 48
+            if not 0 <= digit <= 9:
+                return None
+            value = value * 10 + digit
+        values[name] = value
+    try:
+        return datetime.datetime(**values)
+    except ValueError:
+        return None
+
+
+def _days_from_civil(year, month, day):
+    # Days since 1970-01-01 of proleptic Gregorian dates, vectorized
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + np.where(month > 2, -3, 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def _parse_window(records, buffer_layout):
+    valid = np.ones(len(records), dtype=bool)
+    for position, byte in buffer_layout.literals:
+        valid &= records[:, position] == byte
+    values = {}
+    for name, start, width in buffer_layout.fields:
+        value = np.zeros(len(records), dtype=np.int64)
+        for index in range(start, start + width):
+            # Bytes under ``0`` wrap around, above ``9`` too
+            digit = records[:, index] - np.uint8(48)
+            valid &= digit < 10
+            value = value * 10 + digit
+        values[name] = value
+    year, month, day = (values.get(name, np.int64(_DEFAULTS[name])) for name in ('year', 'month', 'day'))
+    valid &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1)
+    month = np.clip(month, 1, 12)
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    valid &= day <= np.asarray(_DAYS_IN_MONTH)[month] + ((month == 2) & leap)
+    hour, minute, second = (values.get(name, 0) for name in ('hour', 'minute', 'second'))
+    valid &= (hour < 24) & (minute < 60) & (second < 60)
+    stamps = _days_from_civil(year, month, day) * 86400 + hour * 3600 + minute * 60 + second
+    if 'microsecond' in values:
+        stamps = stamps * 10 ** 6 + values['microsecond']
+    return np.where(valid, stamps, np.iinfo(np.int64).min)
+
+
+def parse_many(buffer, stride=None, offset=0, count=None, format=DATETIME_FORMAT, out=None):
+    """Return the naive datetimes of the fixed-width records of ``buffer``.
+
+    Record ``i`` is read at ``offset + i * stride``, ``stride`` defaults to the
+    length of ``format`` (packed records) and ``count`` to every record the
+    buffer holds. With numpy, return a ``datetime64[s]`` array, ``[us]``
+    when ``format`` has ``%f``, with NaT for invalid records, written into
+    ``out`` when given; a list of datetimes and ``None`` without.
+    """
+    buffer_layout = layout(format)
+    buffer = _bytes_view(buffer)
+    stride = stride or buffer_layout.length
+    if stride < buffer_layout.length:
+        raise ValueError('stride must be at least the length %d of %r, got %d' % (buffer_layout.length, format, stride))
+    available = len(buffer) - offset
+    if count is None:
+        count = (available - buffer_layout.length) // stride + 1 if available >= buffer_layout.length else 0
+    elif count and (count - 1) * stride + buffer_layout.length > available:
+        raise ValueError('buffer of %d bytes holds less than %d records' % (len(buffer), count))
+    if np is None:
+        return [parse(buffer, offset + index * stride, buffer_layout.length, format) for index in range(count)]
+    unit = 'us' if any(field[0] == 'microsecond' for field in buffer_layout.fields) else 's'
+    if out is None:
+        out = np.empty(count, dtype='datetime64[%s]' % unit)
+    elif out.shape != (count, ) or out.dtype != np.dtype('datetime64[%s]' % unit):
+        raise ValueError('out must be a datetime64[%s] array of %d values' % (unit, count))
+    if not count:
+        return out
+    # A strided view, one row per record, over the buffer itself
+    records = np.ndarray((count, buffer_layout.length), dtype=np.uint8, buffer=buffer, offset=offset, strides=(stride, 1))
+    stamps = out.view(np.int64)
+    for start in range(0, count, WINDOW):
+        stamps[start:start + WINDOW] = _parse_window(records[start:start + WINDOW], buffer_layout)
+    return out
@@ -0,0 +1,177 @@
+import datetime
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+WEEKDAY_NAMES = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+BUSDAY_ROLLS = ('raise', 'forward', 'following', 'backward', 'preceding', 'modifiedfollowing', 'modifiedpreceding')
+
+
+def _parse_weekmask(weekmask):
+    """Return a 7-tuple of bools, Monday first, from ``'1111100'``, ``'Mon Tue ...'`` or 7 truthy values."""
+    if isinstance(weekmask, str):
+        if len(weekmask) == 7 and set(weekmask) <= {'0', '1'}:
+            return tuple(char == '1' for char in weekmask)
+        names = weekmask.split()
+        if not set(names) <= set(WEEKDAY_NAMES):
+            raise ValueError('Invalid weekmask %r' % (weekmask, ))
+        return tuple(name in names for name in WEEKDAY_NAMES)
+    weekmask = tuple(bool(day) for day in weekmask)
+    if len(weekmask) != 7:
+        raise ValueError('weekmask must have 7 days, got %d' % len(weekmask))
+    return weekmask
+
+
+class BusinessCalendar(object):
+    """Business days defined by a weekmask and a set of holidays.
+
+    Dates are handled as proleptic Gregorian ordinals; counting and offsetting
+    is done arithmetically over the weekmask, corrected with a bisect over
+    the sorted holiday ordinals. The semantics follow ``numpy.busday_count``
+    and ``numpy.busday_offset``: counts include ``start`` and exclude ``end``.
+    """
+
+    def __init__(self, weekmask='1111100', holidays=(), parse=None):
+        """
+        :param weekmask: business weekdays, Monday first: ``'1111100'``, ``'Mon Tue Wed Thu Fri'`` or 7 booleans
+        :param holidays: dates (or strings) which are never business days
+        :param parse: function turning strings into dates, ISO ``%Y-%m-%d`` by default
+        """
+        self.parse = parse or (lambda string: datetime.datetime.strptime(string, '%Y-%m-%d').date())
+        self.weekmask = _parse_weekmask(weekmask)
+        self.busdays_per_week = sum(self.weekmask)
+        if not self.busdays_per_week:
+            raise ValueError('weekmask must contain at least one business day')
+        # Weekdays of the business days, and number of business days in the first ``n`` days of a week starting on ``weekday``
+        self.__positions = [weekday for weekday in range(7) if self.weekmask[weekday]]
+        self.__partial = [[sum(self.weekmask[(weekday + i) % 7] for i in range(n)) for n in range(8)] for weekday in range(7)]
+        # Holidays falling on weekend days are irrelevant
+        ordinals = set(self.ordinal(holiday) for holiday in holidays)
+        self.holidays = array('i', sorted(ordinal for ordinal in ordinals if self.weekmask[(ordinal + 6) % 7]))
+        self.__np_holidays = None
+
+    def ordinal(self, value):
+        """Return the proleptic Gregorian ordinal of a date, datetime, string or ordinal."""
+        if isinstance(value, int):
+            return value
+        if isinstance(value, (str, bytes)):
+            date = self.parse(value)
+            if date is None:
+                raise ValueError('Invalid date %r' % (value, ))
+            value = date
+        return value.toordinal()
+
+    # ORDINAL ARITHMETIC
+
+    def _weekdays_before(self, ordinal):
+        # Business weekdays in [1, ordinal), ordinal 1 (0001-01-01) is a Monday
+        weeks, days = divmod(ordinal - 1, 7)
+        return weeks * self.busdays_per_week + self.__partial[0][days]
+
+    def _weekday_at(self, index):
+        # Ordinal of the business weekday with ``index`` business weekdays before it, inverse of ``_weekdays_before``
+        weeks, position = divmod(index, self.busdays_per_week)
+        return weeks * 7 + 1 + self.__positions[position]
+
+    def _busdays_before(self, ordinal):
+        return self._weekdays_before(ordinal) - bisect_left(self.holidays, ordinal)
+
+    def _busday_at(self, index):
+        # Fixed point iteration from below, the number of holidays skipped only grows
+        ordinal = self._weekday_at(index)
+        while True:
+            next_ordinal = self._weekday_at(index + bisect_right(self.holidays, ordinal))
+            if next_ordinal == ordinal:
+                return ordinal
+            ordinal = next_ordinal
+
+    def _is_busday(self, ordinal):
+        if not self.weekmask[(ordinal + 6) % 7]:
+            return False
+        index = bisect_left(self.holidays, ordinal)
+        return index == len(self.holidays) or self.holidays[index] != ordinal
+
+    # PUBLIC
+
+    def is_busday(self, value):
+        """Check whether the date is a business day"""
+        return self._is_busday(self.ordinal(value))
+
+    def busday_count(self, start, end):
+        """Return the number of business days in ``[start, end)``, or minus the number in ``(end, start]`` when ``end`` is before ``start``."""
+        return self._busday_count(self.ordinal(start), self.ordinal(end))
+
+    def _busday_count(self, start, end):
+        if end < start:
+            return self._busdays_before(end + 1) - self._busdays_before(start + 1)
+        return self._busdays_before(end) - self._busdays_before(start)
+
+    def busday_offset(self, value, offset=0, roll='raise'):
+        """Return the date ``offset`` business days after ``value``.
+
+        ``roll`` tells what to do first when ``value`` is not a business day:
+        ``'raise'``, ``'forward'``/``'following'``, ``'backward'``/``'preceding'``,
+        or ``'modifiedfollowing'``/``'modifiedpreceding'`` which roll the other way
+        when rolling would change the month.
+        """
+        if roll not in BUSDAY_ROLLS:
+            raise ValueError('roll must be one of %s, got %r' % (', '.join(BUSDAY_ROLLS), roll))
+        ordinal = self.ordinal(value)
+        # Index of the first business day on or after ``ordinal``
+        index = self._busdays_before(ordinal)
+        if not self._is_busday(ordinal):
+            if roll == 'raise':
+                raise ValueError('Non-business day date in busday_offset')
+            if roll in ('backward', 'preceding'):
+                index -= 1
+            elif roll in ('modifiedfollowing', 'modifiedpreceding'):
+                month = datetime.date.fromordinal(ordinal).month
+                forward = roll == 'modifiedfollowing'
+                if datetime.date.fromordinal(self._busday_at(index if forward else index - 1)).month == month:
+                    index = index if forward else index - 1
+                else:
+                    index = index - 1 if forward else index
+        return datetime.date.fromordinal(self._busday_at(index + offset))
+
+    def next_busday(self, value, n=1):
+        """Return the ``n``-th business day strictly after the date."""
+        return datetime.date.fromordinal(self._busday_at(self._busdays_before(self.ordinal(value) + 1) + n - 1))
+
+    def previous_busday(self, value, n=1):
+        """Return the ``n``-th business day strictly before the date."""
+        return datetime.date.fromordinal(self._busday_at(self._busdays_before(self.ordinal(value)) - n))
+
+    def busday_count_many(self, starts, ends):
+        """Return the business day counts of pairs of ``starts`` and ``ends``.
+
+        NumPy arrays of ordinals or ``datetime64`` are counted vectorized into an array,
+        other sequences give a list.
+        """
+        if np is not None and isinstance(starts, np.ndarray) and isinstance(ends, np.ndarray):
+            starts, ends = self._np_ordinals(starts), self._np_ordinals(ends)
+            # Reversed pairs count ``(end, start]``
+            reverse = ends < starts
+            return self._np_busdays_before(ends + reverse) - self._np_busdays_before(starts + reverse)
+        busday_count = self._busday_count
+        ordinal = self.ordinal
+        return [busday_count(ordinal(start), ordinal(end)) for start, end in zip(starts, ends)]
+
+    def _np_ordinals(self, ordinals):
+        if ordinals.dtype.kind == 'M':
+            # ``datetime64`` counts from 1970-01-01
+            return ordinals.astype('datetime64[D]').astype(np.int64) + datetime.date(1970, 1, 1).toordinal()
+        return ordinals.astype(np.int64, copy=False)
+
+    def _np_busdays_before(self, ordinals):
+        if self.__np_holidays is None:
+            self.__np_holidays = np.frombuffer(self.holidays, dtype=np.int32).astype(np.int64) if self.holidays else np.empty(0, dtype=np.int64)
+        weeks, days = np.divmod(ordinals - 1, 7)
+        partial = np.array(self.__partial[0], dtype=np.int64)
+        return weeks * self.busdays_per_week + partial[days] - np.searchsorted(self.__np_holidays, ordinals, side='left')
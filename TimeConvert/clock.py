@@ -0,0 +1,124 @@
+import abc
+import calendar
+import contextlib
+import datetime
+import threading
+import time
+
+
+try:
+    import contextvars
+except ImportError:  # pragma: no cover
+    contextvars = None
+
+
+class Clock(abc.ABC):
+    """Source of the current time, ``time()`` returns UTC epoch seconds as a float."""
+
+    @abc.abstractmethod
+    def time(self) -> float:
+        """Return the current UTC epoch seconds."""
+
+
+class RealClock(Clock):
+    """Reads the system clock on every call."""
+
+    def time(self) -> float:
+        return time.time()
+
+
+class CoarseClock(Clock):
+    """Cached time, refreshed every ``resolution`` seconds by a background thread.
+
+    Reading the time is an attribute access, at the cost of being up to
+    ``resolution`` seconds behind the system clock. The daemon thread starts
+    with the clock and is stopped by ``stop()`` or when leaving a ``with`` block.
+    """
+
+    def __init__(self, resolution: float = 0.01):
+        self.resolution = resolution
+        self.__now = time.time()
+        self.__stopped = threading.Event()
+        self.__thread = threading.Thread(target=self.__refresh, name='CoarseClock', daemon=True)
+        self.__thread.start()
+
+    def __refresh(self):
+        while not self.__stopped.wait(self.resolution):
+            self.__now = time.time()
+
+    def time(self) -> float:
+        return self.__now
+
+    def stop(self):
+        self.__stopped.set()
+        self.__thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+class FrozenClock(Clock):
+    """Clock which only moves when told to, for tests.
+
+    ``now`` is UTC epoch seconds or a datetime, naive datetimes are taken as UTC.
+    """
+
+    def __init__(self, now=0.0):
+        self.set(now)
+
+    def set(self, now):
+        if isinstance(now, datetime.datetime):
+            now = calendar.timegm(now.utctimetuple()) + now.microsecond / 1e6
+        self.now = float(now)
+
+    def advance(self, seconds: float = 0, **kwargs):
+        """Move the clock ``seconds`` forward, or by a timedelta built from ``kwargs`` (``minutes=5``)."""
+        self.now += seconds + datetime.timedelta(**kwargs).total_seconds()
+
+    tick = advance
+
+    def time(self) -> float:
+        return self.now
+
+
+ManualClock = FrozenClock
+
+REAL_CLOCK = RealClock()
+
+
+class _ThreadSnapshot(threading.local):
+    """Stand-in for the snapshot ContextVar before Python 3.7, per thread rather than per context."""
+    now = None
+
+    def get(self):
+        return self.now
+
+    def set(self, now):
+        token, self.now = self.now, now
+        return token
+
+    def reset(self, token):
+        self.now = token
+
+
+# Time captured by ``snapshot``, shared by every clock read in the same context
+_snapshot = contextvars.ContextVar('TimeConvert.clock.snapshot', default=None) if contextvars else _ThreadSnapshot()
+
+
+def clock_time(clock: Clock) -> float:
+    """Return the time of the current snapshot if any, else the time of ``clock``."""
+    now = _snapshot.get()
+    return clock.time() if now is None else now
+
+
+@contextlib.contextmanager
+def snapshot(clock: Clock = REAL_CLOCK):
+    """Read ``clock`` once, every "now" within the block (thread or task) returns that same time."""
+    token = _snapshot.set(clock.time())
+    try:
+        yield _snapshot.get()
+    finally:
+        _snapshot.reset(token)
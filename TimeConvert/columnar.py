@@ -0,0 +1,229 @@
+"""
+Columnar versions of the conversions of TimeConvertTools, for pandas Series and pyarrow arrays.
+
+    from TimeConvert import columnar
+
+    df['local'] = columnar.utc_string_to_local_datetime(df['ts'])
+    df['week'] = columnar.bucket(df['epoch'], 'week')
+
+Each function converts the whole column at once and matches the scalar method
+of the same name value for value; values the scalar method returns None for
+are null. pandas (and pyarrow for arrow columns) are imported on first use
+only: ``pip install TimeConvert[pandas]`` or ``TimeConvert[pyarrow]``.
+
+Columns are pandas Series, pyarrow Arrays or ChunkedArrays (returned as
+pyarrow Arrays), or any sequence (returned as Series).
+"""
+import numpy as np
+
+from .bucket import bucket_epochs
+from .iso8601 import parse as parse_iso8601
+
+
+def _pandas():
+    try:
+        import pandas as pd
+    except ImportError:  # pragma: no cover
+        raise ImportError('TimeConvert.columnar requires pandas, pip install TimeConvert[pandas]')
+    return pd
+
+
+def _converter(converter):
+    if converter is None:
+        from .convert import tc as converter
+    return converter
+
+
+def _series(column):
+    """Return the column as a Series, and whether it came from pyarrow."""
+    pd = _pandas()
+    if isinstance(column, pd.Series):
+        return column, False
+    if type(column).__module__.startswith('pyarrow'):
+        return column.to_pandas(), True
+    return pd.Series(column), False
+
+
+def _result(series, arrow):
+    if arrow:
+        import pyarrow as pa
+        return pa.Array.from_pandas(series)
+    return series
+
+
+def _parse(series, format, converter):
+    """Return the naive datetimes of a string Series, and the aware datetimes of its strings with an offset (None without any)."""
+    # ``string_to_datetime``: without a format, the format is chosen by the length of each string, ISO 8601 being the fallback
+    pd = _pandas()
+    if format:
+        return pd.to_datetime(series, format=format, errors='coerce'), None
+    lengths = series.str.len()
+    parsed = pd.Series(pd.NaT, index=series.index, dtype='datetime64[us]')
+    for length, length_format in converter.LEN_FORMAT.items():
+        mask = lengths == length
+        if mask.any():
+            parsed[mask] = pd.to_datetime(series[mask], format=length_format, errors='coerce')
+    rest = parsed.isna() & series.map(lambda value: isinstance(value, str)).astype(bool)
+    if not rest.any():
+        return parsed, None
+    # Row by row, for the strings left only
+    dts = series[rest].map(parse_iso8601)
+    naive = dts.map(lambda dt: dt is not None and dt.tzinfo is None).astype(bool)
+    if naive.any():
+        parsed[dts.index[naive]] = pd.to_datetime(dts[naive])
+    aware = dts[dts.map(lambda dt: dt is not None and dt.tzinfo is not None).astype(bool)]
+    return parsed, (aware if len(aware) else None)
+
+
+def _localize(series, timezone):
+    # ``dt.replace(tzinfo=...)``: ambiguous wall-clock times are the first occurrence (fold=0), non-existent ones are null
+    return series.dt.tz_localize(timezone, ambiguous=np.ones(len(series), dtype=bool), nonexistent='NaT')
+
+
+def _with_aware(localized, aware):
+    # Strings with an offset are instants, converted to the time zone of ``localized``
+    if aware is None:
+        return localized
+    localized = localized.copy()
+    localized[aware.index] = _pandas().to_datetime(aware, utc=True).dt.tz_convert(localized.dt.tz)
+    return localized
+
+
+def _epoch_seconds(series):
+    """Return the epoch seconds of a naive datetime Series as nullable integers, floored to the second."""
+    pd = _pandas()
+    return np.floor((series - pd.Timestamp(0)).dt.total_seconds()).astype('Int64')
+
+
+def _buckets(stamps, granularity, table):
+    """Return the bucket ids of epoch seconds as nullable integers."""
+    pd = _pandas()
+    mask = stamps.isna().to_numpy()
+    buckets = bucket_epochs(stamps.fillna(0).to_numpy(dtype=np.float64), granularity, table)
+    return pd.Series(buckets, index=stamps.index, dtype='Int64').mask(mask)
+
+
+# STRING ==> DATETIME
+
+def string_to_datetime(column, format=None, converter=None):
+    """Naive datetimes, as ``tc.string_to_datetime``."""
+    series, arrow = _series(column)
+    parsed, aware = _parse(series, format, _converter(converter))
+    if aware is not None:
+        # Aware datetimes of their own offsets along naive ones, an object column as pandas makes of mixed offsets
+        parsed = parsed.astype(object)
+        parsed[aware.index] = aware
+    return _result(parsed, arrow)
+
+
+def string_to_local_datetime(column, format=None, timezone=None, converter=None):
+    """Datetimes in ``timezone``, as ``tc.string_to_local_datetime``."""
+    converter = _converter(converter)
+    series, arrow = _series(column)
+    parsed, aware = _parse(series, format, converter)
+    return _result(_with_aware(_localize(parsed, converter.timezone(timezone)), aware), arrow)
+
+
+def string_to_utc_datetime(column, format=None, timezone=None, converter=None):
+    """UTC datetimes of wall-clock strings in ``timezone``, as ``tc.string_to_utc_datetime``."""
+    converter = _converter(converter)
+    series, arrow = _series(column)
+    parsed, aware = _parse(series, format, converter)
+    return _result(_with_aware(_localize(parsed, converter.timezone(timezone)).dt.tz_convert('UTC'), aware), arrow)
+
+
+def utc_string_to_local_datetime(column, format=None, timezone=None, converter=None):
+    """As ``tc.utc_string_to_local_datetime``, the offset of the system time zone is read once."""
+    converter = _converter(converter)
+    series, arrow = _series(column)
+    parsed, aware = _parse(series, format, converter)
+    return _result(_with_aware(_localize(parsed + converter.offset(), converter.timezone(timezone)), aware), arrow)
+
+
+def utc_string_to_utc_datetime(column, format=None, timezone=None, converter=None):
+    """As ``tc.utc_string_to_utc_datetime``, the offset of the system time zone is read once."""
+    converter = _converter(converter)
+    series, arrow = _series(column)
+    parsed, aware = _parse(series, format, converter)
+    return _result(_with_aware(_localize(parsed, converter.timezone(timezone)).dt.tz_convert('UTC') + converter.offset(), aware), arrow)
+
+
+# DATETIME ==> DATETIME
+
+def to_utc_datetime(column, timezone=None, converter=None):
+    """UTC datetimes, naive datetimes being wall-clock time in ``timezone``, as ``tc.normalize(dttype='utc')``."""
+    converter = _converter(converter)
+    series, arrow = _series(column)
+    if series.dt.tz is None:
+        series = _localize(series, converter.timezone(timezone))
+    return _result(series.dt.tz_convert('UTC'), arrow)
+
+
+def to_local_datetime(column, timezone=None, converter=None):
+    """Datetimes in ``timezone``, naive datetimes being wall-clock time there, as ``tc.normalize(dttype='local')``."""
+    converter = _converter(converter)
+    series, arrow = _series(column)
+    timezone = converter.timezone(timezone)
+    return _result(_localize(series, timezone) if series.dt.tz is None else series.dt.tz_convert(timezone), arrow)
+
+
+# DATETIME ==> STRING
+
+def datetime_to_string(column, format=None, converter=None):
+    """Strings, as ``tc.datetime_to_string``."""
+    series, arrow = _series(column)
+    return _result(series.dt.strftime(_converter(converter).format(format)), arrow)
+
+
+# TIMESTAMP
+
+def timestamp_to_local_datetime(column, converter=None):
+    """Naive datetimes in the system time zone of epoch seconds, as ``tc.timestamp_to_local_datetime``."""
+    pd = _pandas()
+    series, arrow = _series(column)
+    utc = pd.to_datetime(series, unit='s', utc=True)
+    return _result(utc.dt.tz_convert(_converter(converter).BASE_TIME_ZONE).dt.tz_localize(None), arrow)
+
+
+def datetime_to_timestamp(column, converter=None):
+    """Epoch seconds of the wall-clock time in the system time zone, as ``tc.datetime_to_timestamp``.
+
+    Like ``time.mktime``, aware datetimes contribute their wall-clock time only.
+    """
+    series, arrow = _series(column)
+    if series.dt.tz is not None:
+        series = series.dt.tz_localize(None)
+    local = _localize(series, _converter(converter).BASE_TIME_ZONE)
+    return _result(_epoch_seconds(local.dt.tz_convert('UTC').dt.tz_localize(None)), arrow)
+
+
+# BUCKET
+
+def bucket(column, granularity='day', timezone=None, format=None, converter=None):
+    """Day/week/month/quarter bucket ids, as ``tc.bucket``.
+
+    Numbers are UTC epoch seconds, aware datetimes are instants, both bucketed
+    in ``timezone``; naive datetimes and strings are wall-clock time.
+    """
+    pd = _pandas()
+    converter = _converter(converter)
+    series, arrow = _series(column)
+    aware = None
+    if series.dtype == object or pd.api.types.is_string_dtype(series.dtype):
+        series, aware = _parse(series, format, converter)
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        table = converter.zone_table(timezone)
+        stamps = series.astype('Float64')
+    elif series.dt.tz is not None:
+        table = converter.zone_table(timezone)
+        stamps = _epoch_seconds(series.dt.tz_convert('UTC').dt.tz_localize(None))
+    else:
+        # Wall-clock time, bucketed as is
+        table = converter.zone_table('UTC')
+        stamps = _epoch_seconds(series)
+    buckets = _buckets(stamps, granularity, table)
+    if aware is not None:
+        # Strings with an offset are instants, bucketed in ``timezone``
+        stamps = _epoch_seconds(pd.to_datetime(aware, utc=True).dt.tz_localize(None))
+        buckets[aware.index] = _buckets(stamps, granularity, converter.zone_table(timezone))
+    return _result(buckets, arrow)
@@ -1,22 +1,58 @@
 import calendar
 import datetime
 import time
-from typing import Any, Callable, Dict, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar, Union
 
 import tzlocal
 from dateutil.relativedelta import relativedelta
-from dateutil.tz import tz
 
+from .bucket import bucket_epochs, bucket_values, decode_bucket, decode_buckets
+from .buffer import parse as parse_buffer
+from .buffer import parse_many as parse_buffer_many
+from .busday import BusinessCalendar
+from .clock import REAL_CLOCK, Clock, clock_time, snapshot
+from .delta import Delta
+from .epoch import convert as convert_epoch
+from .epoch import from_datetime as epoch_from_datetime
+from .epoch import from_datetimes as epoch_from_datetimes
+from .epoch import to_datetime as epoch_to_datetime
+from .epoch import to_datetimes as epoch_to_datetimes
+from .epochfile import WINDOW, convert_file
+from .fanout import FanOut
+from .httpdate import format_http_date, format_rfc2822, parse_http_date, parse_rfc2822
+from .interval import TimeRangeIndex
+from .iso8601 import parse as parse_iso8601
 from .isoweek import ISOWeek
+from .merge import Stream, StreamMerge
 from .month import Month
-from .quarter import Quarter
+from .normalize import Normalizer
+from .plan import Plan
+from .quarter import FiscalQuarter, Quarter
+from .ranges import ARRAY_RETURN_TYPES, DateRange, MonthRange, PeriodRange, QuarterRange, WeekRange
+from .sniff import SAMPLE_SIZE, Layout, StreamParser, sniff
+from .tzbackend import TZBackend, get_backend
 from .week import Week
+from .zonestore import ZoneStore
+from .zonestore import attach_shared_memory as attach_zone_shared_memory
+from .zonestore import create_shared_memory as create_zone_shared_memory
+from .zonestore import open_file as open_zone_file
+from .zonestore import write_file as write_zone_file
+from .zonetable import ZoneTable, get_zone_table
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
 
 
 T = TypeVar('T')
 TimeAnyT = Union[datetime.datetime, datetime.date, str, bytes]
 TimeAnyNT = Union[datetime.datetime, datetime.date, str, bytes, None]
 
+# Values ``delta_many`` takes as a single value rather than a sequence
+DELTA_SCALAR_TYPES = (int, float, datetime.date, str, bytes)
+
 
 class TimeConvertTools(object):
     def __get_base_time_zone(self):
@@ -27,7 +63,15 @@ class TimeConvertTools(object):
             tz_localzone = tz_localzone.unwrap_shim()
         return tz_localzone.key if hasattr(tz_localzone, 'key') else tz_localzone.zone
 
-    def __init__(self, timezone: Optional[str] = None, format: Optional[str] = None):
+    def __init__(self, timezone: Optional[str] = None, format: Optional[str] = None, clock: Optional[Clock] = None, tz_backend: Union[str, TZBackend, None] = None):
+        # Source of "now", see ``TimeConvert.clock``
+        self.clock = clock or REAL_CLOCK
+        # Resolution of time zone names, ``$TIMECONVERT_TZ_BACKEND`` or dateutil by default, see ``TimeConvert.tzbackend``
+        self.tz_backend = get_backend(tz_backend)
+        # Normalizer of each time zone, see ``normalizer``
+        self.__normalizers = {}
+        # FanOut of each (time zones, output, format), see ``fan_out``
+        self.__fan_outs = {}
         self.BASE_TIME_ZONE = self.__get_base_time_zone()
         self.DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
         self.DATETIME_ISOFORMAT = '%Y-%m-%dT%H:%M:%S.%f'
@@ -60,6 +104,11 @@ class TimeConvertTools(object):
             10: self.DATE_FORMAT,
         }
         self.TIME_ZONE = timezone or self.BASE_TIME_ZONE
+        if self.tz_backend.strict and self.tz_backend.gettz(self.TIME_ZONE) is None:
+            if timezone:
+                raise ValueError('Time zone %r is unknown to the %s time zone backend' % (self.TIME_ZONE, self.tz_backend.name))
+            # The zone of the host, a name the fixed backend does not know, must not fail ``import TimeConvert``
+            self.TIME_ZONE = 'UTC'
         self.TIME_FORMAT = format or self.DATETIME_FORMAT
         self.TIME_ISOFORMAT = format or self.DATETIME_ISOFORMAT
         self.SECOND_MILLISECOND = 10 ** 3
@@ -88,7 +137,14 @@ class TimeConvertTools(object):
         # tzname = self.timezone(timezone)
         # tzinfo = tz.gettz(tzname)
         # return tzinfo
-        return tz.gettz(tzname or self.timezone(timezone))
+        return self.tz_backend.gettz(tzname or self.timezone(timezone))
+
+    def normalizer(self, timezone: Optional[str] = None) -> Normalizer:
+        tzname = self.timezone(timezone)
+        normalizer = self.__normalizers.get(tzname)
+        if normalizer is None:
+            normalizer = self.__normalizers[tzname] = Normalizer(tzname, self.tzinfo(tzname=tzname), self.tz_backend)
+        return normalizer
 
     # PRIVATE
 
@@ -108,13 +164,32 @@ class TimeConvertTools(object):
         return dt if ms else self.remove_microsecond(dt)
 
     def __seconds_to_other(self, s: int, base: int = 0) -> int:
-        return int(s * (base or self.SECOND_MICROSECOND))
+        base = base or self.SECOND_MICROSECOND
+        # Integers exactly, floats keep their historical truncation
+        return s * base if isinstance(s, int) else int(s * base)
+
+    # CLOCK
+
+    def clock_time(self) -> float:
+        """
+        Return the current UTC epoch seconds, as read from ``self.clock`` or from the enclosing ``snapshot``.
+        """
+        return clock_time(self.clock)
+
+    def snapshot(self):
+        """
+        Context manager reading the clock once, every "now" within the block is that same time.
+
+            with tc.snapshot():
+                tc.utc_datetime() == tc.utc_datetime()
+        """
+        return snapshot(self.clock)
 
     # OFFSET
 
     def offset(self) -> int:
-        now_timestamp = time.time()
-        return datetime.datetime.fromtimestamp(now_timestamp) - datetime.datetime.utcfromtimestamp(now_timestamp)
+        now_timestamp = clock_time(self.clock)
+        return datetime.datetime.fromtimestamp(now_timestamp) - datetime.datetime.fromtimestamp(now_timestamp, datetime.timezone.utc).replace(tzinfo=None)
 
     # VALIDATE
 
@@ -135,7 +210,7 @@ class TimeConvertTools(object):
     # BASIC DATETIME
 
     def basic_utc_datetime(self, ms: bool = True) -> datetime.datetime:
-        return self.__remove_ms_or_not(datetime.datetime.utcnow().replace(tzinfo=tz.UTC), ms=ms)
+        return self.__remove_ms_or_not(datetime.datetime.fromtimestamp(clock_time(self.clock), datetime.timezone.utc).replace(tzinfo=self.tz_backend.utc), ms=ms)
 
     def basic_local_datetime(self, ms: bool = True, timezone: Optional[str] = None) -> datetime.datetime:
         # In[1]: import time
@@ -154,7 +229,7 @@ class TimeConvertTools(object):
         return self.__remove_ms_or_not(self.__to_local_datetime(self.basic_utc_datetime(), self.timezone(timezone)), ms=ms)
 
     def is_utc_datetime(self, dt: datetime.datetime) -> bool:
-        return dt.tzinfo == tz.UTC
+        return self.tz_backend.is_utc(dt.tzinfo)
 
     def is_local_datetime(self, dt: datetime.datetime, local_tz: Optional[str] = None) -> bool:
         """
@@ -176,31 +251,45 @@ class TimeConvertTools(object):
         # In [4]: str(pytz.timezone('Asia/Shanghai')) == str(tc.local_datetime().tzinfo)
         # Out[4]: True
 
-        return str(dt.tzinfo) == str(None if local_tz == -1 else tz.gettz(self.timezone(local_tz)))
+        return str(dt.tzinfo) == str(None if local_tz == -1 else self.tzinfo(local_tz))
 
     def date_to_datetime(self, dt: datetime.date) -> datetime.datetime:
         return datetime.datetime(dt.year, dt.month, dt.day)
 
     def __to_utc_datetime(self, dt: datetime.datetime, timezone: Optional[str] = None) -> datetime.datetime:
-        if self.is_utc_datetime(dt):
-            return dt
-        try:
-            dt = self.make_naive(dt)
-        except ValueError:
-            pass
-        tzinfo = self.tzinfo(timezone)
-        local_dt = dt.replace(tzinfo=tzinfo)
-        return local_dt.astimezone(tz.UTC)
+        return self.normalizer(timezone).to_utc(dt)
 
     def __to_local_datetime(self, dt: datetime.datetime, timezone: Optional[str] = None) -> datetime.datetime:
-        tzname = self.timezone(timezone)
-        tzinfo = self.tzinfo(tzname=tzname)
-        if not dt.tzinfo:
-            return dt.replace(tzinfo=tzinfo)
-        if self.is_local_datetime(dt, local_tz=tzname):
-            return dt
-        utc_dt = dt.replace(tzinfo=tz.UTC)
-        return utc_dt.astimezone(tzinfo)
+        return self.normalizer(timezone).to_local(dt)
+
+    def normalize(self, value: TimeAnyT, dttype: str = 'utc', timezone: Optional[str] = None, format: Optional[str] = None) -> Optional[datetime.datetime]:
+        """
+        Return ``value`` as an aware datetime, in UTC for ``dttype`` ``'utc'``, in ``timezone`` for ``'local'``.
+
+        Naive datetimes, dates and strings are wall-clock time in ``timezone``. Other values give None.
+        """
+        return self.normalize_many((value, ), dttype=dttype, timezone=timezone, format=format)[0]
+
+    def normalize_many(self, values: Iterable[TimeAnyT], dttype: str = 'utc', timezone: Optional[str] = None, format: Optional[str] = None) -> List[Optional[datetime.datetime]]:
+        """
+        ``normalize`` every value of a mixed sequence, the time zone is resolved once for all of them.
+        """
+        if dttype not in ('utc', 'local'):
+            raise ValueError("dttype must be 'utc' or 'local', got %r" % (dttype, ))
+        normalizer = self.normalizer(timezone)
+        convert = normalizer.to_utc if dttype == 'utc' else normalizer.to_local
+        dts = []
+        for value in values:
+            if isinstance(value, datetime.datetime):
+                dts.append(convert(value))
+            elif isinstance(value, datetime.date):
+                dts.append(convert(self.date_to_datetime(value)))
+            elif isinstance(value, (str, bytes)):
+                dt = self.string_to_datetime(value, format)
+                dts.append(dt and convert(dt))
+            else:
+                dts.append(None)
+        return dts
 
     def to_datetime(self, value: TimeAnyT, timezone: Optional[str] = None, format: Optional[str] = None, idx: int = 0, years: int = 0, months: int = 0, days: int = 0, seconds: int = 0, microseconds: int = 0, milliseconds: int = 0, minutes: int = 0, hours: int = 0, weeks: int = 0, dttype: Optional[str] = None) -> Optional[datetime.date]:
         if isinstance(value, datetime.datetime):
@@ -209,6 +298,8 @@ class TimeConvertTools(object):
             dt = self.date_to_datetime(value)
         elif isinstance(value, (str, bytes)):
             dt = self.string_to_datetime(value, format)
+            if dt is None:
+                return None
         else:
             return None
         if dttype == 'utc':
@@ -351,6 +442,146 @@ class TimeConvertTools(object):
     def isoweekdelta(self, value1: TimeAnyT, value2: TimeAnyT) -> int:
         return self.to_isoweek(value1) - self.to_isoweek(value2)
 
+    # BUCKET
+
+    def zone_table(self, timezone: Optional[str] = None) -> ZoneTable:
+        return get_zone_table(self.timezone(timezone), backend=self.tz_backend)
+
+    def bucket(self, values: Iterable[Union[int, float, TimeAnyT]], granularity: str = 'day', timezone: Optional[str] = None, format: Optional[str] = None) -> Union[List[Optional[int]], Any]:
+        """
+        Assign each value to its day/week/month/quarter bucket in ``timezone``.
+
+        Returns integer bucket ids, see ``decode_buckets`` for the way back to
+        ``datetime.date``/``ISOWeek``/``Month``/``Quarter``.
+        Numbers are UTC epoch seconds, aware datetimes are converted to ``timezone``,
+        naive datetimes, dates and strings are taken as wall-clock time.
+        NumPy arrays of numbers or ``datetime64`` are bucketed vectorized into an array.
+        """
+        table = self.zone_table(timezone)
+        if np is not None:
+            if isinstance(values, np.ndarray) and values.dtype.kind in 'iufM':
+                return bucket_epochs(values, granularity, table)
+            values = values if isinstance(values, (list, tuple)) else list(values)
+            if values and all(type(value) in (int, float) for value in values):
+                return bucket_epochs(values, granularity, table).tolist()
+        return bucket_values(values, granularity, table, lambda value: self.string_to_datetime(value, format))
+
+    def decode_bucket(self, bucket: int, granularity: str = 'day') -> Union[datetime.date, ISOWeek, Month, Quarter]:
+        return decode_bucket(bucket, granularity)
+
+    def decode_buckets(self, buckets: Iterable[Optional[int]], granularity: str = 'day') -> List[Union[datetime.date, ISOWeek, Month, Quarter, None]]:
+        return decode_buckets(buckets, granularity)
+
+    # PLAN
+
+    def compile(self, input: str = 'str', input_format: Optional[str] = None, input_timezone: Optional[str] = None, to: str = 'local', timezone: Optional[str] = None, shift: Optional[dict] = None, output: str = 'datetime', output_format: Optional[str] = None) -> Plan:
+        """
+        Compile a conversion into a callable, ``plan(value)`` or ``plan.map(values)``.
+
+        ``input`` is ``str`` (parsed with ``input_format``, ``'auto'`` to sniff it), ``datetime``, ``date`` or
+        ``timestamp``/``timestamp_ms``/``timestamp_us``/``timestamp_ns`` (UTC epochs); naive
+        values are wall-clock time in ``input_timezone``, ``timezone`` by default.
+        Values are brought to ``to`` (``local``, i.e. ``timezone``, or ``utc``), shifted by
+        ``shift`` (``{'days': 1}``, keys of ``utc_datetime``) and returned as ``output``:
+        ``datetime``, ``naive``, ``date``, ``string``/``isostring`` (with ``output_format``),
+        ``timestamp``/``timestamp_ms``/``timestamp_us``/``timestamp_ns`` (integer UTC epochs),
+        ``isoweek``, ``month`` or ``quarter``.
+        """
+        return Plan(self, input=input, input_format=input_format, input_timezone=input_timezone, to=to, timezone=timezone, shift=shift, output=output, output_format=output_format)
+
+    # EPOCH FILE
+
+    def convert_epoch_file(self, path: str, conversion: str, out: Optional[str] = None, timezone: Optional[str] = None, unit: str = 'us', to_unit: Optional[str] = None, window: int = WINDOW) -> int:
+        """
+        Convert a file of little-endian int64 epochs, memory-mapped, in place or into ``out``.
+
+        ``conversion`` is ``to_local``/``to_utc`` (shift between UTC and wall-clock
+        epochs in ``timezone``), ``to_unit`` (``s``/``ms``/``us``/``ns``) or ``day``/``week``/
+        ``month``/``quarter`` (bucket ids in ``timezone``), ``window`` values at a time.
+        """
+        return convert_file(path, conversion, table=self.zone_table(timezone), out=out, unit=unit, to_unit=to_unit, window=window)
+
+    # ZONE STORE
+
+    def share_zone_tables(self, timezones: Optional[Iterable[str]] = None, path: Optional[str] = None, name: Optional[str] = None) -> Optional[ZoneStore]:
+        """
+        Compile ``timezones``, the default time zone by default, into a zone store for worker processes to attach to.
+        Written at ``path`` when given (returns None), in new shared memory named ``name`` otherwise, to ``unlink()`` once done.
+        """
+        timezones = list(timezones or (self.TIME_ZONE, ))
+        if path:
+            return write_zone_file(path, timezones, self.tz_backend)
+        return create_zone_shared_memory(timezones, name, self.tz_backend)
+
+    def attach_zone_tables(self, path: Optional[str] = None, name: Optional[str] = None) -> ZoneStore:
+        """
+        Attach read-only to the zone store at ``path`` or in the shared memory ``name``, and answer ``zone_table`` from it.
+        ``TimeConvertTools(tz_backend=store.backend())`` gives tzinfos over it too.
+        """
+        store = open_zone_file(path) if path else attach_zone_shared_memory(name)
+        store.install(self.tz_backend)
+        return store
+
+    # FAN OUT
+
+    def __utc_epoch_us(self, value: Union[int, float, TimeAnyNT], table: ZoneTable, format: Optional[str] = None) -> Optional[int]:
+        # UTC epoch microseconds of an instant, exactly: now, numbers, aware datetimes, or wall-clock values in ``table``
+        if value is None:
+            value = clock_time(self.clock)
+        if isinstance(value, (int, float)):
+            return self.__seconds_to_other(value)
+        if isinstance(value, (str, bytes, bytearray, memoryview)):
+            value = self.string_to_datetime(value, format)
+            if value is None:
+                return None
+        if not isinstance(value, datetime.datetime):
+            return table.utc_stamp(calendar.timegm(value.timetuple())) * self.SECOND_MICROSECOND
+        if value.tzinfo is not None and value.utcoffset() is not None:
+            return epoch_from_datetime(value, 'us')
+        return table.utc_stamp(calendar.timegm(value.timetuple()), fold=value.fold) * self.SECOND_MICROSECOND + value.microsecond
+
+    def __fan_out(self, timezones: Iterable[str], output: str, format: Optional[str]) -> FanOut:
+        timezones = tuple(timezones)
+        format = self.format(format) if output == 'string' else None
+        key = timezones, output, format
+        fan_out = self.__fan_outs.get(key)
+        if fan_out is None:
+            if len(self.__fan_outs) >= 64:
+                self.__fan_outs.clear()
+            fan_out = self.__fan_outs[key] = FanOut([(timezone, self.zone_table(timezone), self.tzinfo(timezone)) for timezone in timezones], output=output, format=format)
+        return fan_out
+
+    def fan_out(self, value: Union[int, float, TimeAnyNT], timezones: Iterable[str], output: str = 'string', format: Optional[str] = None, input_timezone: Optional[str] = None) -> Dict[str, Any]:
+        """
+        ``value`` in each of ``timezones``, normalized once: ``{timezone: value}``, offsets from the cached zone tables.
+
+        ``value`` is now when None, numbers are UTC epoch seconds, aware datetimes are instants,
+        naive datetimes, dates and strings are wall-clock time in ``input_timezone``.
+        ``output`` is ``string`` (``format``), ``isostring``, ``datetime`` (aware), ``naive`` or ``offset`` (seconds).
+        """
+        fan_out = self.__fan_out(timezones, output, format)
+        return fan_out(self.__utc_epoch_us(value, self.zone_table(input_timezone)))
+
+    def fan_out_many(self, values: Iterable[Union[int, float, TimeAnyNT]], timezones: Iterable[str], output: str = 'string', format: Optional[str] = None, input_timezone: Optional[str] = None) -> Dict[str, List[Any]]:
+        """
+        ``fan_out`` of a batch of instants: ``{timezone: [value, ...]}``, None for None and unparsable values.
+        Zones at the same offsets over the batch share their rendering.
+        """
+        fan_out = self.__fan_out(timezones, output, format)
+        table = self.zone_table(input_timezone)
+        return fan_out.map([None if value is None else self.__utc_epoch_us(value, table) for value in values])
+
+    # MERGE
+
+    def merge_streams(self, streams: Iterable[Union[Stream, Iterable[Any]]], lateness: Union[int, float] = 0, late: str = 'raise', unit: str = 'us') -> StreamMerge:
+        """
+        Merge event streams into one time-ordered iterable of ``(stamp, record)``, ``stamp`` in UTC epoch ``unit``, through a heap.
+
+        Each ``Stream`` gives the key function, zone and format of its records, plain iterables are strings in the default zone and format.
+        Streams may be out of order by up to ``lateness`` seconds; later records are handled by ``late``: ``raise``, ``drop`` or ``emit``.
+        """
+        return StreamMerge(streams, lateness=lateness, late=late, unit=unit, converter=self)
+
     # STRING
 
     # DATETIME_STRING
@@ -454,18 +685,19 @@ class TimeConvertTools(object):
 
     # TIMESTAMP
 
-    def __micro_or_milli(self, s, micro: bool = False, milli: bool = False) -> int:
+    def __timestamp(self, dt: datetime.datetime, ms: bool = False, micro: bool = False, milli: bool = False) -> Union[int, float]:
+        # Integer microseconds/milliseconds, ``mktime`` seconds plus the sub-second part of ``dt`` when ``ms``
         if micro:
-            return self.seconds_to_microseconds(s)
+            return self.structime_to_timestamp(dt.timetuple()) * self.SECOND_MICROSECOND + (dt.microsecond if ms else 0)
         if milli:
-            return self.seconds_to_milliseconds(s)
-        return s
+            return self.structime_to_timestamp(dt.timetuple()) * self.SECOND_MILLISECOND + (dt.microsecond // 1000 if ms else 0)
+        return self.datetime_to_timestamp(dt, ms=ms)
 
     def utc_timestamp(self, utc_dt: Optional[datetime.datetime] = None, ms: bool = False, micro: bool = False, milli: bool = False, timezone: Optional[str] = None, years: int = 0, months: int = 0, days: int = 0, seconds: int = 0, microseconds: int = 0, milliseconds: int = 0, minutes: int = 0, hours: int = 0, weeks: int = 0) -> int:
-        return self.__micro_or_milli(self.datetime_to_timestamp(self.__utc_datetime(utc_dt, timezone=timezone, years=years, months=months, days=days, seconds=seconds, microseconds=microseconds, milliseconds=milliseconds, minutes=minutes, hours=hours, weeks=weeks), ms=ms), micro=micro, milli=milli)
+        return self.__timestamp(self.__utc_datetime(utc_dt, timezone=timezone, years=years, months=months, days=days, seconds=seconds, microseconds=microseconds, milliseconds=milliseconds, minutes=minutes, hours=hours, weeks=weeks), ms=ms, micro=micro, milli=milli)
 
     def local_timestamp(self, local_dt: Optional[datetime.datetime] = None, ms: bool = False, micro: bool = False, milli: bool = False, timezone: Optional[str] = None, years: int = 0, months: int = 0, days: int = 0, seconds: int = 0, microseconds: int = 0, milliseconds: int = 0, minutes: int = 0, hours: int = 0, weeks: int = 0) -> int:
-        return self.__micro_or_milli(self.datetime_to_timestamp(self.__local_datetime(local_dt, timezone=timezone, years=years, months=months, days=days, seconds=seconds, microseconds=microseconds, milliseconds=milliseconds, minutes=minutes, hours=hours, weeks=weeks), ms=ms), micro=micro, milli=milli)
+        return self.__timestamp(self.__local_datetime(local_dt, timezone=timezone, years=years, months=months, days=days, seconds=seconds, microseconds=microseconds, milliseconds=milliseconds, minutes=minutes, hours=hours, weeks=weeks), ms=ms, micro=micro, milli=milli)
 
     def datetime_to_timestamp(self, dt: Union[datetime.datetime, datetime.date], ms: bool = False) -> int:
         # http://stackoverflow.com/questions/26161156/python-converting-string-to-timestamp-with-microseconds
@@ -489,86 +721,204 @@ class TimeConvertTools(object):
     def seconds_to_milliseconds(self, s: int) -> int:
         return self.__seconds_to_other(s, base=self.SECOND_MILLISECOND)
 
+    # EPOCH
+
+    def datetime_to_epoch(self, dt: datetime.datetime, unit: str = 's') -> int:
+        """
+        Integer epoch of ``dt`` in ``unit`` (``s``/``ms``/``us``/``ns``), naive datetimes being UTC.
+        Unlike ``datetime_to_timestamp``, no ``mktime`` and no float: exact to the microsecond.
+        """
+        return epoch_from_datetime(dt, unit)
+
+    def epoch_to_datetime(self, stamp: int, unit: str = 's', timezone: Optional[str] = None) -> datetime.datetime:
+        """Datetime of the integer epoch ``stamp`` in ``unit``, naive UTC, or aware in ``timezone`` when given."""
+        return epoch_to_datetime(stamp, unit, self.tzinfo(timezone) if timezone else None)
+
+    def epoch_convert(self, stamp: Any, unit: str = 's', to_unit: str = 'ms') -> Any:
+        """Integer epoch, or int64 array of epochs, in ``unit`` converted to ``to_unit``, rounded down."""
+        return convert_epoch(stamp, unit, to_unit)
+
+    def datetimes_to_epochs(self, values: Iterable[datetime.datetime], unit: str = 's') -> Union[List[int], Any]:
+        """Integer epochs of datetimes or of a ``datetime64`` array, an int64 array when NumPy is installed."""
+        return epoch_from_datetimes(values, unit)
+
+    def epochs_to_datetimes(self, stamps: Iterable[int], unit: str = 's', timezone: Optional[str] = None) -> List[datetime.datetime]:
+        return epoch_to_datetimes(stamps, unit, self.tzinfo(timezone) if timezone else None)
+
+    # HTTP DATE
+
+    def http_date(self, stamp: Optional[Union[int, float]] = None) -> str:
+        """
+        RFC 7231 date of the UTC epoch seconds ``stamp``, now by default: ``Fri, 08 Dec 2017 07:27:00 GMT``.
+        For ``Date``/``Last-Modified``/``Expires`` headers, rendered once per second.
+        """
+        return format_http_date(clock_time(self.clock) if stamp is None else stamp)
+
+    def http_date_to_timestamp(self, string: str) -> Optional[int]:
+        return parse_http_date(string)
+
+    def rfc2822_date(self, stamp: Optional[Union[int, float]] = None, timezone: Optional[str] = None) -> str:
+        """RFC 2822 date of the UTC epoch seconds ``stamp``, now by default, at the offset of ``timezone``, UTC by default."""
+        stamp = clock_time(self.clock) if stamp is None else stamp
+        return format_rfc2822(stamp, self.zone_table(timezone).utcoffset(stamp) if timezone else 0)
+
+    def rfc2822_to_timestamp(self, string: str) -> Optional[int]:
+        return parse_rfc2822(string)
+
+    # BUFFER
+
+    def buffer_to_datetime(self, buffer: Union[bytes, bytearray, memoryview], offset: int = 0, length: Optional[int] = None, format: Optional[str] = None) -> Optional[datetime.datetime]:
+        """
+        Naive datetime of the ``length`` bytes at ``offset`` of a bytes, bytearray or memoryview ``buffer``, read in place.
+        ``format`` defaults to the one of ``length`` in ``LEN_FORMAT``; formats with other directives than digits, and buffers of no format, are decoded.
+        """
+        format = format or self.LEN_FORMAT.get(len(buffer) - offset if length is None else length)
+        if format is not None:
+            try:
+                return parse_buffer(buffer, offset, length, format)
+            except ValueError:
+                # Directives other than fixed-width digits
+                pass
+        try:
+            string = bytes(memoryview(buffer).cast('B')[offset:None if length is None else offset + length]).decode('ascii')
+        except ValueError:
+            return None
+        return self.string_to_datetime(string, format)
+
+    def buffer_to_datetimes(self, buffer: Union[bytes, bytearray, memoryview], stride: Optional[int] = None, offset: int = 0, count: Optional[int] = None, format: Optional[str] = None, out: Any = None) -> Any:
+        """
+        Naive datetimes of the fixed-width records of ``buffer``, record ``i`` at ``offset + i * stride``, without a str per record.
+        A ``datetime64`` array with NaT for invalid records, a list of datetimes and ``None`` without numpy.
+        """
+        return parse_buffer_many(buffer, stride, offset, count, self.format(format), out)
+
+    # SNIFF
+
+    def sniff_format(self, values: Iterable[str], sample: int = SAMPLE_SIZE) -> Optional[Layout]:
+        """
+        Layout of a column of strings, inferred from its first ``sample`` values.
+
+        The catalogue covers ``%Y-%m-%d %H:%M:%S``, ``%Y-%m-%d``, ISO 8601 (``T`` or space,
+        fractional seconds, ``Z``/``±HH:MM``), ``%Y%m%d%H%M%S``, ``%Y%m%d``, slashes and
+        epoch s/ms/us; ``layout.format`` is the ``strptime`` format when there is one.
+        """
+        return sniff(values, sample=sample)
+
+    def stream_parser(self, sample: int = SAMPLE_SIZE, layout: Optional[Layout] = None) -> StreamParser:
+        return StreamParser(sample=sample, layout=layout)
+
+    def parse_many(self, values: Iterable[str], sample: int = SAMPLE_SIZE) -> List[Optional[datetime.datetime]]:
+        """
+        Datetimes of a column of strings, parsed with the layout sniffed from its head.
+
+        Wall-clock layouts give naive datetimes, offsets and epochs aware ones;
+        values matching no layout give ``None``.
+        """
+        return StreamParser(sample=sample).parse_many(values)
+
     # STRING ==> DATE
 
     def string_to_date(self, string: str, format: Optional[str] = None) -> Optional[datetime.date]:
-        format = self.value_format(string, format)
-        if not self.validate_string(string, format):
-            return None
-        return self.string_to_datetime(string, format).date()
+        dt = self.string_to_datetime(string, format)
+        return dt and dt.date()
 
     def string_to_utc_date(self, string: str, format: Optional[str] = None) -> Optional[datetime.date]:
-        format = self.value_format(string, format)
-        if not self.validate_string(string, format):
-            return None
-        return self.string_to_utc_datetime(string, format).date()
+        dt = self.string_to_utc_datetime(string, format)
+        return dt and dt.date()
 
     def string_to_local_date(self, string: str, format: Optional[str] = None) -> Optional[datetime.date]:
-        format = self.value_format(string, format)
-        if not self.validate_string(string, format):
-            return None
-        return self.string_to_local_datetime(string, format).date()
+        dt = self.string_to_local_datetime(string, format)
+        return dt and dt.date()
 
     def utc_string_to_utc_date(self, utc_string: str, format: Optional[str] = None) -> Optional[datetime.date]:
-        format = self.value_format(utc_string, format)
-        if not self.validate_string(utc_string, format):
-            return None
-        return self.utc_string_to_utc_datetime(utc_string, format).date()
+        dt = self.utc_string_to_utc_datetime(utc_string, format)
+        return dt and dt.date()
 
     def utc_string_to_local_date(self, utc_string: str, format: Optional[str] = None) -> Optional[datetime.date]:
-        format = self.value_format(utc_string, format)
-        if not self.validate_string(utc_string, format):
-            return None
-        return self.utc_string_to_local_datetime(utc_string, format).date()
+        dt = self.utc_string_to_local_datetime(utc_string, format)
+        return dt and dt.date()
 
     # STRING ==> DATETIME
 
     def string_to_datetime(self, string: str, format: Optional[str] = None) -> Optional[datetime.datetime]:
-        format = self.value_format(string, format)
-        if not self.validate_string(string, format):
+        if isinstance(string, (bytes, bytearray, memoryview)):
+            return self.buffer_to_datetime(string, format=format)
+        length_format = self.value_format(string, format)
+        if length_format is None and isinstance(string, str):
+            # No format for its length, ISO 8601 strings with ``T``, fractions or offsets (aware then)
+            dt = parse_iso8601(string)
+            if dt is not None:
+                return dt
+        if not self.validate_string(string, length_format):
+            # ISO 8601 strings of the length of a default format, ``2017-12-08T15:27:00`` or ``2024-W05-3``
+            if format is None and length_format is not None and isinstance(string, str):
+                return parse_iso8601(string)
             return None
-        return datetime.datetime.strptime(string, format)
+        return datetime.datetime.strptime(string, self.format(length_format))
 
     def string_to_utc_datetime(self, string: str, format: Optional[str] = None) -> Optional[datetime.datetime]:
-        format = self.value_format(string, format)
-        if not self.validate_string(string, format):
+        dt = self.string_to_datetime(string, format)
+        if dt is None:
             return None
-        return self.__to_utc_datetime(self.string_to_datetime(string, format))
+        return self.__to_utc_datetime(dt)
 
     def string_to_local_datetime(self, string: str, format: Optional[str] = None) -> Optional[datetime.datetime]:
-        format = self.value_format(string, format)
-        if not self.validate_string(string, format):
+        dt = self.string_to_datetime(string, format)
+        if dt is None:
             return None
-        return self.__to_local_datetime(self.string_to_datetime(string, format))
+        return self.__to_local_datetime(dt)
+
+    def isostring_to_datetime(self, string: str, dttype: Optional[str] = None, timezone: Optional[str] = None) -> Optional[datetime.datetime]:
+        """
+        Datetime of an ISO 8601 / RFC 3339 string: calendar, week or ordinal date, ``T`` time with
+        any fraction and ``Z``/``±HH:MM``/``±HHMM`` offset. Offsets give aware datetimes with shared
+        fixed-offset tzinfos; ``dttype`` ``utc``/``local`` converts, naive values being wall-clock time in ``timezone``.
+        """
+        dt = parse_iso8601(string)
+        if dt is None or dttype is None:
+            return dt
+        return self.__to_utc_datetime(dt, timezone=timezone) if dttype == 'utc' else self.__to_local_datetime(dt, timezone=timezone)
 
     def utc_string_to_utc_datetime(self, utc_string: str, format: Optional[str] = None) -> Optional[datetime.datetime]:
-        format = self.value_format(utc_string, format)
-        if not self.validate_string(utc_string, format):
+        dt = self.string_to_datetime(utc_string, format)
+        if dt is None:
             return None
-        return self.__to_utc_datetime(self.string_to_datetime(utc_string, format)) + self.offset()
+        # Strings with an offset are instants already
+        if dt.tzinfo is not None:
+            return self.__to_utc_datetime(dt)
+        return self.__to_utc_datetime(dt) + self.offset()
 
     def utc_string_to_local_datetime(self, utc_string: str, format: Optional[str] = None) -> Optional[datetime.datetime]:
-        format = self.value_format(utc_string, format)
-        if not self.validate_string(utc_string, format):
+        dt = self.string_to_datetime(utc_string, format)
+        if dt is None:
             return None
-        return self.__to_local_datetime(self.string_to_datetime(utc_string, format)) + self.offset()
+        if dt.tzinfo is not None:
+            return self.__to_local_datetime(dt)
+        return self.__to_local_datetime(dt) + self.offset()
 
     # STRING ==> TIMESTAMP
 
     def string_to_timestamp(self, string: str, format: Optional[str] = None, ms: bool = False) -> Optional[int]:
         return self.string_to_local_timestamp(string, format, ms=ms)
 
+    def __string_to_timestamp_datetime(self, string: str, format: Optional[str], dttype: str) -> Optional[datetime.datetime]:
+        # Strings in ``format``, the instance format by default, else ISO 8601 strings as ``string_to_datetime`` parses them
+        dt = self.string_to_utc_datetime(string, self.format(format)) if dttype == 'utc' else self.string_to_local_datetime(string, self.format(format))
+        if dt is None and not format and isinstance(string, str):
+            dt = self.isostring_to_datetime(string, dttype=dttype)
+        return dt
+
     def string_to_utc_timestamp(self, string: str, format: Optional[str] = None, ms: bool = False) -> Optional[int]:
-        format = self.format(format)
-        if not self.validate_string(string, format):
+        dt = self.__string_to_timestamp_datetime(string, format, 'utc')
+        if dt is None:
             return None
-        return self.datetime_to_timestamp(self.string_to_utc_datetime(string, format), ms=ms)
+        return self.datetime_to_timestamp(dt, ms=ms)
 
     def string_to_local_timestamp(self, string: str, format: Optional[str] = None, ms: bool = False) -> Optional[int]:
-        format = self.format(format)
-        if not self.validate_string(string, format):
+        dt = self.__string_to_timestamp_datetime(string, format, 'local')
+        if dt is None:
             return None
-        return self.datetime_to_timestamp(self.string_to_local_datetime(string, format), ms=ms)
+        return self.datetime_to_timestamp(dt, ms=ms)
 
     # TIMESTAMP ==> DATETIME
 
@@ -597,56 +947,65 @@ class TimeConvertTools(object):
 
     # TIME_DELTA
 
-    def timestamp_delta(self, stamp1: int, stamp2: int, interval: Optional[int] = None) -> Dict[str, Any]:
-        delta = stamp1 - stamp2
-        abs_delta = abs(delta)
-        sign = abs_delta and delta // abs_delta
-        delta_seconds = abs_delta % 60
-        delta_minutes = abs_delta // 60 % 60
-        delta_hours = abs_delta // 3600 % 24
-        delta_days = abs_delta // 86400
-        delta_weeks = abs_delta // 604800
-        return {
-            'sign': sign,
-            'weeks': delta_weeks,
-            'days': delta_days,
-            'hours': delta_hours,
-            'minutes': delta_minutes,
-            'seconds': delta_seconds,
-            'total_seconds': abs_delta,
-            'delta': delta,
-            'count_down_seconds': abs(min(delta, 0)),
-            'interval': interval and abs_delta >= interval
-        }
+    def timestamp_delta(self, stamp1: int, stamp2: int, interval: Optional[int] = None) -> Delta:
+        return Delta(stamp1 - stamp2, interval)
 
-    def datetime_delta(self, dt1: Union[datetime.datetime, datetime.date], dt2: Union[datetime.datetime, datetime.date], interval: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    def datetime_delta(self, dt1: Union[datetime.datetime, datetime.date], dt2: Union[datetime.datetime, datetime.date], interval: Optional[int] = None) -> Optional[Delta]:
         return self.timestamp_delta(self.datetime_to_timestamp(dt1), self.datetime_to_timestamp(dt2), interval)
 
-    def date_delta(self, dt1: Union[datetime.datetime, datetime.date], dt2: Union[datetime.datetime, datetime.date], interval: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    def date_delta(self, dt1: Union[datetime.datetime, datetime.date], dt2: Union[datetime.datetime, datetime.date], interval: Optional[int] = None) -> Optional[Delta]:
         return self.datetime_delta(dt1, dt2, interval=interval)
 
-    def string_delta(self, string1: str, string2: str, interval: Optional[int] = None, format: Optional[str] = None, format1: Optional[str] = None, format2: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    def string_delta(self, string1: str, string2: str, interval: Optional[int] = None, format: Optional[str] = None, format1: Optional[str] = None, format2: Optional[str] = None) -> Optional[Delta]:
         format = self.format(format)
         if (not self.validate_string(string1, format1 or format)) or (not self.validate_string(string2, format2 or format)):
             return None
         return self.timestamp_delta(self.string_to_timestamp(string1, format1 or format), self.string_to_timestamp(string2, format2 or format), interval)
 
-    def delta(self, value1: TimeAnyT, value2: TimeAnyT, interval: Optional[int] = None, format: Optional[str] = None, format1: Optional[str] = None, format2: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        if isinstance(value1, datetime.datetime):
-            value1 = self.datetime_to_timestamp(value1)
-        elif isinstance(value1, datetime.date):
-            value1 = self.date_to_timestamp(value1)
-        elif isinstance(value1, (str, bytes)):
-            value1 = self.string_to_timestamp(value1, format1 or format)
+    def __delta_stamp(self, value: TimeAnyT, format: Optional[str] = None) -> int:
+        if isinstance(value, (int, float)):
+            return value
+        if isinstance(value, datetime.datetime):
+            return self.datetime_to_timestamp(value)
+        if isinstance(value, datetime.date):
+            return self.date_to_timestamp(value)
+        if isinstance(value, (str, bytes)):
+            return self.string_to_timestamp(value, format)
+        return value
+
+    def delta(self, value1: TimeAnyT, value2: TimeAnyT, interval: Optional[int] = None, format: Optional[str] = None, format1: Optional[str] = None, format2: Optional[str] = None) -> Optional[Delta]:
+        return self.timestamp_delta(self.__delta_stamp(value1, format1 or format), self.__delta_stamp(value2, format2 or format), interval=interval)
+
+    def seconds_between(self, value1: TimeAnyT, value2: TimeAnyT, format: Optional[str] = None, format1: Optional[str] = None, format2: Optional[str] = None) -> int:
+        """
+        Return ``value1 - value2`` in seconds, what ``delta(value1, value2)['delta']`` gives without building the Delta.
+        """
+        return self.__delta_stamp(value1, format1 or format) - self.__delta_stamp(value2, format2 or format)
 
-        if isinstance(value2, datetime.datetime):
-            value2 = self.datetime_to_timestamp(value2)
-        elif isinstance(value2, datetime.date):
-            value2 = self.date_to_timestamp(value2)
-        elif isinstance(value2, (str, bytes)):
-            value2 = self.string_to_timestamp(value2, format2 or format)
+    def delta_many(self, values1: Union[Iterable[TimeAnyT], TimeAnyT], values2: Union[Iterable[TimeAnyT], TimeAnyT], format: Optional[str] = None, format1: Optional[str] = None, format2: Optional[str] = None) -> Union[List[int], Any]:
+        """
+        Return ``seconds_between`` of each pair of ``values1`` and ``values2``.
 
-        return self.timestamp_delta(value1, value2, interval=interval)
+        A single value on either side is compared with every value of the other side.
+        NumPy arrays of numbers are subtracted vectorized into an array, other sequences give a list.
+        """
+        if np is not None and (isinstance(values1, np.ndarray) or isinstance(values2, np.ndarray)):
+            values1, values2 = self.__delta_array(values1, format1 or format), self.__delta_array(values2, format2 or format)
+            if values1 is not None and values2 is not None:
+                return values1 - values2
+        if isinstance(values1, DELTA_SCALAR_TYPES):
+            stamp1 = self.__delta_stamp(values1, format1 or format)
+            return [stamp1 - self.__delta_stamp(value2, format2 or format) for value2 in values2]
+        if isinstance(values2, DELTA_SCALAR_TYPES):
+            stamp2 = self.__delta_stamp(values2, format2 or format)
+            return [self.__delta_stamp(value1, format1 or format) - stamp2 for value1 in values1]
+        return [self.__delta_stamp(value1, format1 or format) - self.__delta_stamp(value2, format2 or format) for value1, value2 in zip(values1, values2)]
+
+    def __delta_array(self, values: Union[Iterable[TimeAnyT], TimeAnyT], format: Optional[str] = None):
+        # Numeric array, or scalar timestamp broadcast by NumPy, None when a Python loop is needed
+        if isinstance(values, np.ndarray):
+            return values if values.dtype.kind in 'iuf' else None
+        return self.__delta_stamp(values, format) if isinstance(values, DELTA_SCALAR_TYPES) else None
 
     # TIME_COUNT_DOWN
 
@@ -662,21 +1021,95 @@ class TimeConvertTools(object):
             return None
         return self.timestamp_countdown(self.string_to_utc_timestamp(string, format))
 
+    def __countdown_stamp(self, value: TimeAnyT, format: Optional[str] = None) -> Optional[int]:
+        if isinstance(value, (int, float)):
+            return value
+        if isinstance(value, datetime.datetime):
+            return self.datetime_to_timestamp(self.__to_utc_datetime(value))
+        if isinstance(value, datetime.date):
+            return self.date_to_timestamp(value)
+        if isinstance(value, (str, bytes)):
+            return self.string_to_utc_timestamp(value, format)
+        return None
+
+    def countdown_many(self, values: Iterable[TimeAnyT], now: Optional[TimeAnyT] = None, utc: bool = True, format: Optional[str] = None) -> Union[List[Optional[int]], Any]:
+        """
+        Return the countdown of each value, like ``timestamp_countdown``/``datetime_countdown``/``string_countdown``.
+
+        The current time is read once, or taken from ``now``. Invalid strings give None.
+        NumPy arrays of numbers are computed vectorized into an array, other sequences give a list.
+        """
+        now = self.__countdown_stamp(now, format) if now is not None else (self.utc_timestamp() if utc else self.local_timestamp())
+        if np is not None:
+            if isinstance(values, np.ndarray) and values.dtype.kind in 'iuf':
+                return np.maximum(values - now, 0)
+            values = values if isinstance(values, (list, tuple)) else list(values)
+            if values and all(type(value) in (int, float) for value in values):
+                return np.maximum(np.asarray(values) - now, 0).tolist()
+        stamps = [self.__countdown_stamp(value, format) for value in values]
+        return [None if stamp is None else max(stamp - now, 0) for stamp in stamps]
+
     # MIDNIGHT
 
+    def __utc_epoch(self, value: TimeAnyNT, table: ZoneTable, format: Optional[str] = None) -> Optional[float]:
+        # UTC epoch seconds of an instant: now, numbers, aware datetimes, or wall-clock values in ``table``
+        if value is None:
+            return clock_time(self.clock)
+        if isinstance(value, (int, float)):
+            return value
+        if isinstance(value, (str, bytes)):
+            value = self.string_to_datetime(value, format)
+            if value is None:
+                return None
+        if not isinstance(value, datetime.datetime):
+            return table.utc_stamp(calendar.timegm(value.timetuple()))
+        if value.tzinfo is not None and value.utcoffset() is not None:
+            return calendar.timegm(value.utctimetuple()) + value.microsecond / 1e6
+        return table.utc_stamp(calendar.timegm(value.timetuple()), fold=value.fold) + value.microsecond / 1e6
+
+    def day_bounds(self, value: Union[int, float, TimeAnyNT] = None, timezone: Optional[str] = None, format: Optional[str] = None) -> Optional[tuple]:
+        """
+        Return the UTC epoch seconds of the start and the end (start of the next day) of the day of ``value`` in ``timezone``.
+
+        ``value`` is now by default, numbers are UTC epoch seconds, aware datetimes are instants,
+        naive datetimes, dates and strings are wall-clock time in ``timezone``.
+        Days are 23 or 25 hours long across DST transitions.
+        """
+        table = self.zone_table(timezone)
+        stamp = self.__utc_epoch(value, table, format)
+        return None if stamp is None else table.day_bounds(stamp)
+
+    def day_start(self, value: Union[int, float, TimeAnyNT] = None, timezone: Optional[str] = None, format: Optional[str] = None) -> Optional[datetime.datetime]:
+        bounds = self.day_bounds(value, timezone=timezone, format=format)
+        return bounds and datetime.datetime.fromtimestamp(bounds[0], self.tzinfo(timezone))
+
+    def day_end(self, value: Union[int, float, TimeAnyNT] = None, timezone: Optional[str] = None, format: Optional[str] = None) -> Optional[datetime.datetime]:
+        bounds = self.day_bounds(value, timezone=timezone, format=format)
+        return bounds and datetime.datetime.fromtimestamp(bounds[1], self.tzinfo(timezone))
+
+    def seconds_since_day_start(self, value: Union[int, float, TimeAnyNT] = None, timezone: Optional[str] = None, format: Optional[str] = None) -> Optional[float]:
+        table = self.zone_table(timezone)
+        stamp = self.__utc_epoch(value, table, format)
+        return None if stamp is None else stamp - table.day_start(stamp)
+
+    def seconds_until_day_end(self, value: Union[int, float, TimeAnyNT] = None, timezone: Optional[str] = None, format: Optional[str] = None) -> Optional[float]:
+        table = self.zone_table(timezone)
+        stamp = self.__utc_epoch(value, table, format)
+        return None if stamp is None else table.day_end(stamp) - stamp
+
     def utc_datetime_midnight(self, utc_dt: Optional[datetime.datetime] = None) -> datetime.datetime:
         return (self.__utc_datetime(utc_dt)).replace(hour=0, minute=0, second=0, microsecond=0)
 
     def utc_seconds_since_midnight(self, utc_dt: Optional[datetime.datetime] = None, seconds_cast_func: Callable[[Any], T] = float) -> T:
         utc_dt = self.__utc_datetime(utc_dt)
-        return seconds_cast_func(self.total_seconds(utc_dt - self.utc_datetime_midnight(utc_dt)))
+        return seconds_cast_func(self.total_seconds(utc_dt - utc_dt.replace(hour=0, minute=0, second=0, microsecond=0)))
 
     def local_datetime_midnight(self, local_dt: Optional[datetime.datetime] = None) -> datetime.datetime:
         return (self.__local_datetime(local_dt)).replace(hour=0, minute=0, second=0, microsecond=0)
 
     def local_seconds_since_midnight(self, local_dt: Optional[datetime.datetime] = None, seconds_cast_func: Callable[[Any], T] = float) -> T:
-        local_dt = self.__local_datetime(local_dt)
-        return seconds_cast_func(self.total_seconds(local_dt - self.local_datetime_midnight(local_dt)))
+        # Elapsed seconds since the start of the day in the local time zone, 23 or 25 hours long across DST transitions
+        return seconds_cast_func(self.seconds_since_day_start(local_dt))
 
     def datetime_midnight(self, dt: Optional[datetime.datetime] = None, utc: bool = False) -> datetime.datetime:
         return self.utc_datetime_midnight(dt) if utc else self.local_datetime_midnight(dt)
@@ -685,7 +1118,9 @@ class TimeConvertTools(object):
         return seconds_cast_func(self.utc_seconds_since_midnight(dt) if utc else self.local_seconds_since_midnight(dt))
 
     def seconds_until_midnight(self, dt: Optional[datetime.datetime] = None, utc: bool = False, seconds_cast_func: Callable[[Any], T] = float) -> T:
-        return seconds_cast_func(86400 - self.seconds_since_midnight(dt=dt, utc=utc))
+        if utc:
+            return seconds_cast_func(86400 - self.utc_seconds_since_midnight(dt))
+        return seconds_cast_func(self.seconds_until_day_end(dt))
 
     # AWARE vs. NAIVE
 
@@ -714,20 +1149,18 @@ class TimeConvertTools(object):
 
     def make_aware(self, value: datetime.datetime, timezone: Optional[str] = None) -> datetime.datetime:
         """Make a naive datetime.datetime in a given time zone aware."""
-        tzinfo = self.tzinfo(timezone)
         # Check that we won't overwrite the timezone of an aware datetime.
         if self.is_aware(value):
             raise ValueError('make_aware expects a naive datetime, got %s' % value)
         # This may be wrong around DST changes!
-        return value.replace(tzinfo=tzinfo)
+        return value.replace(tzinfo=self.normalizer(timezone).tzinfo)
 
     def make_naive(self, value: datetime.datetime, timezone: Optional[str] = None) -> datetime.datetime:
         """Make an aware datetime.datetime naive in a given time zone."""
-        tzinfo = self.tzinfo(timezone)
         # Emulate the behavior of astimezone() on Python < 3.6.
         if self.is_naive(value):
             raise ValueError('make_naive() cannot be applied to a naive datetime')
-        return value.astimezone(tzinfo).replace(tzinfo=None)
+        return self.normalizer(timezone).to_naive(value)
 
     # PAST vs. FUTURE
 
@@ -794,76 +1227,48 @@ class TimeConvertTools(object):
             return td.days * 86400 + td.seconds
         return ((td.days * 86400 + td.seconds) * self.SECOND_MICROSECOND + td.microseconds) / self.SECOND_MICROSECOND
 
-    def date_range(self, start_date: Union[str, datetime.date], end_date: Union[str, datetime.date], include_end: bool = False, format: Optional[str] = None, start_date_format: Optional[str] = None, end_date_format: Optional[str] = None, return_type: str = 'date', return_format: Optional[str] = None) -> Callable:
-        if isinstance(start_date, str):
-            start_date = self.string_to_date(start_date, start_date_format or format or self.DATE_FORMAT)
-        if isinstance(end_date, str):
-            end_date = self.string_to_date(end_date, end_date_format or format or self.DATE_FORMAT)
-        if include_end:
-            end_date = end_date + datetime.timedelta(1)
-        if return_type in ['string', 'str']:
-            for n in range(int((end_date - start_date).days)):
-                yield self.datetime_to_string(start_date + datetime.timedelta(n), return_format or format or self.DATE_FORMAT)
+    def __period_range(self, period_range: PeriodRange) -> Union[PeriodRange, Any]:
+        if period_range.return_type in ARRAY_RETURN_TYPES:
+            return period_range.to_array(period_range.return_type)
+        return period_range
+
+    def __range_bound(self, value: Union[str, datetime.date], format: str, bound: str) -> datetime.date:
+        if not isinstance(value, str):
+            return value
+        date = self.string_to_date(value, format)
+        if date is None:
+            raise ValueError('%s %r does not match format %r' % (bound, value, format))
+        return date
+
+    def date_range(self, start_date: Union[str, datetime.date], end_date: Union[str, datetime.date], include_end: bool = False, format: Optional[str] = None, start_date_format: Optional[str] = None, end_date_format: Optional[str] = None, return_type: str = 'date', return_format: Optional[str] = None, step: int = 1) -> Union[DateRange, Any]:
+        start_date = self.__range_bound(start_date, start_date_format or format or self.DATE_FORMAT, 'start_date')
+        end_date = self.__range_bound(end_date, end_date_format or format or self.DATE_FORMAT, 'end_date')
+        format = return_format or format or self.DATE_FORMAT
+        if isinstance(start_date, datetime.datetime):
+            # Datetimes keep their time of day, over the whole days elapsed until ``end_date``
+            days = (end_date - start_date).days + (1 if include_end else 0)
+            return self.__period_range(DateRange(start_date.toordinal(), start_date.toordinal() + max(days, 0), step, return_type=return_type, format=format, time=start_date.timetz().replace(fold=0)))
+        return self.__period_range(DateRange(start_date.toordinal(), end_date.toordinal() + (1 if include_end else 0), step, return_type=return_type, format=format))
+
+    def week_range(self, start_date: Union[str, datetime.date], end_date: Union[str, datetime.date], format: Optional[str] = None, start_date_format: Optional[str] = None, end_date_format: Optional[str] = None, return_type: str = 'isoweek', return_format: Optional[str] = None, step: int = 1) -> Union[WeekRange, Any]:
+        start_date = self.__range_bound(start_date, start_date_format or format or self.DATE_FORMAT, 'start_date')
+        end_date = self.__range_bound(end_date, end_date_format or format or self.DATE_FORMAT, 'end_date')
+        return self.__period_range(WeekRange(ISOWeek.withdate(start_date).toordinal(), ISOWeek.withdate(end_date).toordinal() + 1, step, return_type=return_type, format=return_format or format or self.DATE_FORMAT))
+
+    def month_range(self, start_date: Union[str, datetime.date], end_date: Union[str, datetime.date], format: Optional[str] = None, start_date_format: Optional[str] = None, end_date_format: Optional[str] = None, return_type: str = 'date', return_format: Optional[str] = None, step: int = 1) -> Union[MonthRange, Any]:
+        start_date = self.__range_bound(start_date, start_date_format or format or self.DATE_FORMAT, 'start_date')
+        end_date = self.__range_bound(end_date, end_date_format or format or self.DATE_FORMAT, 'end_date')
+        return self.__period_range(MonthRange(Month.from_date(start_date).toordinal(), Month.from_date(end_date).toordinal() + 1, step, return_type=return_type, format=return_format or format or self.DATE_FORMAT))
+
+    def quarter_range(self, start_date: Union[str, datetime.date], end_date: Union[str, datetime.date], format: Optional[str] = None, start_date_format: Optional[str] = None, end_date_format: Optional[str] = None, return_type: str = 'date', return_format: Optional[str] = None, start_month: int = 1, step: int = 1) -> Union[QuarterRange, Any]:
+        start_date = self.__range_bound(start_date, start_date_format or format or self.DATE_FORMAT, 'start_date')
+        end_date = self.__range_bound(end_date, end_date_format or format or self.DATE_FORMAT, 'end_date')
+        # ``start_month`` other than January switches to fiscal quarters
+        if start_month != 1:
+            start_quarter, end_quarter = FiscalQuarter.from_date(start_date, start_month), FiscalQuarter.from_date(end_date, start_month)
         else:
-            for n in range(int((end_date - start_date).days)):
-                yield start_date + datetime.timedelta(n)
-
-    def week_range(self, start_date: Union[str, datetime.date], end_date: Union[str, datetime.date], format: Optional[str] = None, start_date_format: Optional[str] = None, end_date_format: Optional[str] = None, return_type: str = 'isoweek', return_format: Optional[str] = None) -> Callable:
-        if isinstance(start_date, str):
-            start_date = self.string_to_date(start_date, start_date_format or format or self.DATE_FORMAT)
-        if isinstance(end_date, str):
-            end_date = self.string_to_date(end_date, end_date_format or format or self.DATE_FORMAT)
-        start_week = ISOWeek.withdate(start_date)
-        end_week = ISOWeek.withdate(end_date)
-        if return_type in ['string', 'str']:
-            for n in range(int(end_week - start_week) + 1):
-                current_week = start_week + n
-                yield {
-                    'week': current_week.isoformat(),
-                    'start': self.datetime_to_string(current_week.monday(), return_format or format or self.DATE_FORMAT),
-                    'end': self.datetime_to_string(current_week.sunday(), return_format or format or self.DATE_FORMAT),
-                }
-        else:
-            for n in range(int(end_week - start_week) + 1):
-                yield start_week + n
-
-    def month_range(self, start_date: Union[str, datetime.date], end_date: Union[str, datetime.date], format: Optional[str] = None, start_date_format: Optional[str] = None, end_date_format: Optional[str] = None, return_type: str = 'date', return_format: Optional[str] = None) -> Callable:
-        if isinstance(start_date, str):
-            start_date = self.string_to_date(start_date, start_date_format or format or self.DATE_FORMAT)
-        if isinstance(end_date, str):
-            end_date = self.string_to_date(end_date, end_date_format or format or self.DATE_FORMAT)
-        start_month = Month.from_date(start_date)
-        end_month = Month.from_date(end_date)
-        if return_type in ['string', 'str']:
-            for n in range(int(end_month - start_month) + 1):
-                current_month = start_month + n
-                yield {
-                    'month': str(current_month),
-                    'start': self.datetime_to_string(current_month.start_date, return_format or format or self.DATE_FORMAT),
-                    'end': self.datetime_to_string(current_month.end_date, return_format or format or self.DATE_FORMAT),
-                }
-        else:
-            for n in range(int(end_month - start_month) + 1):
-                yield start_month + n
-
-    def quarter_range(self, start_date: Union[str, datetime.date], end_date: Union[str, datetime.date], format: Optional[str] = None, start_date_format: Optional[str] = None, end_date_format: Optional[str] = None, return_type: str = 'date', return_format: Optional[str] = None) -> Callable:
-        if isinstance(start_date, str):
-            start_date = self.string_to_date(start_date, start_date_format or format or self.DATE_FORMAT)
-        if isinstance(end_date, str):
-            end_date = self.string_to_date(end_date, end_date_format or format or self.DATE_FORMAT)
-        start_quarter = Quarter.from_date(start_date)
-        end_quarter = Quarter.from_date(end_date)
-        if return_type in ['string', 'str']:
-            for n in range(int(end_quarter - start_quarter) + 1):
-                current_quarter = start_quarter + n
-                yield {
-                    'quarter': current_quarter.isoformat(),
-                    'start': self.datetime_to_string(current_quarter.start_date, return_format or format or self.DATE_FORMAT),
-                    'end': self.datetime_to_string(current_quarter.end_date, return_format or format or self.DATE_FORMAT),
-                }
-        else:
-            for n in range(int(end_quarter - start_quarter) + 1):
-                yield start_quarter + n
+            start_quarter, end_quarter = Quarter.from_date(start_date), Quarter.from_date(end_date)
+        return self.__period_range(QuarterRange(start_quarter.toordinal(), end_quarter.toordinal() + 1, step, return_type=return_type, format=return_format or format or self.DATE_FORMAT, start_month=start_month))
 
     daterange = date_range
     weekrange = week_range
@@ -875,7 +1280,8 @@ class TimeConvertTools(object):
             start_date = self.string_to_date(start_date, start_date_format or format or self.DATE_FORMAT)
         if isinstance(end_date, str):
             end_date = self.string_to_date(end_date, end_date_format or format or self.DATE_FORMAT)
-        weeks = self.datetime_delta(start_date, end_date).get('weeks')
+        # Whole weeks between the two days, from the ordinals instead of two ``mktime`` calls
+        weeks = abs(end_date.toordinal() - start_date.toordinal()) // 7
         # datetime.datetime.now().isoweekday()  # 返回1-7，代表周一到周日，当前时间所在本周第几天
         # datetime.datetime.now().weekday()  # 返回的0-6，代表周一到周日
         # 标准格式 %w 中，1-6表示周一到周六，0代表周日
@@ -889,6 +1295,33 @@ class TimeConvertTools(object):
                 weeks += 1
         return weeks
 
+    def business_calendar(self, weekmask: Union[str, Iterable[bool]] = '1111100', holidays: Iterable[Union[str, datetime.date]] = (), format: Optional[str] = None) -> BusinessCalendar:
+        """
+        Build a BusinessCalendar, reuse it to count and offset business days in bulk.
+
+        ``weekmask`` lists the business weekdays Monday first, ``'1111100'`` or ``'Mon Tue Wed Thu Fri'``,
+        string dates (holidays and arguments of the calendar methods) are parsed with ``format``.
+        """
+        return BusinessCalendar(weekmask, holidays, parse=lambda string: self.string_to_date(string, format or self.DATE_FORMAT))
+
+    def __business_calendar(self, calendar: Optional[BusinessCalendar], weekmask: Union[str, Iterable[bool]], holidays: Iterable[Union[str, datetime.date]], format: Optional[str]) -> BusinessCalendar:
+        return calendar or self.business_calendar(weekmask, holidays, format=format)
+
+    def is_busday(self, value: Union[str, datetime.date], weekmask: Union[str, Iterable[bool]] = '1111100', holidays: Iterable[Union[str, datetime.date]] = (), calendar: Optional[BusinessCalendar] = None, format: Optional[str] = None) -> bool:
+        return self.__business_calendar(calendar, weekmask, holidays, format).is_busday(value)
+
+    def busday_count(self, start_date: Union[str, datetime.date], end_date: Union[str, datetime.date], weekmask: Union[str, Iterable[bool]] = '1111100', holidays: Iterable[Union[str, datetime.date]] = (), calendar: Optional[BusinessCalendar] = None, format: Optional[str] = None) -> int:
+        return self.__business_calendar(calendar, weekmask, holidays, format).busday_count(start_date, end_date)
+
+    def busday_count_many(self, start_dates: Iterable[Union[str, datetime.date]], end_dates: Iterable[Union[str, datetime.date]], weekmask: Union[str, Iterable[bool]] = '1111100', holidays: Iterable[Union[str, datetime.date]] = (), calendar: Optional[BusinessCalendar] = None, format: Optional[str] = None):
+        return self.__business_calendar(calendar, weekmask, holidays, format).busday_count_many(start_dates, end_dates)
+
+    def busday_offset(self, value: Union[str, datetime.date], offset: int = 0, roll: str = 'raise', weekmask: Union[str, Iterable[bool]] = '1111100', holidays: Iterable[Union[str, datetime.date]] = (), calendar: Optional[BusinessCalendar] = None, format: Optional[str] = None) -> datetime.date:
+        return self.__business_calendar(calendar, weekmask, holidays, format).busday_offset(value, offset, roll=roll)
+
+    def next_busday(self, value: Union[str, datetime.date], n: int = 1, weekmask: Union[str, Iterable[bool]] = '1111100', holidays: Iterable[Union[str, datetime.date]] = (), calendar: Optional[BusinessCalendar] = None, format: Optional[str] = None) -> datetime.date:
+        return self.__business_calendar(calendar, weekmask, holidays, format).next_busday(value, n)
+
     def between(self, value: TimeAnyT, start_value: TimeAnyT, end_value: TimeAnyT, timezone: Optional[str] = None, format: Optional[str] = None, start_format: Optional[str] = None, end_format: Optional[str] = None) -> bool:
         value = self.to_datetime(value, timezone=timezone, format=format, dttype='utc')
         start_value = self.to_datetime(start_value, timezone=timezone, format=format or start_format, dttype='utc')
@@ -902,5 +1335,14 @@ class TimeConvertTools(object):
 
         return start_value <= value <= end_value
 
+    def time_range_index(self, ranges: Iterable[tuple] = (), timezone: Optional[str] = None, format: Optional[str] = None) -> TimeRangeIndex:
+        """
+        Build an index answering ``between`` for many ranges at once.
+
+        ``ranges`` are ``(start_value, end_value)`` or ``(start_value, end_value, data)`` tuples,
+        ``index.stab(value)`` returns the ranges ``value`` is between.
+        """
+        return TimeRangeIndex(ranges, converter=self, timezone=timezone, format=format)
+
 
 TC = tc = TimeConvert = TimeConvertTools()
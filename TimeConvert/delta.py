@@ -0,0 +1,126 @@
+# Fields of a Delta in dict order, computed from the signed difference and the ``interval`` threshold
+_FIELDS = {
+    'sign': lambda delta, limit: delta and delta // abs(delta),
+    'weeks': lambda delta, limit: abs(delta) // 604800,
+    'days': lambda delta, limit: abs(delta) // 86400,
+    'hours': lambda delta, limit: abs(delta) // 3600 % 24,
+    'minutes': lambda delta, limit: abs(delta) // 60 % 60,
+    'seconds': lambda delta, limit: abs(delta) % 60,
+    'total_seconds': lambda delta, limit: abs(delta),
+    'delta': lambda delta, limit: delta,
+    'count_down_seconds': lambda delta, limit: abs(min(delta, 0)),
+    'interval': lambda delta, limit: limit and abs(delta) >= limit,
+}
+
+DELTA_KEYS = tuple(_FIELDS)
+
+
+def _field(key):
+    compute = _FIELDS[key]
+    return property(lambda self: compute(self.delta, self.limit))
+
+
+class Delta(dict):
+    """Difference between two timestamps, as returned by ``timestamp_delta``.
+
+    Only the signed difference is stored; the other fields are computed when
+    accessed, either as attributes (``delta.total_seconds``) or as dict items
+    (``delta['total_seconds']``). Operations on the whole mapping (iteration,
+    ``len``, comparison, ``repr``, ...) fill in every field first, so a Delta
+    behaves like the dict ``timestamp_delta`` used to return.
+    """
+    __slots__ = ('delta', 'limit', '_complete')
+
+    def __init__(self, delta, interval=None):
+        """
+        :param delta: signed difference ``stamp1 - stamp2``
+        :param interval: threshold the ``interval`` field compares ``total_seconds`` with
+        """
+        self.delta = delta
+        self.limit = interval
+        self._complete = False
+
+    sign = _field('sign')
+    weeks = _field('weeks')
+    days = _field('days')
+    hours = _field('hours')
+    minutes = _field('minutes')
+    seconds = _field('seconds')
+    total_seconds = _field('total_seconds')
+    count_down_seconds = _field('count_down_seconds')
+    interval = _field('interval')
+
+    # DICT
+
+    def __missing__(self, key):
+        # Once filled in, a Delta is a plain dict, popped fields stay away
+        if self._complete or key not in _FIELDS:
+            raise KeyError(key)
+        value = self[key] = _FIELDS[key](self.delta, self.limit)
+        return value
+
+    def _fill(self):
+        if not self._complete:
+            items = dict(dict.items(self))
+            dict.clear(self)
+            for key in DELTA_KEYS:
+                dict.__setitem__(self, key, items.pop(key) if key in items else _FIELDS[key](self.delta, self.limit))
+            dict.update(self, items)
+            self._complete = True
+        return self
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or (not self._complete and key in _FIELDS)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def __iter__(self):
+        return dict.__iter__(self._fill())
+
+    def __len__(self):
+        return dict.__len__(self._fill())
+
+    def __eq__(self, other):
+        if isinstance(other, Delta):
+            other._fill()
+        return dict.__eq__(self._fill(), other)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return dict.__repr__(self._fill())
+
+    def __or__(self, other):
+        return dict(self._fill()) | other
+
+    def __ror__(self, other):
+        return other | dict(self._fill())
+
+    def __reduce__(self):
+        return dict, (dict(self._fill()), )
+
+    def keys(self):
+        return dict.keys(self._fill())
+
+    def values(self):
+        return dict.values(self._fill())
+
+    def items(self):
+        return dict.items(self._fill())
+
+    def copy(self):
+        return dict(self._fill())
+
+    def pop(self, *args):
+        return dict.pop(self._fill(), *args)
+
+    def popitem(self):
+        return dict.popitem(self._fill())
+
+    def setdefault(self, key, default=None):
+        return dict.setdefault(self._fill(), key, default)
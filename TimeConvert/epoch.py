@@ -0,0 +1,86 @@
+"""
+Integer epoch timestamps in seconds, milliseconds, microseconds or nanoseconds.
+
+Conversions are integer arithmetic only, no float is involved: datetimes
+carry microseconds, which milliseconds and seconds round down from, and
+nanoseconds extend with zeros.
+"""
+import datetime
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+# Units per second
+EPOCH_UNITS = {
+    's': 1,
+    'ms': 10 ** 3,
+    'us': 10 ** 6,
+    'ns': 10 ** 9,
+}
+
+MICROSECONDS = 10 ** 6
+
+EPOCH = datetime.datetime(1970, 1, 1)
+UTC_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def per_second(unit):
+    """Return the number of ``unit`` in a second."""
+    try:
+        return EPOCH_UNITS[unit]
+    except KeyError:
+        raise ValueError('unit must be one of %s, got %r' % (', '.join(EPOCH_UNITS), unit))
+
+
+def microseconds_to(microseconds, unit):
+    """Return ``microseconds`` in ``unit``, rounded down."""
+    units = per_second(unit)
+    if units >= MICROSECONDS:
+        return microseconds * (units // MICROSECONDS)
+    return microseconds // (MICROSECONDS // units)
+
+
+def convert(stamp, unit, to_unit):
+    """Return the epoch ``stamp`` in ``unit`` as ``to_unit``, rounded down; ints or int64 arrays."""
+    units, to_units = per_second(unit), per_second(to_unit)
+    if to_units >= units:
+        return stamp * (to_units // units)
+    return stamp // (units // to_units)
+
+
+def from_datetime(dt, unit='s'):
+    """Return the epoch of ``dt`` in ``unit``, naive datetimes being UTC."""
+    td = dt - (EPOCH if dt.tzinfo is None or dt.utcoffset() is None else UTC_EPOCH)
+    return (td.days * 86400 + td.seconds) * per_second(unit) + microseconds_to(td.microseconds, unit)
+
+
+def to_datetime(stamp, unit='s', tzinfo=None):
+    """Return the datetime of the epoch ``stamp`` in ``unit``, naive UTC, or aware in ``tzinfo``."""
+    units = per_second(unit)
+    seconds, rest = divmod(int(stamp), units)
+    dt = EPOCH + datetime.timedelta(seconds=seconds, microseconds=rest * MICROSECONDS // units)
+    if tzinfo is None:
+        return dt
+    return dt.replace(tzinfo=datetime.timezone.utc).astimezone(tzinfo)
+
+
+def from_datetimes(values, unit='s'):
+    """Return the epochs of a sequence of datetimes, or of a ``datetime64`` array.
+
+    Returns an int64 NumPy array when NumPy is installed, a list otherwise.
+    """
+    if np is None:
+        return [from_datetime(dt, unit) for dt in values]
+    if isinstance(values, np.ndarray) and values.dtype.kind == 'M':
+        per_second(unit)
+        return values.astype('datetime64[%s]' % unit).astype(np.int64)
+    return np.array([from_datetime(dt, unit) for dt in values], dtype=np.int64)
+
+
+def to_datetimes(stamps, unit='s', tzinfo=None):
+    """Return the datetimes of a sequence or int64 array of epochs, see ``to_datetime``."""
+    return [to_datetime(stamp, unit, tzinfo) for stamp in stamps]
@@ -0,0 +1,108 @@
+"""
+Conversion of binary files of little-endian int64 epochs, memory-mapped and converted window by window.
+
+    from TimeConvert.epochfile import convert_file
+
+    convert_file('events.bin', 'to_local', table=get_zone_table('Asia/Shanghai'))
+    convert_file('events.bin', 'week', table=table, out='weeks.bin')
+
+Only one window of ``window`` values is held in memory besides the mapping,
+whatever the size of the file; no datetime object is created.
+"""
+import os
+
+from .bucket import BUCKET_GRANULARITIES, bucket_epochs
+from .epoch import EPOCH_UNITS, per_second
+from .epoch import convert as convert_epoch
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+DTYPE = '<i8'
+ITEMSIZE = 8
+
+TO_LOCAL = 'to_local'
+TO_UTC = 'to_utc'
+TO_UNIT = 'to_unit'
+CONVERSIONS = (TO_LOCAL, TO_UTC, TO_UNIT) + BUCKET_GRANULARITIES
+
+# Values per window, 8 MiB of int64
+WINDOW = 1 << 20
+
+
+def _numpy():
+    if np is None:
+        raise ImportError('TimeConvert.epochfile requires numpy, pip install TimeConvert[numpy]')
+    return np
+
+
+def _check(conversion, unit, to_unit):
+    if conversion not in CONVERSIONS:
+        raise ValueError('conversion must be one of %s, got %r' % (', '.join(CONVERSIONS), conversion))
+    per_second(unit)
+    per_second(to_unit)
+
+
+def convert_window(values, conversion, table=None, unit='us', to_unit=None):
+    """Return the converted int64 array of an array of epochs in ``unit``.
+
+    ``to_local`` shifts UTC epochs to wall-clock epochs in the zone of
+    ``table``, ``to_utc`` back (ambiguous wall-clock times are the earlier
+    instant), ``to_unit`` changes the unit to ``to_unit`` rounding down;
+    ``day``, ``week``, ``month`` and ``quarter`` give the bucket ids of
+    ``tc.bucket``. Shifted epochs keep their unit unless ``to_unit`` is given.
+    """
+    _numpy()
+    to_unit = to_unit or unit
+    _check(conversion, unit, to_unit)
+    units = EPOCH_UNITS[unit]
+    values = np.asarray(values, dtype=np.int64)
+    if conversion in BUCKET_GRANULARITIES:
+        return bucket_epochs(values // units, conversion, table)
+    if conversion == TO_LOCAL:
+        values = values + table.utcoffsets(values // units) * units
+    elif conversion == TO_UTC:
+        seconds = values // units
+        values = values - (seconds - table.utc_stamps(seconds)) * units
+    return convert_epoch(values, unit, to_unit)
+
+
+def convert_file(path, conversion, table=None, out=None, unit='us', to_unit=None, window=WINDOW):
+    """Convert a file of little-endian int64 epochs in ``unit``, in place or into ``out``.
+
+    See ``convert_window`` for the conversions. ``out`` is created, or
+    truncated, to the size of ``path``, and may not be ``path`` itself.
+    Returns the number of values converted.
+    """
+    _numpy()
+    _check(conversion, unit, to_unit or unit)
+    if conversion != TO_UNIT and table is None:
+        raise ValueError('conversion %r requires a zone table' % (conversion, ))
+    if window < 1:
+        raise ValueError('window must be positive')
+    if out is not None and os.path.realpath(out) == os.path.realpath(path):
+        # Truncating ``out`` would lose the values, convert in place with ``out=None``
+        raise ValueError('out %r is the file converted, leave out to convert in place' % (out, ))
+    size = os.path.getsize(path)
+    if size % ITEMSIZE:
+        raise ValueError('size of %r is not a multiple of %d bytes' % (path, ITEMSIZE))
+    count = size // ITEMSIZE
+    if out is not None:
+        with open(out, 'wb') as f:
+            f.truncate(size)
+    if not count:
+        return 0
+    source = np.memmap(path, dtype=DTYPE, mode='r+' if out is None else 'r', shape=(count, ))
+    target = source if out is None else np.memmap(out, dtype=DTYPE, mode='r+', shape=(count, ))
+    try:
+        for start in range(0, count, window):
+            stop = min(start + window, count)
+            target[start:stop] = convert_window(source[start:stop], conversion, table, unit, to_unit)
+        target.flush()
+    finally:
+        del source, target
+    return count
@@ -0,0 +1,97 @@
+"""
+One instant in many time zones.
+
+    fan_out = FanOut([(name, table, tzinfo), ...], output='string', format='%Y-%m-%d %H:%M')
+    fan_out(1512718020 * 10 ** 6)     # {'Asia/Shanghai': '2017-12-08 15:27', 'Europe/London': ...}
+    fan_out.map(stamps_us)            # {'Asia/Shanghai': ['2017-12-08 15:27', ...], ...}
+
+Instants are UTC epoch microseconds, normalized once by the caller. The
+offset of each zone comes from its ZoneTable, no tzinfo is called, and
+zones at the same wall-clock time share one formatting.
+"""
+import datetime
+
+from .iso8601 import fixed_offset_seconds
+from .zonetable import SECONDS_PER_DAY
+
+
+DATETIME = 'datetime'
+NAIVE = 'naive'
+STRING = 'string'
+ISOSTRING = 'isostring'
+OFFSET = 'offset'
+OUTPUTS = (DATETIME, NAIVE, STRING, ISOSTRING, OFFSET)
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+class FanOut(object):
+    """Converts UTC epoch microseconds to each of ``zones``, ``(name, ZoneTable, tzinfo)`` triples.
+
+    ``output`` is ``datetime`` (aware in the zone, ``fold`` set on the second
+    occurrence of ambiguous times), ``naive`` (wall-clock time), ``string``
+    (``format``), ``isostring`` (with the offset) or ``offset`` (seconds).
+    """
+
+    def __init__(self, zones, output=STRING, format=None):
+        if output not in OUTPUTS:
+            raise ValueError('output must be one of %s, got %r' % (', '.join(OUTPUTS), output))
+        if output == STRING and not format:
+            raise ValueError('output string requires a format')
+        self.zones = list(zones)
+        self.names = [zone[0] for zone in self.zones]
+        self.output = output
+        self.format = format
+        # Offsets and wall-clock times alone render ``%z``/``%Z`` wrong, these go through the aware datetime
+        self.__aware_format = output == STRING and ('%z' in format or '%Z' in format)
+
+    def __repr__(self):
+        return '%s(%d zones, output=%r)' % (self.__class__.__name__, len(self.zones), self.output)
+
+    def __render(self, seconds, microsecond, table, tzinfo, cache=None):
+        offset = table.utcoffset(seconds)
+        if self.output == OFFSET:
+            return offset
+        wall = seconds + offset
+        if self.output == DATETIME or self.__aware_format:
+            # The second occurrence of an ambiguous wall-clock time, the offset was larger shortly before
+            before = table.utcoffset(seconds - SECONDS_PER_DAY)
+            fold = 1 if before > offset and table.utcoffset(wall - before) == before else 0
+            dt = (_EPOCH + datetime.timedelta(seconds=wall, microseconds=microsecond)).replace(tzinfo=tzinfo, fold=fold)
+            return dt if self.output == DATETIME else dt.strftime(self.format)
+        key = wall, offset
+        value = cache.get(key) if cache is not None else None
+        if value is None:
+            value = _EPOCH + datetime.timedelta(seconds=wall, microseconds=microsecond)
+            if self.output == STRING:
+                value = value.strftime(self.format)
+            elif self.output == ISOSTRING:
+                value = value.replace(tzinfo=fixed_offset_seconds(offset)).isoformat()
+            if cache is not None:
+                cache[key] = value
+        return value
+
+    def __call__(self, stamp):
+        """Return ``{zone name: value}`` of the UTC epoch microseconds ``stamp``, values are ``None`` for a ``None`` stamp."""
+        if stamp is None:
+            return dict.fromkeys(self.names)
+        seconds, microsecond = divmod(stamp, 10 ** 6)
+        cache = {}
+        render = self.__render
+        return {name: render(seconds, microsecond, table, tzinfo, cache) for name, table, tzinfo in self.zones}
+
+    def map(self, stamps):
+        """Return ``{zone name: [value, ...]}`` of a sequence of UTC epoch microseconds, ``None`` for ``None`` stamps."""
+        splits = [None if stamp is None else divmod(stamp, 10 ** 6) for stamp in stamps]
+        render = self.__render
+        # Zones at the same offsets at every instant have the same values, rendered once
+        shared = self.output != DATETIME and not self.__aware_format
+        columns = {}
+        results = {}
+        for name, table, tzinfo in self.zones:
+            offsets = tuple(None if split is None else table.utcoffset(split[0]) for split in splits) if shared else None
+            column = columns.get(offsets) if shared else None
+            if column is None:
+                column = columns[offsets] = [None if split is None else render(split[0], split[1], table, tzinfo) for split in splits]
+            results[name] = list(column)
+        return results
@@ -0,0 +1,138 @@
+"""
+HTTP dates (RFC 7231) and RFC 2822 dates, from and to epoch seconds.
+
+    format_http_date(1512718020)   # 'Fri, 08 Dec 2017 07:27:00 GMT'
+    parse_http_date('Fri, 08 Dec 2017 07:27:00 GMT')   # 1512718020
+    format_rfc2822(1512718020, 28800)   # 'Fri, 08 Dec 2017 15:27:00 +0800'
+
+Day and month names are English whatever the locale. The last string
+rendered is cached with its second, so that every response of the same
+second shares one formatting; the cache is a single tuple swapped
+atomically, safe to share between threads without a lock.
+"""
+import datetime
+import re
+import time
+
+from .zonetable import EPOCH_ORDINAL, SECONDS_PER_DAY
+
+
+DAY_NAMES = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+MONTH_NAMES = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+_MONTHS = {name: month for month, name in enumerate(MONTH_NAMES, 1)}
+
+_DAY = '(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)'
+_MONTH = '(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)'
+
+# Groups: day, month, year, hour, minute, second
+IMF_FIXDATE = re.compile(_DAY + r', (\d{2}) ' + _MONTH + r' (\d{4}) (\d{2}):(\d{2}):(\d{2}) GMT')
+RFC850_DATE = re.compile(r'(?:Mon|Tues|Wednes|Thurs|Fri|Satur|Sun)day, (\d{2})-' + _MONTH + r'-(\d{2}) (\d{2}):(\d{2}):(\d{2}) GMT')
+# Groups: month, day, hour, minute, second, year
+ASCTIME_DATE = re.compile(_DAY + ' ' + _MONTH + r' ([ \d]\d) (\d{2}):(\d{2}):(\d{2}) (\d{4})')
+# Groups: day, month, year, hour, minute, second, zone
+RFC2822_DATE = re.compile(r'\s*(?:' + _DAY + r',\s*)?(\d{1,2})\s+' + _MONTH + r'\s+(\d{2,4})\s+(\d{2}):(\d{2})(?::(\d{2}))?\s+([+-]\d{4}|[A-Z]{1,3})\s*')
+
+# Obsolete zone names of RFC 2822, offsets in minutes
+ZONES = {
+    'UT': 0, 'GMT': 0, 'Z': 0,
+    'EST': -300, 'EDT': -240, 'CST': -360, 'CDT': -300,
+    'MST': -420, 'MDT': -360, 'PST': -480, 'PDT': -420,
+}
+
+
+class SecondCache(object):
+    """One-entry cache of a string rendered for a key, the epoch second (and offset)."""
+    __slots__ = ('entry', )
+
+    def __init__(self):
+        self.entry = (None, None)
+
+    def get(self, key):
+        entry = self.entry
+        return entry[1] if entry[0] == key else None
+
+    def put(self, key, string):
+        # A single assignment, concurrent readers see either the old or the new pair
+        self.entry = (key, string)
+        return string
+
+
+_http_cache = SecondCache()
+_rfc2822_cache = SecondCache()
+
+
+def _epoch(year, month, day, hour, minute, second):
+    if hour > 23 or minute > 59 or second > 60:
+        raise ValueError('time is out of range')
+    return (datetime.date(year, month, day).toordinal() - EPOCH_ORDINAL) * SECONDS_PER_DAY + hour * 3600 + minute * 60 + second
+
+
+def _render(stamp, offset, zone):
+    year, month, day, hour, minute, second, weekday = time.gmtime(stamp + offset)[:7]
+    return '%s, %02d %s %04d %02d:%02d:%02d %s' % (DAY_NAMES[weekday], day, MONTH_NAMES[month - 1], year, hour, minute, second, zone)
+
+
+def format_http_date(stamp):
+    """Return the IMF-fixdate of the UTC epoch seconds ``stamp``, as sent in ``Date``/``Last-Modified``/``Expires``."""
+    stamp = int(stamp // 1)
+    entry = _http_cache.entry
+    if entry[0] == stamp:
+        return entry[1]
+    return _http_cache.put(stamp, _render(stamp, 0, 'GMT'))
+
+
+def format_rfc2822(stamp, offset=0):
+    """Return the RFC 2822 date of the UTC epoch seconds ``stamp`` at the UTC ``offset`` in seconds."""
+    key = int(stamp // 1), int(offset)
+    entry = _rfc2822_cache.entry
+    if entry[0] == key:
+        return entry[1]
+    stamp, offset = key
+    minutes = abs(offset) // 60
+    return _rfc2822_cache.put(key, _render(stamp, offset, '%s%02d%02d' % ('-' if offset < 0 else '+', minutes // 60, minutes % 60)))
+
+
+def parse_http_date(string):
+    """Return the UTC epoch seconds of an HTTP date, IMF-fixdate, RFC 850 or asctime; ``None`` if it is none of them."""
+    try:
+        match = IMF_FIXDATE.fullmatch(string)
+        if match is not None:
+            day, month, year, hour, minute, second = match.groups()
+            return _epoch(int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second))
+        match = RFC850_DATE.fullmatch(string)
+        if match is not None:
+            day, month, year, hour, minute, second = match.groups()
+            # Two-digit years, 70-99 are the 20th century
+            year = int(year)
+            return _epoch(year + (1900 if year >= 70 else 2000), _MONTHS[month], int(day), int(hour), int(minute), int(second))
+        match = ASCTIME_DATE.fullmatch(string)
+        if match is not None:
+            month, day, hour, minute, second, year = match.groups()
+            return _epoch(int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second))
+    except ValueError:
+        return None
+    return None
+
+
+def parse_rfc2822(string):
+    """Return the UTC epoch seconds of an RFC 2822 date, ``None`` if it is not one."""
+    match = RFC2822_DATE.fullmatch(string)
+    if match is None:
+        return None
+    day, month, year_digits, hour, minute, second, zone = match.groups()
+    year = int(year_digits)
+    if len(year_digits) == 2:
+        # Obsolete two-digit years, 50-99 are the 20th century
+        year += 1900 if year >= 50 else 2000
+    elif len(year_digits) == 3:
+        year += 1900
+    if zone[0] in '+-':
+        offset = int(zone[1:3]) * 60 + int(zone[3:5])
+        offset = -offset if zone[0] == '-' else offset
+    else:
+        # Unknown military zones are -0000, no information
+        offset = ZONES.get(zone, 0)
+    try:
+        return _epoch(year, _MONTHS[month], int(day), int(hour), int(minute), int(second or 0)) - offset * 60
+    except ValueError:
+        return None
@@ -0,0 +1,259 @@
+import calendar
+import datetime
+import math
+from bisect import bisect_left, insort
+from collections import namedtuple
+
+
+class TimeRange(namedtuple('TimeRange', ('key', 'start', 'end', 'data'))):
+    """A closed time range ``[start, end]`` in UTC epoch seconds, with microseconds, as stored in a TimeRangeIndex."""
+    __slots__ = ()
+
+    def contains(self, stamp):
+        """Check if the UTC epoch ``stamp`` falls within the range"""
+        return self.start <= stamp <= self.end
+
+
+class _Node(object):
+    __slots__ = ('center', 'left', 'right', 'by_start', 'by_end', 'size')
+
+    def __init__(self, center):
+        self.center = center
+        self.left = None
+        self.right = None
+        # (start, key) ascending and (end, key) ascending of the ranges containing ``center``
+        self.by_start = []
+        self.by_end = []
+        # Number of ranges stored in the subtree
+        self.size = 0
+
+
+class TimeRangeIndex(object):
+    """Index of time ranges answering "which ranges contain t?" in O(log n + k).
+
+    Ranges are given in any form ``to_datetime`` accepts (or as UTC epoch
+    seconds) and normalized to UTC epoch seconds once, when added. Like
+    ``between``, bounds are inclusive and swapped when given in reverse order.
+
+    The ranges are kept in a centered interval tree; subtrees which get out of
+    balance through insertions are rebuilt, and the whole tree once deletions
+    shrank it below ``ALPHA`` of its largest size, scapegoat tree style, so
+    that the depth stays logarithmic.
+    """
+
+    # Weight balance factor of the subtrees
+    ALPHA = 0.75
+
+    def __init__(self, ranges=(), converter=None, timezone=None, format=None):
+        """
+        :param ranges: iterable of ``(start, end)`` or ``(start, end, data)`` tuples
+        :param converter: TimeConvertTools used to normalize values, ``tc`` by default
+        :param timezone: time zone of naive values
+        :param format: format of string values
+        """
+        if converter is None:
+            from .convert import tc as converter
+        self.converter = converter
+        self.timezone = timezone
+        self.format = format
+        self.__ranges = {}
+        self.__next_key = 0
+        self.__root = None
+        for item in ranges:
+            key = self.__next_key
+            self.__next_key += 1
+            self.__ranges[key] = self.__make_range(key, *item)
+        self.__root = self.__build(list(self.__ranges.values()))
+        # Largest number of ranges since the last full rebuild
+        self.__max_size = len(self.__ranges)
+
+    def to_stamp(self, value, format=None):
+        """Normalize a value to UTC epoch seconds, with microseconds."""
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return value
+        dt = self.converter.to_datetime(value, timezone=self.timezone, format=format or self.format, dttype='utc')
+        if not isinstance(dt, datetime.datetime):
+            raise ValueError('Cannot convert %r to a time' % (value, ))
+        stamp = calendar.timegm(dt.utctimetuple())
+        # Ranges touching within the same second stay apart
+        return stamp + dt.microsecond / 10 ** 6 if dt.microsecond else stamp
+
+    def __make_range(self, key, start, end, data=None):
+        start, end = self.to_stamp(start), self.to_stamp(end)
+        if start > end:
+            start, end = end, start
+        return TimeRange(key, start, end, data)
+
+    # TREE
+
+    def __build(self, ranges):
+        ranges.sort(key=lambda time_range: (time_range.start, time_range.key))
+        return self.__build_sorted(ranges)
+
+    def __build_sorted(self, ranges):
+        # ``ranges`` are sorted by start, the median start is contained in at least one of them
+        if not ranges:
+            return None
+        node = _Node(ranges[len(ranges) // 2].start)
+        left, right = [], []
+        for time_range in ranges:
+            if time_range.end < node.center:
+                left.append(time_range)
+            elif time_range.start > node.center:
+                right.append(time_range)
+            else:
+                node.by_start.append((time_range.start, time_range.key))
+                node.by_end.append((time_range.end, time_range.key))
+        node.by_end.sort()
+        node.left = self.__build_sorted(left)
+        node.right = self.__build_sorted(right)
+        node.size = len(ranges)
+        return node
+
+    def __collect(self, node, ranges):
+        if node is not None:
+            ranges.extend(self.__ranges[key] for _, key in node.by_start)
+            self.__collect(node.left, ranges)
+            self.__collect(node.right, ranges)
+        return ranges
+
+    def __max_depth(self):
+        return int(math.log(len(self.__ranges) + 1, 1 / self.ALPHA)) + 1
+
+    def __insert(self, time_range):
+        path = []
+        parent, node = None, self.__root
+        while node is not None:
+            path.append(node)
+            node.size += 1
+            if time_range.end < node.center:
+                parent, node = node, node.left
+            elif time_range.start > node.center:
+                parent, node = node, node.right
+            else:
+                insort(node.by_start, (time_range.start, time_range.key))
+                insort(node.by_end, (time_range.end, time_range.key))
+                return
+        node = _Node((time_range.start + time_range.end) / 2)
+        node.by_start.append((time_range.start, time_range.key))
+        node.by_end.append((time_range.end, time_range.key))
+        node.size = 1
+        if parent is None:
+            self.__root = node
+        elif time_range.end < parent.center:
+            parent.left = node
+        else:
+            parent.right = node
+        path.append(node)
+        if len(path) > self.__max_depth():
+            self.__rebalance(path)
+
+    def __rebalance(self, path):
+        # Rebuild the highest subtree on the insertion path that is out of balance
+        for depth, node in enumerate(path):
+            heaviest = max(node.left.size if node.left else 0, node.right.size if node.right else 0)
+            if heaviest > self.ALPHA * node.size:
+                subtree = self.__build(self.__collect(node, []))
+                if depth == 0:
+                    self.__root = subtree
+                elif path[depth - 1].left is node:
+                    path[depth - 1].left = subtree
+                else:
+                    path[depth - 1].right = subtree
+                return
+
+    def __delete(self, time_range):
+        parent, node = None, self.__root
+        path = []
+        while node is not None:
+            path.append((parent, node))
+            if time_range.end < node.center:
+                parent, node = node, node.left
+            elif time_range.start > node.center:
+                parent, node = node, node.right
+            else:
+                del node.by_start[bisect_left(node.by_start, (time_range.start, time_range.key))]
+                del node.by_end[bisect_left(node.by_end, (time_range.end, time_range.key))]
+                break
+        for parent, node in path:
+            node.size -= 1
+        # Prune the emptied nodes bottom up
+        for parent, node in reversed(path):
+            if node.size:
+                break
+            if parent is None:
+                self.__root = None
+            elif parent.left is node:
+                parent.left = None
+            else:
+                parent.right = None
+
+    # PUBLIC
+
+    def add(self, start, end, data=None):
+        """Add the range ``[start, end]`` and return its key."""
+        key = self.__next_key
+        self.__next_key += 1
+        time_range = self.__ranges[key] = self.__make_range(key, start, end, data)
+        self.__insert(time_range)
+        self.__max_size = max(self.__max_size, len(self.__ranges))
+        return key
+
+    insert = add
+
+    def remove(self, key):
+        """Remove the range with the given key, raise KeyError if there is none."""
+        self.__delete(self.__ranges.pop(key))
+        if len(self.__ranges) < self.ALPHA * self.__max_size:
+            # Mostly deleted, rebuild the whole tree
+            self.__root = self.__build(list(self.__ranges.values()))
+            self.__max_size = len(self.__ranges)
+
+    delete = remove
+
+    def discard(self, key):
+        """Remove the range with the given key if present."""
+        if key in self.__ranges:
+            self.remove(key)
+
+    def stab(self, value, format=None):
+        """Return the ranges containing ``value``, ordered by key."""
+        stamp = self.to_stamp(value, format)
+        keys = []
+        node = self.__root
+        while node is not None:
+            if stamp < node.center:
+                for start, key in node.by_start:
+                    if start > stamp:
+                        break
+                    keys.append(key)
+                node = node.left
+            elif stamp > node.center:
+                for end, key in reversed(node.by_end):
+                    if end < stamp:
+                        break
+                    keys.append(key)
+                node = node.right
+            else:
+                keys.extend(key for _, key in node.by_start)
+                break
+        keys.sort()
+        return [self.__ranges[key] for key in keys]
+
+    search = stab
+
+    def stab_many(self, values, format=None):
+        """Return the ranges containing each of ``values``."""
+        return [self.stab(value, format) for value in values]
+
+    def __getitem__(self, key):
+        return self.__ranges[key]
+
+    def __contains__(self, key):
+        return key in self.__ranges
+
+    def __len__(self):
+        return len(self.__ranges)
+
+    def __iter__(self):
+        return iter(self.__ranges.values())
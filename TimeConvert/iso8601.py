@@ -0,0 +1,106 @@
+"""
+ISO 8601 / RFC 3339 parsing.
+
+    parse('2017-12-08T15:27:00.123+08:00')  # aware, fixed offset
+    parse('2017-12-08T07:27:00Z')           # aware, UTC
+    parse('2017-12-08 15:27')               # naive
+    parse('2017-W49-5')                     # week date, through ISOWeek
+    parse('2017-342')                       # ordinal date
+
+Dates are calendar (``YYYY-MM-DD``/``YYYYMMDD``), week (``YYYY-Www[-D]``/
+``YYYYWww[D]``) or ordinal (``YYYY-DDD``/``YYYYDDD``) dates, optionally followed
+by ``T`` (or a space) and ``HH[:MM[:SS[.fraction]]]`` with any number of
+fractional digits (truncated to microseconds) and a ``Z``, ``±HH``, ``±HHMM``
+or ``±HH:MM`` offset. Offsets give aware datetimes, ``Z`` and zero offsets in
+UTC, the other ones in fixed-offset tzinfos shared by every value with the
+same offset.
+"""
+import calendar
+import datetime
+import re
+
+from dateutil.tz import tz
+
+from .isoweek import ISOWeek
+
+
+# Groups: year, date separator, month, day, week, weekday, ordinal day, hour, minute, second, fraction, offset
+PATTERN = re.compile(
+    r'(\d{4})(-?)(?:(\d{2})\2(\d{2})|W(\d{2})(?:\2([1-7]))?|(\d{3}))'
+    r'(?:[Tt ](\d{2})(?::?(\d{2})(?::?(\d{2})(?:[.,](\d+))?)?)?(Z|z|[+-]\d{2}(?::?\d{2})?)?)?'
+)
+
+# Bound of the interned offsets, offsets are few but strings come from outside
+CACHE_SIZE = 256
+
+_TZINFOS = {}
+
+
+def fixed_offset_seconds(seconds):
+    """Return the shared tzinfo of a UTC offset in seconds, ``tz.UTC`` for 0."""
+    tzinfo = _TZINFOS.get(seconds)
+    if tzinfo is None:
+        if len(_TZINFOS) >= CACHE_SIZE:
+            _TZINFOS.clear()
+        tzinfo = _TZINFOS[seconds] = tz.UTC if not seconds else datetime.timezone(datetime.timedelta(seconds=seconds))
+    return tzinfo
+
+
+def fixed_offset(minutes):
+    """Return the shared tzinfo of a UTC offset in minutes, ``tz.UTC`` for 0."""
+    return fixed_offset_seconds(minutes * 60)
+
+
+def offset_tzinfo(offset):
+    """Return the tzinfo of an offset string: ``Z``, ``±HH``, ``±HHMM`` or ``±HH:MM``."""
+    if offset in ('Z', 'z'):
+        return tz.UTC
+    minutes = int(offset[1:3]) * 60 + (int(offset[-2:]) if len(offset) > 3 else 0)
+    return fixed_offset(-minutes if offset[0] == '-' else minutes)
+
+
+def _date(year, week, weekday, ordinal):
+    if week is not None:
+        week = int(week)
+        isoweek = ISOWeek(year, week)
+        # ISOWeek normalizes out of range weeks into the next or previous year
+        if isoweek.week != week or isoweek.year != year:
+            raise ValueError('week %d is out of range for %d' % (week, year))
+        return isoweek.day(int(weekday or 1) - 1)
+    ordinal = int(ordinal)
+    if not 1 <= ordinal <= (366 if calendar.isleap(year) else 365):
+        raise ValueError('ordinal day %d is out of range for %d' % (ordinal, year))
+    return datetime.date.fromordinal(datetime.date(year, 1, 1).toordinal() + ordinal - 1)
+
+
+def build(match):
+    """Return the datetime of a ``PATTERN`` match, raise ValueError for out of range fields."""
+    year, _, month, day, week, weekday, ordinal, hour, minute, second, fraction, offset = match.groups()
+    year = int(year)
+    if month is not None:
+        month, day = int(month), int(day)
+    else:
+        date = _date(year, week, weekday, ordinal)
+        year, month, day = date.year, date.month, date.day
+    if hour is None:
+        return datetime.datetime(year, month, day)
+    hour = int(hour)
+    minute = int(minute) if minute else 0
+    second = int(second) if second else 0
+    microsecond = int(fraction[:6].ljust(6, '0')) if fraction else 0
+    tzinfo = offset_tzinfo(offset) if offset else None
+    if hour == 24 and not (minute or second or microsecond):
+        # End of the day, the midnight of the next one
+        return datetime.datetime(year, month, day, tzinfo=tzinfo) + datetime.timedelta(days=1)
+    return datetime.datetime(year, month, day, hour, minute, second, microsecond, tzinfo)
+
+
+def parse(string):
+    """Return the datetime of an ISO 8601 string, ``None`` when it is not one or is out of range."""
+    match = PATTERN.fullmatch(string)
+    if match is None:
+        return None
+    try:
+        return build(match)
+    except (ValueError, OverflowError):
+        return None
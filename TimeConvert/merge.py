@@ -0,0 +1,120 @@
+"""
+Time-ordered merge of event streams recorded in different zones and formats.
+
+    merged = StreamMerge([
+        Stream(app_lines, key=lambda line: line[:19], timezone='Asia/Shanghai'),
+        Stream(edge_rows, key=itemgetter('time'), timezone='America/New_York', format='%d/%m/%Y %H:%M:%S'),
+        Stream(metrics, key=itemgetter(0), input='timestamp_ms'),
+    ], lateness=30)
+    for stamp, record in merged:
+        ...
+
+The key of each record is normalized by a compiled plan (``tc.compile``) to
+integer UTC epoch microseconds, and the streams are merged through a heap
+holding one head per stream, lazily: memory is O(number of streams), plus
+the records of each stream within its lateness window.
+
+Streams may be out of order by up to ``lateness`` seconds, a record being
+never earlier than ``lateness`` before the latest one of its stream; each
+stream is reordered in a bounded buffer before the merge. Records later
+than that are handled by the ``late`` policy, records whose key does not
+parse are skipped and counted.
+"""
+import heapq
+
+from .epoch import convert as convert_epoch
+from .plan import INPUTS
+
+
+LATE_POLICIES = ('raise', 'drop', 'emit')
+
+
+class Stream(object):
+    """An iterable of records, the zone and format of their keys.
+
+    :param records: iterable of records
+    :param key: function returning the time of a record, the record itself by default
+    :param timezone: time zone of naive times, the converter's by default
+    :param format: format of string times, ``'auto'`` to sniff it
+    :param input: kind of the times, ``str``, ``datetime``, ``date`` or ``timestamp``/``timestamp_ms``/``timestamp_us``/``timestamp_ns``
+    """
+    __slots__ = ('records', 'key', 'timezone', 'format', 'input')
+
+    def __init__(self, records, key=None, timezone=None, format=None, input='str'):
+        if input not in INPUTS:
+            raise ValueError('input must be one of %s, got %r' % (', '.join(INPUTS), input))
+        self.records = records
+        self.key = key
+        self.timezone = timezone
+        self.format = format
+        self.input = input
+
+    def __repr__(self):
+        return '%s(timezone=%r, format=%r, input=%r)' % (self.__class__.__name__, self.timezone, self.format, self.input)
+
+
+class StreamMerge(object):
+    """Iterable of the ``(stamp, record)`` of every stream in time order, ``stamp`` in UTC epoch ``unit``.
+
+    Records at the same time come in the order of their streams, then of
+    arrival. ``late`` is ``raise`` (ValueError), ``drop`` or ``emit`` (out
+    of order) for records later than ``lateness``; ``late`` and ``invalid``
+    count the records dropped or emitted late and the unparsable ones.
+    """
+
+    def __init__(self, streams, lateness=0, late='raise', unit='us', converter=None):
+        if late not in LATE_POLICIES:
+            raise ValueError('late must be one of %s, got %r' % (', '.join(LATE_POLICIES), late))
+        if converter is None:
+            from .convert import tc as converter
+        self.streams = [stream if isinstance(stream, Stream) else Stream(stream) for stream in streams]
+        self.lateness = int(lateness * 10 ** 6)
+        self.policy = late
+        self.unit = unit
+        self.converter = converter
+        self.late = 0
+        self.invalid = 0
+        # Checked now rather than at the first record
+        convert_epoch(0, 'us', unit)
+
+    def __repr__(self):
+        return '%s(%d streams, lateness=%r)' % (self.__class__.__name__, len(self.streams), self.lateness / 10 ** 6)
+
+    def __ordered(self, index, stream):
+        # (stamp, index, seq, record) of one stream in time order, reordered within the lateness window
+        plan = self.converter.compile(input=stream.input, input_format=stream.format, input_timezone=stream.timezone, to='utc', output='timestamp_us')
+        key, lateness = stream.key, self.lateness
+        pending, latest, emitted = [], None, None
+        for seq, record in enumerate(stream.records):
+            stamp = plan(record if key is None else key(record))
+            if stamp is None:
+                self.invalid += 1
+                continue
+            if emitted is not None and stamp < emitted:
+                # Earlier than a record already merged, beyond the lateness window
+                if self.policy == 'raise':
+                    raise ValueError('record %d of stream %d is more than %ss late' % (seq, index, lateness / 10 ** 6))
+                self.late += 1
+                if self.policy == 'drop':
+                    continue
+                yield stamp, index, seq, record
+                continue
+            heapq.heappush(pending, (stamp, index, seq, record))
+            latest = stamp if latest is None or stamp > latest else latest
+            # Records of this stream still to come are never earlier than ``latest - lateness``
+            while pending and pending[0][0] <= latest - lateness:
+                item = heapq.heappop(pending)
+                emitted = item[0]
+                yield item
+        while pending:
+            yield heapq.heappop(pending)
+
+    def __iter__(self):
+        unit = self.unit
+        for stamp, _, _, record in heapq.merge(*[self.__ordered(index, stream) for index, stream in enumerate(self.streams)]):
+            yield convert_epoch(stamp, 'us', unit), record
+
+
+def merge(streams, lateness=0, late='raise', unit='us', converter=None):
+    """Return the ``(stamp, record)`` of ``streams`` in time order, see ``StreamMerge``."""
+    return iter(StreamMerge(streams, lateness=lateness, late=late, unit=unit, converter=converter))
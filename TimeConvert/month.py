@@ -178,6 +178,24 @@ class Month(namedtuple('Month', ['year', 'month'])):
         else:
             return (self.year + 1) * 12 - self.month
 
+    def toordinal(self):
+        """Return the ordinal of the month, where January of year 1 has ordinal 1.
+        >>> Month(2015, 4).toordinal()
+        24172
+        """
+        return self.gregorian_month_number
+
+    @classmethod
+    def fromordinal(cls, ordinal):
+        """Return the Month corresponding to the ordinal, inverse of ``toordinal``.
+        >>> Month.fromordinal(24172)
+        Month(2015, 4)
+        """
+        if ordinal < 1:
+            raise ValueError('ordinal must be >= 1')
+        year, month = divmod(ordinal - 1, 12)
+        return cls(year + 1, month + 1)
+
     @property
     def dates(self):
         """Return a tuple of all days in the month.
@@ -0,0 +1,90 @@
+from .tzbackend import get_backend
+
+
+NAIVE = 'naive'
+UTC = 'utc'
+AWARE = 'aware'
+
+# Bound of the per tzinfo object cache, tzinfo objects built per value (parsed offsets) would grow it forever
+CACHE_SIZE = 1024
+
+
+class Normalizer(object):
+    """Brings naive, UTC and aware datetimes to UTC or to the wall clock of one time zone.
+
+    Each datetime is classified once, by its tzinfo, as ``NAIVE`` (wall-clock
+    time in ``timezone``), ``UTC`` or ``AWARE`` (any other zone); the
+    classification of a tzinfo object is cached, so that converting mixed
+    values costs no tzinfo lookup nor exception.
+    """
+
+    def __init__(self, timezone, tzinfo=None, backend=None):
+        """
+        :param timezone: name of the time zone of naive datetimes, and of local datetimes
+        :param tzinfo: tzinfo of ``timezone``, resolved with ``backend`` by default
+        :param backend: ``TZBackend`` or backend name, giving the UTC tzinfo, see ``TimeConvert.tzbackend``
+        """
+        self.timezone = timezone
+        self.backend = get_backend(backend)
+        self.utc = self.backend.utc
+        self.tzinfo = tzinfo or self.backend.gettz(timezone)
+        self.__tzname = str(self.tzinfo)
+        # id(tzinfo) -> (tzinfo, classification, is the local zone)
+        self.__kinds = {}
+
+    def __kind(self, tzinfo):
+        cached = self.__kinds.get(id(tzinfo))
+        if cached is not None and cached[0] is tzinfo:
+            return cached
+        if self.backend.is_utc(tzinfo):
+            kind = UTC
+        else:
+            kind = AWARE
+        if len(self.__kinds) >= CACHE_SIZE:
+            self.__kinds.clear()
+        cached = self.__kinds[id(tzinfo)] = (tzinfo, kind, tzinfo is self.tzinfo or str(tzinfo) == self.__tzname)
+        return cached
+
+    def classify(self, dt):
+        """Return ``NAIVE``, ``UTC`` or ``AWARE``."""
+        tzinfo = dt.tzinfo
+        if tzinfo is None or dt.utcoffset() is None:
+            return NAIVE
+        return self.__kind(tzinfo)[1]
+
+    def to_utc(self, dt):
+        """Return the datetime as an aware UTC datetime, naive datetimes being wall-clock time in ``timezone``."""
+        tzinfo = dt.tzinfo
+        if tzinfo is None:
+            return dt.replace(tzinfo=self.tzinfo).astimezone(self.utc)
+        if self.__kind(tzinfo)[1] == UTC:
+            return dt if tzinfo == self.utc else dt.replace(tzinfo=self.utc)
+        if dt.utcoffset() is None:
+            return dt.replace(tzinfo=self.tzinfo).astimezone(self.utc)
+        return dt.astimezone(self.utc)
+
+    def to_local(self, dt):
+        """Return the datetime as an aware datetime in ``timezone``, naive datetimes being wall-clock time there already."""
+        tzinfo = dt.tzinfo
+        if tzinfo is None or dt.utcoffset() is None:
+            return dt.replace(tzinfo=self.tzinfo)
+        if self.__kind(tzinfo)[2]:
+            return dt
+        return dt.astimezone(self.tzinfo)
+
+    def to_naive(self, dt):
+        """Return the wall-clock time in ``timezone`` of an aware datetime, naive datetimes are returned as is."""
+        tzinfo = dt.tzinfo
+        if tzinfo is None or dt.utcoffset() is None:
+            return dt
+        if self.__kind(tzinfo)[2]:
+            return dt.replace(tzinfo=None)
+        return dt.astimezone(self.tzinfo).replace(tzinfo=None)
+
+    def to_utc_many(self, values):
+        to_utc = self.to_utc
+        return [to_utc(dt) for dt in values]
+
+    def to_local_many(self, values):
+        to_local = self.to_local
+        return [to_local(dt) for dt in values]
@@ -0,0 +1,180 @@
+"""
+Conversion plans: a whole conversion chain resolved once, applied to many values.
+
+    plan = tc.compile(input='str', to='local', timezone='Asia/Shanghai', shift={'days': 1}, output='timestamp_ms')
+    plan('2017-12-08 15:27:00')
+    plan.map(column)
+
+Formats, time zones, the shift and the output formatter are resolved by
+``compile``; calling the plan runs only the steps it needs, without keyword
+forwarding nor type checks. Values which do not parse, and ``None``, give ``None``.
+"""
+import datetime
+from itertools import chain, islice
+
+from dateutil.relativedelta import relativedelta
+
+from .epoch import from_datetime, microseconds_to, per_second, to_datetime
+from .isoweek import ISOWeek
+from .month import Month
+from .quarter import Quarter
+from .sniff import SNIFF, StreamParser
+from .zonetable import EPOCH_ORDINAL, SECONDS_PER_DAY
+
+
+INPUTS = ('str', 'datetime', 'date', 'timestamp', 'timestamp_ms', 'timestamp_us', 'timestamp_ns')
+TARGETS = ('local', 'utc')
+OUTPUTS = ('datetime', 'naive', 'date', 'string', 'isostring', 'timestamp', 'timestamp_ms', 'timestamp_us', 'timestamp_ns', 'isoweek', 'month', 'quarter')
+SHIFT_KEYS = ('years', 'months', 'weeks', 'days', 'hours', 'minutes', 'seconds', 'milliseconds', 'microseconds')
+
+# Epoch unit of the timestamp inputs and outputs
+_UNITS = {
+    'timestamp': 's',
+    'timestamp_ms': 'ms',
+    'timestamp_us': 'us',
+    'timestamp_ns': 'ns',
+}
+
+
+def _check(name, value, choices):
+    if value not in choices:
+        raise ValueError('%s must be one of %s, got %r' % (name, ', '.join(choices), value))
+
+
+class Plan(object):
+    """Compiled conversion of one kind of input to one kind of output, see ``TimeConvertTools.compile``."""
+
+    def __init__(self, converter, input='str', input_format=None, input_timezone=None, to='local', timezone=None, shift=None, output='datetime', output_format=None):
+        _check('input', input, INPUTS)
+        _check('to', to, TARGETS)
+        _check('output', output, OUTPUTS)
+        shift = dict(shift or {})
+        for key in shift:
+            _check('shift key', key, SHIFT_KEYS)
+        self.input = input
+        self.to = to
+        self.timezone = converter.timezone(timezone)
+        # Naive inputs are wall-clock time in ``input_timezone``, the local time zone by default
+        self.input_timezone = converter.timezone(input_timezone or timezone)
+        self.shift = shift
+        self.output = output
+        # Layout of the strings sniffed from the first values mapped, or from the first one called with
+        self.parser = StreamParser() if input == 'str' and input_format == SNIFF else None
+        # Datetimes, sniffed strings and strings parsed with an offset directive may be aware, instants then
+        self.naive = input != 'datetime' and self.parser is None and not (input == 'str' and any(directive in converter.format(input_format) for directive in ('%z', '%Z')))
+        if output in _UNITS and input in ('str', 'date', 'datetime') and not any(shift.values()):
+            # Epochs of wall-clock times straight from the zone table, no aware datetime in between
+            steps = (self.__parse_step(converter, input, input_format), self.__epoch_step(converter, input, output))
+        else:
+            steps = (
+                self.__parse_step(converter, input, input_format),
+                self.__zone_step(converter, input, to),
+                self.__shift_step(shift),
+                self.__output_step(converter, output, output_format),
+            )
+        self.steps = tuple(step for step in steps if step is not None)
+
+    def __repr__(self):
+        return '%s(input=%r, to=%r, timezone=%r, output=%r)' % (self.__class__.__name__, self.input, self.to, self.timezone, self.output)
+
+    # STEPS
+
+    def __parse_step(self, converter, input, input_format):
+        if self.parser is not None:
+            return self.parser.parse
+        if input == 'str':
+            format = converter.format(input_format)
+            strptime = datetime.datetime.strptime
+
+            def parse(string):
+                try:
+                    return strptime(string, format)
+                except ValueError:
+                    return None
+            return parse
+        if input == 'date':
+            combine, midnight = datetime.datetime.combine, datetime.time()
+            return lambda date: combine(date, midnight)
+        return None
+
+    def __zone_step(self, converter, input, to):
+        tzinfo = converter.tz_backend.utc if to == 'utc' else converter.tzinfo(self.timezone)
+        if input in _UNITS:
+            unit = _UNITS[input]
+            if unit == 's':
+                fromtimestamp = datetime.datetime.fromtimestamp
+                return lambda stamp: fromtimestamp(stamp, tzinfo)
+            return lambda stamp: to_datetime(stamp, unit, tzinfo)
+        input_tzinfo = converter.tz_backend.utc if self.input_timezone == 'UTC' else converter.tzinfo(self.input_timezone)
+        if input_tzinfo is tzinfo:
+            def localize(dt):
+                return dt.replace(tzinfo=tzinfo)
+        else:
+            def localize(dt):
+                return dt.replace(tzinfo=input_tzinfo).astimezone(tzinfo)
+        if self.naive:
+            return localize
+        return lambda dt: localize(dt) if dt.tzinfo is None else dt.astimezone(tzinfo)
+
+    def __epoch_step(self, converter, input, output):
+        unit = _UNITS[output]
+        units = per_second(unit)
+        table = converter.zone_table(self.input_timezone)
+        utc_stamp, utcoffset = table.utc_stamp, table.utcoffset
+        pep495_gaps = converter.tz_backend.pep495_gaps
+
+        def epoch(dt):
+            wall = (dt.toordinal() - EPOCH_ORDINAL) * SECONDS_PER_DAY + dt.hour * 3600 + dt.minute * 60 + dt.second
+            stamp = utc_stamp(wall)
+            if not pep495_gaps:
+                offset = utcoffset(stamp)
+                if stamp + offset != wall:
+                    # Inside a gap, dateutil (and so the datetime steps) applies the offset after it
+                    stamp = wall - offset
+            return stamp * units + microseconds_to(dt.microsecond, unit)
+        if self.naive:
+            return epoch
+        return lambda dt: epoch(dt) if dt.tzinfo is None else from_datetime(dt, unit)
+
+    def __shift_step(self, shift):
+        if not any(shift.values()):
+            return None
+        delta = datetime.timedelta(**{key: value for key, value in shift.items() if key not in ('years', 'months')})
+        if shift.get('years') or shift.get('months'):
+            delta = relativedelta(years=shift.get('years', 0), months=shift.get('months', 0)) + delta
+        return lambda dt: dt + delta
+
+    def __output_step(self, converter, output, output_format):
+        if output in _UNITS:
+            unit = _UNITS[output]
+            return lambda dt: from_datetime(dt, unit)
+        if output in ('string', 'isostring'):
+            format = converter.format(output_format) if output == 'string' else converter.isoformat(output_format)
+            return lambda dt: dt.strftime(format)
+        return {
+            'datetime': None,
+            'naive': lambda dt: dt.replace(tzinfo=None),
+            'date': lambda dt: dt.date(),
+            'isoweek': ISOWeek.withdate,
+            'month': Month.from_date,
+            'quarter': Quarter.from_date,
+        }[output]
+
+    # CALL
+
+    def __call__(self, value):
+        for step in self.steps:
+            if value is None:
+                return None
+            value = step(value)
+        return value
+
+    def map(self, values):
+        """Return the list of the converted values."""
+        if self.parser is not None and self.parser.layout is None:
+            values = iter(values)
+            head = list(islice(values, self.parser.sample))
+            self.parser.sniff(head)
+            values = chain(head, values)
+        call = self.__call__
+        return [call(value) for value in values]
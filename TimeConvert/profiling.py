@@ -0,0 +1,149 @@
+"""
+Opt-in instrumentation of TimeConvertTools, attributing time to the stages of a call chain.
+
+    from TimeConvert import profile
+
+    with profile() as profiler:
+        tc.utc_yearweek(mode=0)
+    print(profiler.report().pretty_print())
+
+Or set ``TIMECONVERT_PROFILE=1`` to profile the whole process and print the report at exit.
+
+Profiling wraps the stage methods of ``TimeConvertTools`` while it is enabled, and
+restores them afterwards: nothing is wrapped, and nothing costs, while it is off.
+The methods are wrapped on the class, so a profiler records the calls of every
+thread of the process, and only one profiler can be started at a time.
+"""
+import atexit
+import functools
+import os
+import sys
+import threading
+import time
+
+from .stopwatch import StopWatch, TimeType
+
+
+PROFILE_ENV = 'TIMECONVERT_PROFILE'
+
+# Methods of TimeConvertTools timed as each stage, private methods with their mangled name
+STAGES = {
+    'parse': ('string_to_datetime', ),
+    'validate': ('validate_string', ),
+    'tz': ('tzinfo', 'normalizer', 'zone_table', '_TimeConvertTools__to_utc_datetime', '_TimeConvertTools__to_local_datetime'),
+    'now': ('basic_utc_datetime', 'basic_local_datetime'),
+    'shift': ('several_time_coming', 'several_time_ago', '_TimeConvertTools__relativedelta'),
+    'format': ('datetime_to_string', 'datetime_to_unicode_string'),
+    'epoch': ('datetime_to_timestamp', 'structime_to_timestamp', 'timestamp_to_datetime', 'timestamp_to_utc_datetime', 'timestamp_to_local_datetime'),
+}
+
+
+class Profiler(object):
+    """Per-stage call counters and nanoseconds of TimeConvertTools.
+
+    ``counts`` is the number of calls of each stage, ``nanoseconds`` the time
+    spent in each stage including the stages it calls, ``self_nanoseconds`` the
+    time spent in each stage itself, which adds up across stages.
+
+    Calls are recorded process-wide, from every thread; starting a profiler
+    while another one is started raises RuntimeError.
+    """
+    # The started profiler, whose wrappers are installed on TimeConvertTools
+    _active = None
+    _active_lock = threading.Lock()
+
+    def __init__(self, stages=None):
+        self.stages = stages or STAGES
+        self.counts = dict.fromkeys(self.stages, 0)
+        self.nanoseconds = dict.fromkeys(self.stages, 0)
+        self.self_nanoseconds = dict.fromkeys(self.stages, 0)
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+        self.__originals = []
+
+    def __wrap(self, stage, func):
+        local = self.__local
+        lock = self.__lock
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Stack of [stage, nanoseconds spent in nested stages] of the current thread
+            stack = local.__dict__.setdefault('stack', [])
+            outermost = all(frame[0] != stage for frame in stack)
+            frame = [stage, 0]
+            stack.append(frame)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter_ns() - start
+                stack.pop()
+                if stack:
+                    stack[-1][1] += elapsed
+                with lock:
+                    self.counts[stage] += 1
+                    self.self_nanoseconds[stage] += elapsed - frame[1]
+                    if outermost:
+                        self.nanoseconds[stage] += elapsed
+        return wrapper
+
+    @property
+    def enabled(self):
+        return bool(self.__originals)
+
+    def start(self):
+        """Wrap the stage methods, until ``stop``."""
+        from .convert import TimeConvertTools
+        with Profiler._active_lock:
+            if self.enabled:
+                raise RuntimeError('Profiler is already started')
+            if Profiler._active is not None:
+                raise RuntimeError('Another profiler is started, stop it first')
+            Profiler._active = self
+            for stage, names in self.stages.items():
+                for name in names:
+                    original = TimeConvertTools.__dict__[name]
+                    self.__originals.append((TimeConvertTools, name, original))
+                    setattr(TimeConvertTools, name, self.__wrap(stage, original))
+        return self
+
+    def stop(self):
+        """Restore the stage methods."""
+        with Profiler._active_lock:
+            while self.__originals:
+                cls, name, original = self.__originals.pop()
+                setattr(cls, name, original)
+            if Profiler._active is self:
+                Profiler._active = None
+        return self
+
+    def reset(self):
+        with self.__lock:
+            for stage in self.stages:
+                self.counts[stage] = self.nanoseconds[stage] = self.self_nanoseconds[stage] = 0
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def report(self, unique_id='TimeConvert', time_type=TimeType.millisecond):
+        """Return a StopWatch holding one task per stage called, timed with the stage's own time."""
+        stopwatch = StopWatch(unique_id, time_type=time_type)
+        for stage in self.stages:
+            if self.counts[stage]:
+                stopwatch.add_task('%s (%d calls)' % (stage, self.counts[stage]), self.self_nanoseconds[stage] / 1e9)
+        return stopwatch
+
+
+def profile(stages=None):
+    """Return a Profiler, to be used as a context manager."""
+    return Profiler(stages)
+
+
+PROFILER = None
+
+if os.environ.get(PROFILE_ENV, '') not in ('', '0'):
+    PROFILER = Profiler().start()
+    atexit.register(lambda: sys.stderr.write(PROFILER.report().pretty_print() + '\n'))
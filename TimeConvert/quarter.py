@@ -1,27 +1,35 @@
+import calendar
 import datetime
-import math
 from collections import namedtuple
 
 
 def get_quarter_start_date(year, quarter):
-    return {
-        1: datetime.date(year, 1, 1),
-        2: datetime.date(year, 4, 1),
-        3: datetime.date(year, 7, 1),
-        4: datetime.date(year, 10, 1),
-    }.get(quarter)
+    if quarter < 1 or quarter > 4:
+        return None
+    return datetime.date(year, quarter * 3 - 2, 1)
 
 
 def get_quarter_end_date(year, quarter):
-    return {
-        1: datetime.date(year, 3, 31),
-        2: datetime.date(year, 6, 30),
-        3: datetime.date(year, 9, 30),
-        4: datetime.date(year, 12, 31),
-    }.get(quarter)
+    if quarter < 1 or quarter > 4:
+        return None
+    # Q1 and Q4 end on the 31st, Q2 and Q3 on the 30th
+    return datetime.date(year, quarter * 3, 31 if quarter in (1, 4) else 30)
+
+
+def _coerce_ordinal(value, from_date):
+    """Return the quarter ordinal of a Quarter-like value or of a date."""
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        value = from_date(value)
+    return value.toordinal()
 
 
 class Quarter(namedtuple('Quarter', ('year', 'quarter'))):
+    """A Quarter represents a calendar quarter of three months.
+
+    Quarter 1 starts on January 1st, quarter 4 ends on December 31st.
+    Boundaries and ordinals are computed arithmetically, no lookup tables
+    are built per call.
+    """
     __slots__ = ()
 
     def __new__(cls, year, quarter):
@@ -59,12 +67,49 @@ class Quarter(namedtuple('Quarter', ('year', 'quarter'))):
         else:
             return (self.year + 1) * 4 - self.quarter
 
+    def toordinal(self):
+        """Return the ordinal of the quarter, where the first quarter of year 1 has ordinal 1."""
+        return self.gregorian_quarter_number
+
+    @classmethod
+    def fromordinal(cls, ordinal):
+        """Return the quarter corresponding to the ordinal, inverse of ``toordinal``."""
+        if ordinal < 1:
+            raise ValueError('ordinal must be >= 1')
+        year, quarter = divmod(ordinal - 1, 4)
+        return cls(year + 1, quarter + 1)
+
     @classmethod
     def from_date(cls, date):
-        return cls(*(date.year, int(math.ceil(date.month / 3))))
+        return cls(date.year, (date.month + 2) // 3)
 
     withdate = fromdate = from_date
 
+    @classmethod
+    def from_dates(cls, dates):
+        """Return a list with the quarter of each date (or datetime) in ``dates``."""
+        make = cls._make
+        return [make((date.year, (date.month + 2) // 3)) for date in dates]
+
+    @classmethod
+    def quarter_range(cls, start, end):
+        """Return an iterator over the quarters from ``start`` to ``end``, inclusively.
+
+        ``start`` and ``end`` are either quarters or dates.
+        """
+        for ordinal in range(_coerce_ordinal(start, cls.from_date), _coerce_ordinal(end, cls.from_date) + 1):
+            yield cls.fromordinal(ordinal)
+
+    @classmethod
+    def quarters_of_year(cls, year):
+        """Return an iterator over the four quarters of the given year."""
+        for quarter in range(1, 5):
+            yield cls(year, quarter)
+
+    def contains(self, day):
+        """Check if the given datetime.date falls within the quarter"""
+        return day.year == self.year and (day.month + 2) // 3 == self.quarter
+
     @property
     def start_date(self):
         return get_quarter_start_date(self.year, self.quarter)
@@ -75,3 +120,113 @@ class Quarter(namedtuple('Quarter', ('year', 'quarter'))):
 
     startdate = start_date
     enddate = end_date
+
+
+class FiscalQuarter(namedtuple('FiscalQuarter', ('year', 'quarter', 'start_month'))):
+    """A quarter of a fiscal year starting on the first day of ``start_month``.
+
+    A fiscal year is named after the calendar year in which it ends, e.g. with
+    ``start_month=10`` the fiscal year 2024 runs from 2023-10-01 to 2024-09-30
+    and ``FiscalQuarter(2024, 1, 10)`` is October to December 2023.
+    ``start_month=1`` makes fiscal quarters identical to calendar quarters.
+    """
+    __slots__ = ()
+
+    def __new__(cls, year, quarter, start_month=1):
+        if start_month < 1 or start_month > 12:
+            raise ValueError('start_month must be 1-12')
+        if quarter < 1 or quarter > 4:
+            return cls(year, 1, start_month) + (quarter - 1)
+        if year < 1 or year > 9999:
+            raise ValueError('year is out of range')
+        return super(FiscalQuarter, cls).__new__(cls, year, quarter, start_month)
+
+    def __str__(self):
+        return 'FY%04dQ%01d' % (self.year, self.quarter)
+
+    isoformat = __str__
+
+    def __repr__(self):
+        return __name__ + '.' + self.__class__.__name__ + '(%d, %d, %d)' % self
+
+    def __add__(self, other):
+        if not isinstance(other, int):
+            raise TypeError('Only ints can be added to quarter')
+
+        year_change, quarter = divmod(self.quarter + other - 1, 4)
+        return type(self)(self.year + year_change, quarter + 1, self.start_month)
+
+    def __sub__(self, other):
+        if isinstance(other, int):
+            return self + (-other)
+
+        if self.start_month != other.start_month:
+            raise ValueError('Cannot subtract fiscal quarters with different start months')
+        return self.toordinal() - other.toordinal()
+
+    def toordinal(self):
+        """Return the ordinal of the quarter, where the first quarter of fiscal year 1 has ordinal 1."""
+        return (self.year - 1) * 4 + self.quarter
+
+    @classmethod
+    def fromordinal(cls, ordinal, start_month=1):
+        """Return the fiscal quarter corresponding to the ordinal, inverse of ``toordinal``."""
+        if ordinal < 1:
+            raise ValueError('ordinal must be >= 1')
+        year, quarter = divmod(ordinal - 1, 4)
+        return cls(year + 1, quarter + 1, start_month)
+
+    @classmethod
+    def from_date(cls, date, start_month=1):
+        months = date.month - start_month
+        # Months before ``start_month`` belong to the fiscal year ending this calendar year
+        year = date.year + (1 if start_month > 1 and months >= 0 else 0)
+        return cls(year, months % 12 // 3 + 1, start_month)
+
+    withdate = fromdate = from_date
+
+    @classmethod
+    def from_dates(cls, dates, start_month=1):
+        """Return a list with the fiscal quarter of each date (or datetime) in ``dates``."""
+        if start_month < 1 or start_month > 12:
+            raise ValueError('start_month must be 1-12')
+        make = cls._make
+        shift = 1 if start_month > 1 else 0
+        quarters = []
+        for date in dates:
+            months = date.month - start_month
+            quarters.append(make((date.year + (shift if months >= 0 else 0), months % 12 // 3 + 1, start_month)))
+        return quarters
+
+    @classmethod
+    def quarter_range(cls, start, end, start_month=1):
+        """Return an iterator over the fiscal quarters from ``start`` to ``end``, inclusively.
+
+        ``start`` and ``end`` are either fiscal quarters or dates.
+        """
+        def from_date(date):
+            return cls.from_date(date, start_month)
+
+        for ordinal in range(_coerce_ordinal(start, from_date), _coerce_ordinal(end, from_date) + 1):
+            yield cls.fromordinal(ordinal, start_month)
+
+    def contains(self, day):
+        """Check if the given datetime.date falls within the fiscal quarter"""
+        return type(self).from_date(day, self.start_month) == self
+
+    def _start_month_index(self):
+        # Months since January of year 0 for the first month of the quarter
+        return (self.year - (1 if self.start_month > 1 else 0)) * 12 + self.start_month - 1 + (self.quarter - 1) * 3
+
+    @property
+    def start_date(self):
+        year, month = divmod(self._start_month_index(), 12)
+        return datetime.date(year, month + 1, 1)
+
+    @property
+    def end_date(self):
+        year, month = divmod(self._start_month_index() + 2, 12)
+        return datetime.date(year, month + 1, calendar.monthrange(year, month + 1)[1])
+
+    startdate = start_date
+    enddate = end_date
@@ -0,0 +1,314 @@
+import abc
+import datetime
+from array import array
+
+from .isoweek import ISOWeek
+from .month import Month
+from .quarter import FiscalQuarter, Quarter
+from .zonetable import EPOCH_ORDINAL, SECONDS_PER_DAY
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def _first_day_ordinal(month_index):
+    """Return the ordinal of the first day of the month ``month_index`` months after January of year 0."""
+    year, month = divmod(month_index, 12)
+    # Count years from March so that the leap day is the last day of the year
+    if month < 2:
+        year -= 1
+        month += 12
+    return 365 * year + year // 4 - year // 100 + year // 400 + (153 * (month - 2) + 2) // 5 - 305
+
+
+# ``return_type`` of the range methods producing arrays instead of range objects
+ARRAY_RETURN_TYPES = {
+    'ordinal': 'to_ordinals',
+    'epoch': 'to_epochs',
+    'datetime64': 'to_datetime64',
+}
+
+
+def _arange(ordinals):
+    return np.arange(ordinals.start, ordinals.stop, ordinals.step, dtype=np.int64)
+
+
+class PeriodRange(abc.ABC):
+    """Lazy sequence of consecutive periods, behaving like the builtin ``range``.
+
+    Periods are stored as a ``range`` of ordinals, so ``len``, indexing,
+    slicing, ``in`` and ``reversed`` are O(1) and no element is created before
+    it is accessed. With ``return_type`` ``'string'`` (or ``'str'``) elements
+    are rendered with ``format`` on access.
+    """
+    __slots__ = ('ordinals', 'return_type', 'format')
+
+    def __init__(self, start, stop, step=1, return_type=None, format=None):
+        """
+        :param start: ordinal of the first period
+        :param stop: ordinal of the period after the last one, exclusive like ``range``
+        :param step: number of periods between two elements
+        """
+        self.ordinals = range(start, stop, step)
+        self.return_type = return_type
+        self.format = format
+
+    def _new(self, ordinals):
+        other = object.__new__(type(self))
+        other.ordinals = ordinals
+        other.return_type = self.return_type
+        other.format = self.format
+        return other
+
+    @property
+    def is_string(self):
+        return self.return_type in ['string', 'str']
+
+    @abc.abstractmethod
+    def _item(self, ordinal):
+        """Return the element of the ordinal ``ordinal``."""
+
+    @abc.abstractmethod
+    def _ordinal(self, value):
+        """Return the ordinal of a period, ``None`` for values of another type."""
+
+    # ARRAY
+
+    def to_array(self, kind='ordinal'):
+        """Return the first day of each element as an array, ``kind`` is one of ``ARRAY_RETURN_TYPES``."""
+        if kind not in ARRAY_RETURN_TYPES:
+            raise ValueError('kind must be one of %s, got %r' % (', '.join(ARRAY_RETURN_TYPES), kind))
+        return getattr(self, ARRAY_RETURN_TYPES[kind])()
+
+    @abc.abstractmethod
+    def _day_ordinals(self):
+        """Return the ordinals of the first day of each element, as an iterable of ints."""
+
+    @abc.abstractmethod
+    def _days(self):
+        """Return the days since 1970-01-01 of the first day of each element, as an int64 NumPy array."""
+
+    def to_ordinals(self):
+        """Return the proleptic Gregorian ordinals of the first day of each element as an ``array('i')``."""
+        return array('i', self._day_ordinals())
+
+    def to_epochs(self):
+        """Return the UTC epoch seconds of midnight of the first day of each element as an ``array('q')``."""
+        days = self._day_ordinals()
+        if isinstance(days, range):
+            return array('q', range((days.start - EPOCH_ORDINAL) * SECONDS_PER_DAY, (days.stop - EPOCH_ORDINAL) * SECONDS_PER_DAY, days.step * SECONDS_PER_DAY))
+        return array('q', ((day - EPOCH_ORDINAL) * SECONDS_PER_DAY for day in days))
+
+    def to_datetime64(self):
+        """Return the first day of each element as a NumPy ``datetime64[D]`` array."""
+        if np is None:
+            raise ImportError('to_datetime64 requires numpy')
+        return self._days().astype('datetime64[D]')
+
+    def __len__(self):
+        return len(self.ordinals)
+
+    def __bool__(self):
+        return bool(self.ordinals)
+
+    def __iter__(self):
+        return map(self._item, self.ordinals)
+
+    def __reversed__(self):
+        return map(self._item, reversed(self.ordinals))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._new(self.ordinals[index])
+        return self._item(self.ordinals[index])
+
+    def __contains__(self, value):
+        ordinal = self._ordinal(value)
+        return ordinal is not None and ordinal in self.ordinals
+
+    def index(self, value):
+        """Return the position of ``value``, raise ValueError if it is not in the range."""
+        ordinal = self._ordinal(value)
+        if ordinal is None or ordinal not in self.ordinals:
+            raise ValueError('%r is not in range' % (value, ))
+        return self.ordinals.index(ordinal)
+
+    def count(self, value):
+        return int(value in self)
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        return (self.ordinals, self.return_type, self.format) == (other.ordinals, other.return_type, other.format)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return hash((type(self), self.ordinals, self.return_type, self.format))
+
+    def __repr__(self):
+        if not self.ordinals:
+            return '%s()' % self.__class__.__name__
+        start, last = self._item(self.ordinals[0]), self._item(self.ordinals[-1])
+        return '%s(%r, %r, step=%d, len=%d)' % (self.__class__.__name__, start, last, self.ordinals.step, len(self))
+
+
+class DateRange(PeriodRange):
+    """Range of ``datetime.date``, ordinals are ``datetime.date.toordinal``.
+
+    With ``time``, a ``datetime.time``, elements are the datetimes at that
+    time of day, as ``date_range`` gives for datetime bounds.
+    """
+    __slots__ = ('time', )
+
+    def __init__(self, start, stop, step=1, return_type=None, format=None, time=None):
+        super(DateRange, self).__init__(start, stop, step=step, return_type=return_type, format=format)
+        self.time = time
+
+    def _new(self, ordinals):
+        other = super(DateRange, self)._new(ordinals)
+        other.time = self.time
+        return other
+
+    def _day_ordinals(self):
+        return self.ordinals
+
+    def _days(self):
+        return _arange(self.ordinals) - EPOCH_ORDINAL
+
+    def _item(self, ordinal):
+        date = datetime.date.fromordinal(ordinal)
+        if self.time is not None:
+            date = datetime.datetime.combine(date, self.time)
+        return date.strftime(self.format) if self.is_string else date
+
+    def _ordinal(self, value):
+        if isinstance(value, datetime.date):
+            if self.time is not None and (not isinstance(value, datetime.datetime) or value.timetz() != self.time):
+                return None
+            return value.toordinal()
+        if isinstance(value, str) and self.is_string:
+            try:
+                return datetime.datetime.strptime(value, self.format).toordinal()
+            except ValueError:
+                return None
+        return None
+
+    def __eq__(self, other):
+        equal = super(DateRange, self).__eq__(other)
+        return equal if equal is NotImplemented else equal and self.time == other.time
+
+    def __hash__(self):
+        return hash((super(DateRange, self).__hash__(), self.time))
+
+
+class WeekRange(PeriodRange):
+    """Range of ``ISOWeek``, ordinals are ``ISOWeek.toordinal``."""
+    __slots__ = ()
+
+    def _day_ordinals(self):
+        # Monday of week ``n`` has ordinal ``(n - 1) * 7 + 1``
+        ordinals = self.ordinals
+        start = (ordinals.start - 1) * 7 + 1
+        return range(start, start + len(ordinals) * ordinals.step * 7, ordinals.step * 7)
+
+    def _days(self):
+        return (_arange(self.ordinals) - 1) * 7 + 1 - EPOCH_ORDINAL
+
+    def _item(self, ordinal):
+        week = ISOWeek.fromordinal(ordinal)
+        if not self.is_string:
+            return week
+        monday = datetime.date.fromordinal((ordinal - 1) * 7 + 1)
+        return {
+            'week': week.isoformat(),
+            'start': monday.strftime(self.format),
+            'end': (monday + datetime.timedelta(6)).strftime(self.format),
+        }
+
+    def _ordinal(self, value):
+        return value.toordinal() if isinstance(value, ISOWeek) else None
+
+
+class _MonthBasedRange(PeriodRange):
+    """Range of periods starting on the first day of a month."""
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def _month_indexes(self):
+        """Return the months since January of year 0 of the first month of each element, as a ``range``."""
+
+    def _day_ordinals(self):
+        return map(_first_day_ordinal, self._month_indexes())
+
+    def _days(self):
+        return (_arange(self._month_indexes()) - 1970 * 12).astype('datetime64[M]').astype('datetime64[D]').astype(np.int64)
+
+
+class MonthRange(_MonthBasedRange):
+    """Range of ``Month``, ordinals are ``Month.toordinal``."""
+    __slots__ = ()
+
+    def _month_indexes(self):
+        ordinals = self.ordinals
+        return range(ordinals.start + 11, ordinals.stop + 11, ordinals.step)
+
+    def _item(self, ordinal):
+        month = Month.fromordinal(ordinal)
+        if not self.is_string:
+            return month
+        return {
+            'month': str(month),
+            'start': month.start_date.strftime(self.format),
+            'end': month.end_date.strftime(self.format),
+        }
+
+    def _ordinal(self, value):
+        return value.toordinal() if isinstance(value, Month) else None
+
+
+class QuarterRange(_MonthBasedRange):
+    """Range of ``Quarter``, or of ``FiscalQuarter`` when ``start_month`` is not January."""
+    __slots__ = ('start_month', )
+
+    def __init__(self, start, stop, step=1, return_type=None, format=None, start_month=1):
+        super(QuarterRange, self).__init__(start, stop, step=step, return_type=return_type, format=format)
+        self.start_month = start_month
+
+    def _new(self, ordinals):
+        other = super(QuarterRange, self)._new(ordinals)
+        other.start_month = self.start_month
+        return other
+
+    def _month_indexes(self):
+        # See ``FiscalQuarter._start_month_index``, fiscal years starting in January are calendar years
+        ordinals = self.ordinals
+        base = (12 if self.start_month == 1 else 0) + self.start_month - 1 - 3
+        return range(ordinals.start * 3 + base, ordinals.stop * 3 + base, ordinals.step * 3)
+
+    def _item(self, ordinal):
+        quarter = FiscalQuarter.fromordinal(ordinal, self.start_month) if self.start_month != 1 else Quarter.fromordinal(ordinal)
+        if not self.is_string:
+            return quarter
+        return {
+            'quarter': quarter.isoformat(),
+            'start': quarter.start_date.strftime(self.format),
+            'end': quarter.end_date.strftime(self.format),
+        }
+
+    def _ordinal(self, value):
+        if self.start_month != 1:
+            return value.toordinal() if isinstance(value, FiscalQuarter) and value.start_month == self.start_month else None
+        return value.toordinal() if isinstance(value, Quarter) else None
+
+    def __eq__(self, other):
+        equal = super(QuarterRange, self).__eq__(other)
+        return equal if equal is NotImplemented else equal and self.start_month == other.start_month
+
+    def __hash__(self):
+        return hash((super(QuarterRange, self).__hash__(), self.start_month))
@@ -0,0 +1,150 @@
+"""
+Format inference for columns of date/time strings.
+
+``sniff`` tries a catalogue of common layouts on the first values of a
+column and returns the one matching most of them. ``StreamParser`` locks in
+that layout for the rest of the stream, trying the other layouts only for
+values which do not match it.
+
+    parser = StreamParser()
+    dts = parser.parse_many(column)
+"""
+import datetime
+import re
+from itertools import chain, islice
+
+from dateutil.tz import tz
+
+from . import iso8601
+from .epoch import to_datetime
+
+
+# Values sampled to choose a layout
+SAMPLE_SIZE = 100
+
+# ``input_format`` of ``TimeConvertTools.compile`` sniffing the layout
+SNIFF = 'auto'
+
+
+def _wall(match):
+    return datetime.datetime(*map(int, match.groups()))
+
+
+def _epoch(unit):
+    def build(match):
+        integer = match.group(1)
+        fraction = match.group(2) if match.re.groups > 1 else None
+        if not fraction:
+            return to_datetime(int(integer), unit, tz.UTC)
+        microseconds = int(fraction.ljust(6, '0'))
+        return to_datetime(int(integer) * 10 ** 6 + (-microseconds if integer[0] == '-' else microseconds), 'us', tz.UTC)
+    return build
+
+
+def _build(layout, match):
+    try:
+        return layout.build(match)
+    except (ValueError, OverflowError):
+        return None
+
+
+class Layout(object):
+    """A layout of date/time strings: its pattern, how to build the datetime, and its ``strptime`` format if any."""
+    __slots__ = ('name', 'pattern', 'build', 'format')
+
+    def __init__(self, name, pattern, build, format=None):
+        self.name = name
+        self.pattern = re.compile(pattern)
+        self.build = build
+        self.format = format
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self.name)
+
+    def match(self, string):
+        return self.pattern.fullmatch(string)
+
+    def parse(self, string):
+        """Return the datetime of ``string``, ``None`` when it does not match or is out of range."""
+        match = self.pattern.fullmatch(string)
+        return None if match is None else _build(self, match)
+
+
+# Fastest and most common first, ISO 8601 after the layouts its basic format overlaps;
+# naive wall-clock datetimes, aware ones for offsets and epochs (UTC)
+CATALOGUE = (
+    Layout('datetime', r'(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})', _wall, '%Y-%m-%d %H:%M:%S'),
+    Layout('date', r'(\d{4})-(\d{2})-(\d{2})', _wall, '%Y-%m-%d'),
+    Layout('compact_datetime', r'(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})(\d{2})', _wall, '%Y%m%d%H%M%S'),
+    Layout('compact_date', r'(\d{4})(\d{2})(\d{2})', _wall, '%Y%m%d'),
+    Layout('slash_datetime', r'(\d{4})/(\d{2})/(\d{2}) (\d{2}):(\d{2}):(\d{2})', _wall, '%Y/%m/%d %H:%M:%S'),
+    Layout('slash_date', r'(\d{4})/(\d{2})/(\d{2})', _wall, '%Y/%m/%d'),
+    # Any other ISO 8601 shape: ``T``, fractions, offsets, week and ordinal dates
+    Layout('iso8601', iso8601.PATTERN, iso8601.build),
+    Layout('epoch_us', r'(-?\d{16})', _epoch('us')),
+    Layout('epoch_ms', r'(-?\d{13})', _epoch('ms')),
+    Layout('epoch_s', r'(-?\d{9,10})(?:\.(\d{1,6}))?', _epoch('s')),
+)
+
+
+def sniff(values, layouts=CATALOGUE, sample=SAMPLE_SIZE):
+    """Return the layout matching most of the first ``sample`` non-empty strings of ``values``, ``None`` if none matches."""
+    strings = [value for value in islice((value for value in values if value), sample) if isinstance(value, str)]
+    best, best_count = None, 0
+    for layout in layouts:
+        count = sum(1 for string in strings if layout.match(string))
+        if count > best_count:
+            best, best_count = layout, count
+            if count == len(strings):
+                break
+    return best
+
+
+class StreamParser(object):
+    """Parses a stream of strings with the layout sniffed from its head.
+
+    Strings which do not match the locked layout are parsed with the first
+    layout of the catalogue matching them, and counted in ``fallbacks``;
+    strings no layout matches give ``None``.
+    """
+
+    def __init__(self, layouts=CATALOGUE, sample=SAMPLE_SIZE, layout=None):
+        self.layouts = layouts
+        self.sample = sample
+        self.layout = layout
+        self.fallbacks = 0
+
+    def sniff(self, values):
+        """Lock in the layout of ``values``, keeping the current one if none matches."""
+        self.layout = sniff(values, self.layouts, self.sample) or self.layout
+        return self.layout
+
+    def __fallback(self, string):
+        for layout in self.layouts:
+            match = layout.match(string)
+            if match is not None:
+                if self.layout is None:
+                    self.layout = layout
+                else:
+                    self.fallbacks += 1
+                return _build(layout, match)
+        return None
+
+    def parse(self, string):
+        if not isinstance(string, str):
+            return None
+        layout = self.layout
+        if layout is not None:
+            match = layout.pattern.fullmatch(string)
+            if match is not None:
+                return _build(layout, match)
+        return self.__fallback(string)
+
+    def parse_many(self, values):
+        """Return the list of the datetimes of ``values``, sniffing the layout from their head first."""
+        values = iter(values)
+        head = list(islice(values, self.sample))
+        if self.layout is None:
+            self.sniff(head)
+        parse = self.parse
+        return [parse(value) for value in chain(head, values)]
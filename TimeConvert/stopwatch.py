@@ -1,8 +1,9 @@
 import copy
 import io
-import time
 from enum import Enum
-from typing import List, NoReturn
+from typing import List, NoReturn, Optional
+
+from .clock import REAL_CLOCK, Clock
 
 
 class TimeType(Enum):
@@ -57,6 +58,7 @@ class StopWatch(BaseWatch):
             unique_id: str,
             keep_task_list: bool = True,
             time_type: TimeType = TimeType.millisecond,
+            clock: Optional[Clock] = None,
     ):
         """
         stop_watch计时器
@@ -64,6 +66,7 @@ class StopWatch(BaseWatch):
         :param unique_id: 计时器的唯一标识，一般起比较有特点的名称
         :param keep_task_list: 是否保存单个计时点(计时任务)的信息
         :param time_type: 计时器输出的时间单位 默认毫秒
+        :param clock: 计时使用的时钟 默认系统时钟, 测试时可传入 FrozenClock
         eg:
             sw = StopWatch('计时器唯一名称', time_type=TimeType.second)
             sw.start('我是计时点1')
@@ -88,6 +91,7 @@ class StopWatch(BaseWatch):
         self.__unique_id = unique_id
         self.__keep_task_list = keep_task_list
         self.__time_type = time_type
+        self.__clock = clock or REAL_CLOCK
 
         self.__task_info = list()
         self.__task_count = 0
@@ -102,7 +106,7 @@ class StopWatch(BaseWatch):
             raise ValueError('Can\'t start StopWatch: it\'s already running')
 
         self.__current_task_name = task_name
-        self.__start_time_timestamp = time.time()
+        self.__start_time_timestamp = self.__clock.time()
 
     def stop(self) -> NoReturn:
         """
@@ -112,15 +116,28 @@ class StopWatch(BaseWatch):
         if self.__current_task_name is None:
             raise ValueError('Can\'t stop StopWatch: it\'s not running')
 
-        last_time: float = time.time() - self.__start_time_timestamp
+        last_time: float = self.__clock.time() - self.__start_time_timestamp
         self.__total_time_timestamp += last_time
         self.__last_task_info = self.TaskInfo(self.__current_task_name, last_time)
         if self.__keep_task_list:
             self.__task_info.append(self.__last_task_info)
 
-        self.__task_count += self.__task_count
+        self.__task_count += 1
         self.__current_task_name = None
 
+    def add_task(self, task_name: str, seconds: float) -> NoReturn:
+        """
+        记录一个在外部计时的任务, 如 profiling 各阶段的耗时
+        :param task_name: 计时任务(计时点)的名称
+        :param seconds: 任务耗时(秒)
+        :return
+        """
+        self.__total_time_timestamp += seconds
+        self.__last_task_info = self.TaskInfo(task_name, seconds)
+        if self.__keep_task_list:
+            self.__task_info.append(self.__last_task_info)
+        self.__task_count += 1
+
     def is_running(self) -> bool:
         """
         计时器是否运行
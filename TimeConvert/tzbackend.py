@@ -0,0 +1,155 @@
+"""
+Time zone backends, the implementations behind ``tc.tzinfo``.
+
+    TimeConvertTools(tz_backend='zoneinfo')
+    TIMECONVERT_TZ_BACKEND=zoneinfo python app.py
+
+``dateutil`` (the default) resolves zones with ``dateutil.tz.gettz``,
+``zoneinfo`` with the C-accelerated ``zoneinfo.ZoneInfo`` of Python 3.9+,
+and ``fixed`` only knows fixed offsets (``UTC``, ``+08:00``, ``UTC-5``,
+``Etc/GMT-8``), as ``datetime.timezone`` objects, for services that never
+deal with daylight saving time. Each backend has its own UTC tzinfo, the one
+of the aware UTC datetimes ``tc`` returns.
+"""
+import abc
+import datetime
+import os
+import re
+
+from dateutil.tz import tz
+
+
+try:
+    import zoneinfo
+except ImportError:  # pragma: no cover
+    zoneinfo = None
+
+
+# Environment variable selecting the backend of instances created without one
+ENV_VAR = 'TIMECONVERT_TZ_BACKEND'
+
+DATEUTIL = 'dateutil'
+ZONEINFO = 'zoneinfo'
+FIXED = 'fixed'
+
+# Groups: sign, hours, minutes
+OFFSET = re.compile(r'(?:UTC|GMT)?([+-])(\d{1,2})(?::?(\d{2}))?')
+# Groups: sign, hours; POSIX signs, Etc/GMT-8 is UTC+8
+ETC_OFFSET = re.compile(r'Etc/GMT([+-])(\d{1,2})')
+UTC_NAMES = ('UTC', 'GMT', 'Z', 'Etc/UTC', 'Etc/GMT', 'Etc/Universal', 'Universal', 'Zulu')
+
+
+class TZBackend(abc.ABC):
+    """Resolves time zone names to tzinfo objects."""
+    name = None
+    utc = tz.UTC
+    # Whether wall-clock times inside a gap take the offset before it, as PEP 495 has it for ``fold=0``
+    pep495_gaps = True
+    # Whether a default zone the backend cannot resolve is an error, rather than the system zone
+    strict = True
+
+    @abc.abstractmethod
+    def gettz(self, name):
+        """Return the tzinfo of the zone ``name``, ``None`` for unknown zones."""
+
+    def zone_table(self, name):
+        """Return the ZoneTable the backend holds for the zone ``name``, ``None`` to compile its tzinfo."""
+        return None
+
+    def is_utc(self, tzinfo):
+        """Whether ``tzinfo`` is UTC, the backend's own or ``dateutil.tz.UTC``."""
+        return tzinfo == self.utc or tzinfo == tz.UTC
+
+    def __repr__(self):
+        return '<%s %s>' % (self.__class__.__name__, self.name)
+
+
+class DateutilBackend(TZBackend):
+    name = DATEUTIL
+    # dateutil takes the offset after the gap
+    pep495_gaps = False
+    # Unknown zones have always meant the system zone
+    strict = False
+
+    def gettz(self, name):
+        return tz.gettz(name)
+
+    def is_utc(self, tzinfo):
+        return tzinfo == tz.UTC
+
+
+class ZoneInfoBackend(TZBackend):
+    name = ZONEINFO
+    utc = datetime.timezone.utc
+
+    def __init__(self):
+        if zoneinfo is None:  # pragma: no cover
+            raise ImportError('The zoneinfo backend requires Python 3.9+')
+
+    def gettz(self, name):
+        # ZoneInfo keeps its own cache of zones, one instance per key
+        try:
+            return zoneinfo.ZoneInfo(name)
+        except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+            return None
+
+
+class FixedBackend(TZBackend):
+    name = FIXED
+    utc = datetime.timezone.utc
+
+    def __init__(self):
+        self.__tzinfos = {}
+
+    def gettz(self, name):
+        tzinfo = self.__tzinfos.get(name)
+        if tzinfo is None:
+            minutes = self.offset_minutes(name)
+            if minutes is None:
+                return None
+            tzinfo = self.__tzinfos[name] = self.utc if not minutes else datetime.timezone(datetime.timedelta(minutes=minutes), name)
+        return tzinfo
+
+    @staticmethod
+    def offset_minutes(name):
+        """Return the UTC offset in minutes of a fixed-offset zone name, ``None`` if it is not one."""
+        if name in UTC_NAMES:
+            return 0
+        match = OFFSET.fullmatch(name or '')
+        if match is not None:
+            sign, hours, minutes = match.groups()
+            minutes = int(hours) * 60 + int(minutes or 0)
+        else:
+            match = ETC_OFFSET.fullmatch(name or '')
+            if match is None:
+                return None
+            sign, hours = match.groups()
+            sign, minutes = '-' if sign == '+' else '+', int(hours) * 60
+        if minutes >= 24 * 60:
+            return None
+        return -minutes if sign == '-' else minutes
+
+
+BACKENDS = {
+    DATEUTIL: DateutilBackend,
+    ZONEINFO: ZoneInfoBackend,
+    FIXED: FixedBackend,
+}
+
+_backends = {}
+
+
+def get_backend(backend=None):
+    """Return the shared backend named ``backend``, ``$TIMECONVERT_TZ_BACKEND`` or ``dateutil`` by default.
+
+    ``TZBackend`` instances are returned as is.
+    """
+    if isinstance(backend, TZBackend):
+        return backend
+    name = backend or os.environ.get(ENV_VAR) or DATEUTIL
+    instance = _backends.get(name)
+    if instance is None:
+        if name not in BACKENDS:
+            raise ValueError('tz_backend must be one of %s, got %r' % (', '.join(BACKENDS), name))
+        instance = _backends[name] = BACKENDS[name]()
+    return instance
@@ -0,0 +1,287 @@
+"""
+Compiled zone tables in shared memory or a mapped file, for process pools and pre-fork servers.
+
+    # In the parent, before forking (or once, at deploy time)
+    store = create_shared_memory(['Asia/Shanghai', 'America/New_York'], name='tc-zones')
+    write_file('/var/run/tc-zones.bin', ['Asia/Shanghai', 'America/New_York'])
+
+    # In each worker
+    store = attach_shared_memory('tc-zones')     # or open_file('/var/run/tc-zones.bin')
+    store.install()                              # get_zone_table/tc.zone_table answer from it, for the default backend
+    converter = TimeConvertTools(tz_backend=store.backend())
+
+Workers map the same read-only pages: attaching parses a directory of a few
+hundred bytes, tables are memoryviews over the mapping and ``TableTZInfo``
+answers ``utcoffset``/``fromutc`` from them, so that neither the tzfile
+objects nor the transitions are copied per worker.
+
+The store is native-endian, tables are stored in ``timezones`` order::
+
+    header     magic, version, zone count
+    directory  per zone: name (UTF-8, NUL padded), data offset, transition count
+    data       per zone: int64 transitions, int32 offsets, 8-byte aligned
+"""
+import datetime
+import mmap
+import os
+import struct
+import weakref
+from array import array
+
+from .tzbackend import TZBackend, get_backend
+from .zonetable import EPOCH_ORDINAL, SECONDS_PER_DAY, ZoneTable, discard_zone_tables, get_zone_table, set_zone_table
+
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover
+    shared_memory = None
+
+
+MAGIC = b'TCZT'
+VERSION = 1
+NAME_SIZE = 64
+
+HEADER = struct.Struct('=4sII')
+ENTRY = struct.Struct('=%dsQI4x' % NAME_SIZE)
+
+# Open stores, where unpickled TableTZInfos find their zone
+_stores = weakref.WeakSet()
+
+
+def _align(size):
+    return (size + 7) & ~7
+
+
+def pack(tables):
+    """Return the bytes of a zone store of ``tables``, ZoneTables."""
+    tables = list(tables)
+    data_offset = _align(HEADER.size + ENTRY.size * len(tables))
+    entries, chunks, offset = [], [], data_offset
+    for table in tables:
+        name = table.name.encode('utf-8')
+        if len(name) > NAME_SIZE:
+            raise ValueError('zone name must be at most %d bytes, got %r' % (NAME_SIZE, table.name))
+        chunk = array('q', table.transitions).tobytes() + array('i', table.offsets).tobytes()
+        chunk += b'\0' * (_align(len(chunk)) - len(chunk))
+        entries.append(ENTRY.pack(name, offset, len(table.transitions)))
+        chunks.append(chunk)
+        offset += len(chunk)
+    head = HEADER.pack(MAGIC, VERSION, len(tables)) + b''.join(entries)
+    return head + b'\0' * (data_offset - len(head)) + b''.join(chunks)
+
+
+def build(timezones, backend=None):
+    """Return the bytes of a zone store of the zones named ``timezones``, resolved with the TZBackend ``backend``."""
+    return pack(get_zone_table(timezone, backend=backend) for timezone in timezones)
+
+
+def _tzinfo(name):
+    # TableTZInfo of the zone ``name`` from an open store holding it, compiled with the default backend otherwise
+    for store in list(_stores):
+        if name in store:
+            return store.tzinfo(name)
+    return TableTZInfo(get_zone_table(name))
+
+
+def _wall(dt):
+    return (dt.toordinal() - EPOCH_ORDINAL) * SECONDS_PER_DAY + dt.hour * 3600 + dt.minute * 60 + dt.second
+
+
+class TableTZInfo(datetime.tzinfo):
+    """PEP 495 tzinfo answering from a ZoneTable.
+
+    Tables hold offsets only, ``dst`` is unknown (``None``) and ``tzname`` is
+    the name of the zone.
+    """
+
+    def __init__(self, table):
+        self.table = table
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self.table.name)
+
+    def __str__(self):
+        return self.table.name
+
+    def __reduce__(self):
+        # Tables are views over a mapping, unpickled tzinfos are found again by zone name
+        return _tzinfo, (self.table.name, )
+
+    def utcoffset(self, dt):
+        if dt is None:
+            return datetime.timedelta(seconds=self.table.offsets[0]) if not self.table.transitions else None
+        wall = _wall(dt)
+        return datetime.timedelta(seconds=wall - self.table.utc_stamp(wall, dt.fold))
+
+    def dst(self, dt):
+        return None
+
+    def tzname(self, dt):
+        return self.table.name
+
+    def fromutc(self, dt):
+        if dt.tzinfo is not self:
+            raise ValueError('fromutc: dt.tzinfo is not self')
+        stamp = _wall(dt)
+        offset = self.table.utcoffset(stamp)
+        local_dt = dt + datetime.timedelta(seconds=offset)
+        # The second occurrence of an ambiguous wall-clock time
+        if self.table.utc_stamp(stamp + offset) != stamp:
+            local_dt = local_dt.replace(fold=1)
+        return local_dt
+
+
+class StoreBackend(TZBackend):
+    """Resolves the zones of a ZoneStore to ``TableTZInfo``, other zones with ``fallback``, none by default."""
+    name = 'store'
+    utc = datetime.timezone.utc
+
+    def __init__(self, store, fallback=None):
+        self.store = store
+        self.fallback = get_backend(fallback) if fallback else None
+
+    def gettz(self, name):
+        if name not in self.store:
+            return self.fallback.gettz(name) if self.fallback else None
+        return self.store.tzinfo(name)
+
+    def zone_table(self, name):
+        if name in self.store:
+            return self.store.table(name)
+        return get_zone_table(name, backend=self.fallback) if self.fallback else None
+
+
+class ZoneStore(object):
+    """Read-only ZoneTables over the buffer of a zone store, without copying it.
+
+    ``owner``, the mapping or shared memory holding the buffer, is closed by ``close``.
+    """
+
+    def __init__(self, buffer, owner=None):
+        view = memoryview(buffer).cast('B')
+        if not view.readonly:
+            view = view.toreadonly()
+        magic, version, count = HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise ValueError('buffer is not a zone store')
+        if version != VERSION:
+            raise ValueError('zone store version %d is not supported, or of another byte order' % version)
+        self.owner = owner
+        self.__view = view
+        # name -> (data offset, transition count)
+        self.__entries = {}
+        for index in range(count):
+            name, offset, transitions = ENTRY.unpack_from(view, HEADER.size + index * ENTRY.size)
+            self.__entries[name.rstrip(b'\0').decode('utf-8')] = (offset, transitions)
+        self.__tables = {}
+        self.__tzinfos = {}
+        _stores.add(self)
+
+    def __repr__(self):
+        return '%s(%d zones)' % (self.__class__.__name__, len(self.__entries))
+
+    def __contains__(self, name):
+        return name in self.__entries
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def names(self):
+        return list(self.__entries)
+
+    def table(self, name):
+        """Return the ZoneTable of the zone ``name``, raise KeyError if the store has none."""
+        table = self.__tables.get(name)
+        if table is None:
+            offset, count = self.__entries[name]
+            end = offset + 8 * count
+            transitions = self.__view[offset:end].cast('q')
+            offsets = self.__view[end:end + 4 * (count + 1)].cast('i')
+            table = self.__tables[name] = ZoneTable.from_buffers(name, transitions, offsets)
+        return table
+
+    def tzinfo(self, name):
+        """Return the TableTZInfo of the zone ``name``, raise KeyError if the store has none."""
+        tzinfo = self.__tzinfos.get(name)
+        if tzinfo is None:
+            tzinfo = self.__tzinfos[name] = TableTZInfo(self.table(name))
+        return tzinfo
+
+    def install(self, backend=None):
+        """Cache every table of the store for ``get_zone_table`` with the TZBackend ``backend``, and so for ``tc.zone_table``."""
+        for name in self.__entries:
+            set_zone_table(self.table(name), backend=backend)
+
+    def backend(self, fallback=None):
+        """Return a TZBackend resolving the zones of the store, for ``TimeConvertTools(tz_backend=...)``."""
+        return StoreBackend(self, fallback)
+
+    def close(self):
+        """Close the mapping or shared memory.
+
+        Installed tables are dropped from the cache of ``get_zone_table``; the
+        tables and tzinfos given out cannot be used anymore.
+        """
+        _stores.discard(self)
+        discard_zone_tables(self.__tables.values())
+        for table in self.__tables.values():
+            # NumPy arrays over the views would keep the mapping exported
+            table._np_transitions = table._np_offsets = None
+            table.transitions.release()
+            table.offsets.release()
+        self.__tables.clear()
+        self.__tzinfos.clear()
+        self.__view.release()
+        if self.owner is not None:
+            self.owner.close()
+
+    def unlink(self):
+        """Destroy the shared memory of the store, in the process that created it."""
+        self.owner.unlink()
+
+
+def write_file(path, timezones, backend=None):
+    """Write a zone store of ``timezones`` at ``path``, replaced atomically so that readers never see a partial one."""
+    data = build(timezones, backend)
+    temp_path = '%s.%d.tmp' % (path, os.getpid())
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def open_file(path):
+    """Return the ZoneStore of the file at ``path``, mapped read-only."""
+    with open(path, 'rb') as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return ZoneStore(mapping, mapping)
+
+
+def _shared_memory():
+    if shared_memory is None:  # pragma: no cover
+        raise ImportError('Shared memory zone stores require Python 3.8+, use write_file/open_file')
+    return shared_memory
+
+
+def create_shared_memory(timezones, name=None, backend=None):
+    """Return a ZoneStore of ``timezones`` in new shared memory named ``name``, a random name by default (``store.owner.name``).
+
+    The creator owns the memory: ``store.unlink()`` it when no worker needs it anymore.
+    """
+    data = build(timezones, backend)
+    memory = _shared_memory().SharedMemory(name=name, create=True, size=len(data))
+    memory.buf[:len(data)] = data
+    return ZoneStore(memory.buf, memory)
+
+
+def attach_shared_memory(name):
+    """Return the ZoneStore of the existing shared memory ``name``, read-only."""
+    try:
+        # Python 3.13+, an attached segment is not unlinked when this process exits
+        memory = _shared_memory().SharedMemory(name=name, track=False)
+    except TypeError:
+        memory = _shared_memory().SharedMemory(name=name)
+        # Before 3.13 attaching registers the segment too, the resource tracker of this process would unlink it at exit
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(memory._name, 'shared_memory')
+    return ZoneStore(memory.buf, memory)
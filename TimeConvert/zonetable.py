@@ -0,0 +1,226 @@
+import datetime
+import threading
+from array import array
+from bisect import bisect_right
+
+from .tzbackend import get_backend
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+# Proleptic Gregorian ordinal of 1970-01-01
+EPOCH_ORDINAL = 719163
+SECONDS_PER_DAY = 86400
+
+# Probing window used for tzinfo implementations without a readable transition list
+PROBE_START = -2208988800  # 1900-01-01T00:00:00Z
+PROBE_END = 4102444800  # 2100-01-01T00:00:00Z
+PROBE_STEP = SECONDS_PER_DAY
+
+
+class ZoneTable(object):
+    """Compiled UTC offsets of a time zone.
+
+    ``transitions`` holds the sorted UTC epoch seconds at which the offset
+    changes, ``offsets`` the UTC offset in seconds in effect before the first
+    transition, then after each one, so that the offset of a UTC ``stamp`` is
+    ``offsets[bisect_right(transitions, stamp)]``.
+    """
+    __slots__ = ('name', 'transitions', 'offsets', '_np_transitions', '_np_offsets')
+
+    def __init__(self, name, transitions, offsets):
+        if len(offsets) != len(transitions) + 1:
+            raise ValueError('offsets must have exactly one more item than transitions')
+        self.name = name
+        self.transitions = array('q', transitions)
+        self.offsets = array('i', offsets)
+        self._np_transitions = None
+        self._np_offsets = None
+
+    def __repr__(self):
+        return '%s(%r, %d transitions)' % (self.__class__.__name__, self.name, len(self.transitions))
+
+    @classmethod
+    def from_buffers(cls, name, transitions, offsets):
+        """Wrap int64 ``transitions`` and int32 ``offsets`` buffers, such as memoryviews of shared memory, without copying them."""
+        if len(offsets) != len(transitions) + 1:
+            raise ValueError('offsets must have exactly one more item than transitions')
+        table = cls.__new__(cls)
+        table.name = name
+        table.transitions = transitions
+        table.offsets = offsets
+        table._np_transitions = None
+        table._np_offsets = None
+        return table
+
+    @classmethod
+    def from_tzinfo(cls, tzinfo, name=None):
+        """Compile a ``datetime.tzinfo`` into a ZoneTable."""
+        name = name or str(tzinfo)
+        fixed = tzinfo.utcoffset(None)
+        if fixed is not None:
+            return cls(name, (), (int(fixed.total_seconds()), ))
+        if hasattr(tzinfo, '_trans_list_utc') and hasattr(tzinfo, '_ttinfo_std'):
+            return cls._from_dateutil_tzfile(tzinfo, name)
+        return cls._from_probing(tzinfo, name)
+
+    @classmethod
+    def _from_dateutil_tzfile(cls, tzinfo, name):
+        # Mirror ``dateutil.tz.tzfile.fromutc``: before the first transition ``_ttinfo_before``
+        # applies, from the last transition onwards ``_ttinfo_std`` does.
+        transitions = list(tzinfo._trans_list_utc)
+        if not transitions:
+            return cls(name, (), (tzinfo._ttinfo_std.offset, ))
+        offsets = [tzinfo._ttinfo_before.offset]
+        offsets.extend(ttinfo.offset for ttinfo in tzinfo._trans_idx[:-1])
+        offsets.append(tzinfo._ttinfo_std.offset)
+        return cls(name, transitions, offsets)
+
+    @classmethod
+    def _from_probing(cls, tzinfo, name, start=PROBE_START, end=PROBE_END, step=PROBE_STEP):
+        def offset_at(stamp):
+            return int(datetime.datetime.fromtimestamp(stamp, tzinfo).utcoffset().total_seconds())
+
+        transitions = []
+        offsets = [offset_at(start)]
+        for stamp in range(start + step, end, step):
+            offset = offset_at(stamp)
+            if offset == offsets[-1]:
+                continue
+            # Narrow down the exact second of the change
+            low, high = stamp - step, stamp
+            while high - low > 1:
+                middle = (low + high) // 2
+                if offset_at(middle) == offsets[-1]:
+                    low = middle
+                else:
+                    high = middle
+            transitions.append(high)
+            offsets.append(offset)
+        return cls(name, transitions, offsets)
+
+    def utcoffset(self, stamp):
+        """Return the UTC offset in seconds in effect at the UTC epoch ``stamp``."""
+        return self.offsets[bisect_right(self.transitions, stamp)]
+
+    def local_stamp(self, stamp):
+        """Return the wall-clock epoch seconds of the UTC epoch ``stamp``."""
+        return stamp + self.offsets[bisect_right(self.transitions, stamp)]
+
+    def utc_stamp(self, local_stamp, fold=0):
+        """Return the UTC epoch seconds of the wall-clock epoch ``local_stamp``.
+
+        Ambiguous wall-clock times resolve to the earlier instant unless ``fold``
+        is 1; wall-clock times inside a gap use the offset before the gap, after
+        it with ``fold`` 1, following PEP 495.
+        """
+        before = self.utcoffset(local_stamp - SECONDS_PER_DAY)
+        after = self.utcoffset(local_stamp + SECONDS_PER_DAY)
+        candidates = [offset for offset in ((before, after) if before != after else (before, )) if self.utcoffset(local_stamp - offset) == offset]
+        if not candidates:
+            return local_stamp - (after if fold else before)
+        return local_stamp - candidates[-1 if fold else 0]
+
+    def day_start(self, stamp):
+        """Return the UTC epoch seconds at which the local day containing the UTC epoch ``stamp`` starts.
+
+        When midnight falls in a gap the day starts at the transition, when
+        it is ambiguous the day starts at its first occurrence.
+        """
+        local_stamp = stamp + self.offsets[bisect_right(self.transitions, stamp)]
+        return self.utc_stamp(local_stamp - local_stamp % SECONDS_PER_DAY)
+
+    def day_end(self, stamp):
+        """Return the UTC epoch seconds at which the local day containing the UTC epoch ``stamp`` ends, the start of the next day."""
+        local_stamp = stamp + self.offsets[bisect_right(self.transitions, stamp)]
+        return self.utc_stamp(local_stamp - local_stamp % SECONDS_PER_DAY + SECONDS_PER_DAY)
+
+    def day_bounds(self, stamp):
+        """Return ``(day_start(stamp), day_end(stamp))``, days are 23 or 25 hours long across DST transitions."""
+        local_stamp = stamp + self.offsets[bisect_right(self.transitions, stamp)]
+        midnight = local_stamp - local_stamp % SECONDS_PER_DAY
+        return self.utc_stamp(midnight), self.utc_stamp(midnight + SECONDS_PER_DAY)
+
+    def _arrays(self):
+        if self._np_transitions is None:
+            self._np_transitions = np.frombuffer(self.transitions, dtype=np.int64) if self.transitions else np.empty(0, dtype=np.int64)
+            self._np_offsets = np.frombuffer(self.offsets, dtype=np.int32).astype(np.int64)
+        return self._np_transitions, self._np_offsets
+
+    def utcoffsets(self, stamps):
+        """Return the UTC offsets in seconds of a sequence or array of UTC epoch seconds.
+
+        Returns a NumPy array when NumPy is installed, a list otherwise.
+        """
+        if np is None:
+            transitions, offsets = self.transitions, self.offsets
+            return [offsets[bisect_right(transitions, stamp)] for stamp in stamps]
+        transitions, offsets = self._arrays()
+        return offsets[np.searchsorted(transitions, stamps, side='right')]
+
+    def local_stamps(self, stamps):
+        """Return the wall-clock epoch seconds of a sequence or array of UTC epoch seconds."""
+        if np is None:
+            transitions, offsets = self.transitions, self.offsets
+            return [stamp + offsets[bisect_right(transitions, stamp)] for stamp in stamps]
+        stamps = np.asarray(stamps)
+        return stamps + self.utcoffsets(stamps)
+
+    def utc_stamps(self, local_stamps):
+        """Return the UTC epoch seconds of a sequence or array of wall-clock epoch seconds, as ``utc_stamp`` with ``fold=0``."""
+        if np is None:
+            utc_stamp = self.utc_stamp
+            return [utc_stamp(local_stamp) for local_stamp in local_stamps]
+        local_stamps = np.asarray(local_stamps)
+        before = self.utcoffsets(local_stamps - SECONDS_PER_DAY)
+        after = self.utcoffsets(local_stamps + SECONDS_PER_DAY)
+        # The offset before the transition wins when both are valid (fold=0) and inside gaps
+        use_after = (self.utcoffsets(local_stamps - before) != before) & (self.utcoffsets(local_stamps - after) == after)
+        return local_stamps - np.where(use_after, after, before)
+
+
+# (backend name, zone name) -> ZoneTable
+_zone_tables = {}
+_zone_tables_lock = threading.Lock()
+
+
+def get_zone_table(timezone, tzinfo=None, backend=None):
+    """Return the cached ZoneTable of the zone named ``timezone``, as resolved by the TZBackend ``backend``.
+
+    ``tzinfo`` is compiled on first use; by default it is resolved with
+    ``backend``, see ``TimeConvert.tzbackend``.
+    """
+    backend = get_backend(backend)
+    key = backend.name, timezone
+    table = _zone_tables.get(key)
+    if table is not None:
+        return table
+    table = backend.zone_table(timezone)
+    if table is not None:
+        return table
+    with _zone_tables_lock:
+        table = _zone_tables.get(key)
+        if table is None:
+            tzinfo = tzinfo or backend.gettz(timezone)
+            if tzinfo is None:
+                raise ValueError('Unknown time zone %r' % (timezone, ))
+            table = _zone_tables[key] = ZoneTable.from_tzinfo(tzinfo, name=timezone)
+    return table
+
+
+def set_zone_table(table, timezone=None, backend=None):
+    """Cache ``table`` as the ZoneTable of the zone named ``timezone``, its name by default, for ``get_zone_table`` with ``backend``."""
+    with _zone_tables_lock:
+        _zone_tables[get_backend(backend).name, timezone or table.name] = table
+
+
+def discard_zone_tables(tables):
+    """Drop ``tables`` from the cache of ``get_zone_table``, under whichever backend and name they are cached."""
+    tables = {id(table) for table in tables}
+    with _zone_tables_lock:
+        for key in [key for key, table in _zone_tables.items() if id(table) in tables]:
+            del _zone_tables[key]
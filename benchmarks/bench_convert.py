@@ -0,0 +1,147 @@
+"""
+Benchmarks of the TimeConvertTools hot paths, run with pyperf.
+
+    pip install -e .[bench]
+    python benchmarks/bench_convert.py -o before.json
+    python benchmarks/bench_convert.py -o after.json
+    python benchmarks/compare.py before.json after.json --threshold 10
+
+Each benchmark runs over a synthetic dataset, timings are per item.
+Pass ``--fast`` for a quick, noisier run; ``-b NAME`` (repeatable) to run some benchmarks only.
+"""
+import datetime
+import random
+
+import pyperf
+
+from TimeConvert import FrozenClock, ISOWeek, Month, Quarter, StopWatch
+from TimeConvert import TimeConvert as tc
+
+
+# Items per dataset, large enough to smooth the per call overhead of pyperf
+DATASET_SIZE = 1000
+SEED = 20171208
+
+
+def make_datetimes(size=DATASET_SIZE, seed=SEED):
+    rnd = random.Random(seed)
+    start = datetime.datetime(2000, 1, 1)
+    return [start + datetime.timedelta(seconds=rnd.randint(0, 30 * 365 * 86400)) for _ in range(size)]
+
+
+def make_dataset(size=DATASET_SIZE, seed=SEED):
+    dts = make_datetimes(size, seed)
+    utc_tzinfo = tc.tzinfo('UTC')
+    return {
+        'naive': dts,
+        'utc': [dt.replace(tzinfo=utc_tzinfo) for dt in dts],
+        'mixed': [dt.replace(tzinfo=utc_tzinfo) if i % 3 == 1 else dt.replace(tzinfo=tc.tzinfo('America/New_York')) if i % 3 == 2 else dt for i, dt in enumerate(dts)],
+        'strings': [dt.strftime(tc.DATETIME_FORMAT) for dt in dts],
+        'isostrings': [dt.strftime('%Y-%m-%dT%H:%M:%S.%f+08:00') for dt in dts],
+        'dates': [dt.date() for dt in dts],
+        'stamps': [tc.datetime_to_timestamp(dt) for dt in dts],
+        'months': [Month.from_date(dt) for dt in dts],
+        'quarters': [Quarter.from_date(dt) for dt in dts],
+        'weeks': [ISOWeek.withdate(dt) for dt in dts],
+    }
+
+
+def loop(func, values):
+    def run():
+        for value in values:
+            func(value)
+    return run
+
+
+def benchmarks(data):
+    """Return ``(name, function, inner_loops)`` of every benchmark."""
+    utc_dt = data['utc'][0]
+    stopwatch = StopWatch('bench')
+
+    def stopwatch_task():
+        stopwatch.start('task')
+        stopwatch.stop()
+
+    def frozen_converter():
+        from TimeConvert.convert import TimeConvertTools
+        return TimeConvertTools(clock=FrozenClock(utc_dt))
+
+    frozen_tc = frozen_converter()
+
+    def backend_benchmarks(backend, timezone):
+        # The same conversions with the time zones of another backend
+        from TimeConvert.convert import TimeConvertTools
+        converter = TimeConvertTools(timezone=timezone, tz_backend=backend)
+        utc_dts = [dt.replace(tzinfo=converter.tz_backend.utc) for dt in data['naive']]
+        return [
+            ('tzbackend_%s_to_utc_datetime' % backend, loop(converter.to_utc_datetime, data['naive']), size),
+            ('tzbackend_%s_to_local_datetime' % backend, loop(converter.to_local_datetime, utc_dts), size),
+            ('tzbackend_%s_epoch_to_datetime' % backend, loop(lambda stamp: converter.epoch_to_datetime(stamp, timezone=timezone), data['stamps']), size),
+            ('tzbackend_%s_local_string' % backend, loop(lambda dt: converter.local_string(utc_dt=dt), utc_dts), size),
+        ]
+
+    string_plan = tc.compile(input='str', to='utc', output='timestamp_ms')
+    zones = ['Asia/Shanghai', 'Asia/Tokyo', 'Asia/Singapore', 'Asia/Kolkata', 'Asia/Dubai', 'Europe/London', 'Europe/Paris', 'Europe/Berlin', 'Europe/Moscow', 'Africa/Cairo',
+             'America/New_York', 'America/Chicago', 'America/Denver', 'America/Los_Angeles', 'America/Sao_Paulo', 'America/Toronto', 'Australia/Sydney', 'Pacific/Auckland', 'Pacific/Honolulu', 'UTC']
+    size = len(data['naive'])
+    return [
+        # Parse
+        ('parse_string_to_datetime', loop(tc.string_to_datetime, data['strings']), size),
+        ('parse_utc_string_to_utc_datetime', loop(tc.utc_string_to_utc_datetime, data['strings']), size),
+        ('parse_string_to_timestamp', loop(tc.string_to_timestamp, data['strings']), size),
+        ('parse_isostring_to_datetime', loop(tc.isostring_to_datetime, data['isostrings']), size),
+        ('plan_string_to_timestamp_ms', lambda: string_plan.map(data['strings']), size),
+        # Format
+        ('format_datetime_to_string', loop(tc.datetime_to_string, data['naive']), size),
+        ('format_local_string', loop(lambda dt: tc.local_string(utc_dt=dt), data['utc']), size),
+        ('format_http_date_now', loop(lambda _: tc.http_date(), range(size)), size),
+        # Zone conversion
+        ('zone_to_utc_datetime', loop(tc.to_utc_datetime, data['mixed']), size),
+        ('zone_to_local_datetime', loop(tc.to_local_datetime, data['utc']), size),
+        ('zone_normalize_many', lambda: tc.normalize_many(data['mixed']), size),
+        ('zone_fan_out_20_zones', loop(lambda dt: tc.fan_out(dt, zones), data['utc'][:50]), 50),
+        ('zone_fan_out_20_zones_per_zone', loop(lambda dt: {zone: tc.datetime_to_string(tc.to_local_datetime(dt, timezone=zone)) for zone in zones}, data['utc'][:50]), 50),
+        ('zone_fan_out_many_20_zones', lambda: tc.fan_out_many(data['utc'][:50], zones), 50),
+        # Now and shifts
+        ('now_utc_datetime', loop(lambda _: tc.utc_datetime(), range(size)), size),
+        ('now_utc_datetime_frozen', loop(lambda _: frozen_tc.utc_datetime(), range(size)), size),
+        ('shift_utc_datetime_days', loop(lambda dt: tc.utc_datetime(dt, days=1), data['utc']), size),
+        ('shift_several_time_coming_months', loop(lambda dt: tc.several_time_coming(dt, months=1), data['utc']), size),
+        # Timestamps
+        ('timestamp_utc_timestamp', loop(lambda _: tc.utc_timestamp(), range(size)), size),
+        ('timestamp_datetime_to_timestamp', loop(tc.datetime_to_timestamp, data['naive']), size),
+        ('timestamp_to_local_datetime', loop(tc.timestamp_to_local_datetime, data['stamps']), size),
+        ('timestamp_delta', loop(lambda stamp: tc.timestamp_delta(stamp, 1512718020)['total_seconds'], data['stamps']), size),
+        ('timestamp_countdown_many', lambda: tc.countdown_many(data['stamps'], now=1512718020), size),
+        # Period arithmetic
+        ('period_month_add', loop(lambda month: month + 13, data['months']), size),
+        ('period_quarter_add', loop(lambda quarter: quarter + 5, data['quarters']), size),
+        ('period_isoweek_add', loop(lambda week: week + 7, data['weeks']), size),
+        ('period_bucket_month', lambda: tc.bucket(data['stamps'], 'month'), size),
+        # Ranges
+        ('range_date_range_iterate', lambda: list(tc.date_range('2000-01-01', '2002-09-27')), 1000),
+        ('range_week_range_iterate', lambda: list(tc.week_range('2000-01-01', '2019-03-01')), 1000),
+        ('range_month_range_iterate', lambda: list(tc.month_range('1940-01-01', '2023-04-01')), 1000),
+        # StopWatch
+        ('stopwatch_start_stop', loop(lambda _: stopwatch_task(), range(size)), size),
+    ] + backend_benchmarks('dateutil', 'Asia/Shanghai') + backend_benchmarks('zoneinfo', 'Asia/Shanghai') + backend_benchmarks('fixed', '+08:00')
+
+
+def add_cmdline_args(cmd, args):
+    for name in args.benchmark or ():
+        cmd.extend(('-b', name))
+
+
+def main():
+    runner = pyperf.Runner(add_cmdline_args=add_cmdline_args)
+    runner.argparser.add_argument('-b', '--benchmark', action='append', help='name of a benchmark to run, all by default')
+    args = runner.parse_args()
+    runner.metadata['description'] = 'TimeConvert hot paths, timings per item'
+    data = make_dataset()
+    for name, func, inner_loops in benchmarks(data):
+        if not args.benchmark or name in args.benchmark:
+            runner.bench_func(name, func, inner_loops=inner_loops)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Compare two pyperf JSON results of ``bench_convert.py`` and flag regressions.
+
+    python benchmarks/compare.py before.json after.json --threshold 10
+
+Exits with status 1 when a benchmark got slower than ``--threshold`` percent.
+"""
+import argparse
+import sys
+
+import pyperf
+
+
+def compare(reference, changed, threshold):
+    """Return ``(name, reference mean, changed mean, change in percent, is regression)`` of the benchmarks in both suites."""
+    rows = []
+    changed_benchmarks = {benchmark.get_name(): benchmark for benchmark in changed.get_benchmarks()}
+    for benchmark in reference.get_benchmarks():
+        name = benchmark.get_name()
+        if name not in changed_benchmarks:
+            continue
+        before, after = benchmark.mean(), changed_benchmarks[name].mean()
+        percent = (after - before) / before * 100
+        rows.append((name, before, after, percent, percent > threshold))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('reference', help='pyperf JSON of the reference run')
+    parser.add_argument('changed', help='pyperf JSON of the run to check')
+    parser.add_argument('--threshold', type=float, default=10.0, help='slowdown in percent reported as a regression (default: 10)')
+    args = parser.parse_args(argv)
+
+    rows = compare(pyperf.BenchmarkSuite.load(args.reference), pyperf.BenchmarkSuite.load(args.changed), args.threshold)
+    width = max([len(row[0]) for row in rows] + [9])
+    print('%-*s  %12s  %12s  %8s' % (width, 'benchmark', 'reference', 'changed', 'change'))
+    for name, before, after, percent, regression in rows:
+        print('%-*s  %10.2fus  %10.2fus  %+7.1f%%%s' % (width, name, before * 1e6, after * 1e6, percent, '  REGRESSION' if regression else ''))
+
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        print('\n%d regression(s) beyond %.1f%%: %s' % (len(regressions), args.threshold, ', '.join(regressions)))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
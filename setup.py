@@ -21,6 +21,12 @@ setup(
     py_modules=[],
     python_requires='>=3.5',
     install_requires=['isoweek', 'python-dateutil>=2.8.1', 'tzlocal'],
+    extras_require={
+        'numpy': ['numpy'],
+        'bench': ['pyperf'],
+        'pandas': ['pandas'],
+        'pyarrow': ['pandas', 'pyarrow'],
+    },
 
     classifiers=[
         "License :: OSI Approved :: BSD License",
@@ -0,0 +1,56 @@
+import datetime
+import random
+
+import pytest
+from dateutil.tz import tz
+
+from TimeConvert import ISOWeek, Month, Quarter
+from TimeConvert import TimeConvert as tc
+from TimeConvert.bucket import bucket_values
+
+
+STAMPS = [random.Random(7).randint(-10 ** 9, 4 * 10 ** 9) for _ in range(500)] + [0, -1, 1514736000]
+
+
+def expected(stamp, granularity, timezone):
+    date = datetime.datetime.fromtimestamp(stamp, tz.UTC).astimezone(tz.gettz(timezone)).date()
+    return {
+        'day': date,
+        'week': ISOWeek.withdate(date),
+        'month': Month.from_date(date),
+        'quarter': Quarter.from_date(date),
+    }[granularity]
+
+
+class TestBucket(object):
+
+    @pytest.mark.parametrize('granularity', ['day', 'week', 'month', 'quarter'])
+    @pytest.mark.parametrize('timezone', ['Asia/Shanghai', 'America/New_York', 'UTC'])
+    def test_bucket_epochs(self, granularity, timezone):
+        buckets = tc.bucket(STAMPS, granularity, timezone=timezone)
+        assert tc.decode_buckets(buckets, granularity) == [expected(stamp, granularity, timezone) for stamp in STAMPS]
+        parse = tc.string_to_datetime
+        assert bucket_values(STAMPS, granularity, tc.zone_table(timezone), parse) == buckets
+
+    def test_bucket_numpy(self):
+        np = pytest.importorskip('numpy')
+        stamps = np.array(STAMPS, dtype=np.int64)
+        buckets = tc.bucket(stamps, 'month', timezone='America/New_York')
+        assert isinstance(buckets, np.ndarray)
+        assert buckets.tolist() == tc.bucket(STAMPS, 'month', timezone='America/New_York')
+        assert tc.bucket(stamps.astype('datetime64[s]'), 'quarter', timezone='UTC').tolist() == tc.bucket(STAMPS, 'quarter', timezone='UTC')
+
+    def test_bucket_mixed(self):
+        values = [
+            '2017-12-31 23:00:00',
+            datetime.date(2017, 12, 31),
+            datetime.datetime(2017, 12, 31, 20, tzinfo=tz.UTC),
+            None,
+        ]
+        buckets = tc.bucket(values, 'week', timezone='Asia/Shanghai')
+        assert tc.decode_buckets(buckets, 'week') == [ISOWeek(2017, 52), ISOWeek(2017, 52), ISOWeek(2018, 1), None]
+        assert tc.decode_bucket(tc.bucket(['2018-01-01'], 'quarter')[0], 'quarter') == Quarter(2018, 1)
+
+    def test_bucket_granularity(self):
+        with pytest.raises(ValueError):
+            tc.bucket([0], 'year')
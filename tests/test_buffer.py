@@ -0,0 +1,67 @@
+import datetime
+import random
+
+import pytest
+from dateutil.tz import tz
+
+from TimeConvert import TimeConvert as tc
+from TimeConvert.buffer import parse, parse_many
+
+
+DT = datetime.datetime(2017, 12, 8, 15, 27, 0)
+
+
+class TestBuffer(object):
+
+    def test_parse(self):
+        record = b'id=0001|2017-12-08 15:27:00|GET'
+        assert parse(record, 8, 19) == DT
+        assert parse(record, 8, format='%Y-%m-%d %H:%M:%S') == DT
+        assert parse(record, 8) is None
+        assert parse(bytearray(record), 8, 19) == DT
+        assert parse(memoryview(record)[8:27]) == DT
+        assert parse(memoryview(record)[8:18]) == datetime.datetime(2017, 12, 8)
+        assert parse(b'20171208152700', format='%Y%m%d%H%M%S') == DT
+        assert parse(b'2017-12-08T15:27:00.000123', format='%Y-%m-%dT%H:%M:%S.%f') == DT.replace(microsecond=123)
+        assert parse(memoryview(b'2017-12-08 15:27:00').cast('c')) == DT
+
+    def test_parse_invalid(self):
+        for value in (b'2017-13-08 15:27:00', b'2017-02-29 15:27:00', b'2017-12-08 24:27:00', b'2017-12-08+15:27:00', b'2017-12-0a 15:27:00', b'2017-12-08 15:27', b'', b'\xff' * 19):
+            assert parse(value) is None, value
+        assert parse(b'2017-12-08 15:27:00', 1, 19) is None
+        assert parse(b'2017-12-08 15:27:00', length=18, format='%Y-%m-%d %H:%M:%S') is None
+        with pytest.raises(ValueError):
+            parse(b'08 Dec 2017', format='%d %b %Y')
+
+    def test_parse_many(self):
+        rnd = random.Random(46)
+        dts = [datetime.datetime(2000, 1, 1) + datetime.timedelta(seconds=rnd.randint(0, 40 * 365 * 86400)) for _ in range(300)]
+        buffer = bytearray(b''.join(b'%06d|%s|\n' % (index, dt.strftime(tc.DATETIME_FORMAT).encode()) for index, dt in enumerate(dts)))
+        stride = len(buffer) // len(dts)
+        # Invalid records are NaT
+        buffer[stride * 7 + 7:stride * 7 + 11] = b'20x7'
+        buffer[stride * 9 + 7 + 5:stride * 9 + 7 + 7] = b'13'
+        values = parse_many(buffer, stride, offset=7)
+        assert values.dtype == 'datetime64[s]'
+        assert values.tolist() == [None if index in (7, 9) else dt for index, dt in enumerate(dts)]
+        assert parse_many(memoryview(buffer), stride, offset=7, count=3).tolist() == dts[:3]
+        assert parse_many(b'2017-12-082017-12-09', format='%Y-%m-%d').tolist() == [datetime.datetime(2017, 12, 8), datetime.datetime(2017, 12, 9)]
+        assert parse_many(b'20171208152700.000001', format='%Y%m%d%H%M%S.%f').tolist() == [DT.replace(microsecond=1)]
+        assert parse_many(b'', stride).tolist() == []
+        with pytest.raises(ValueError):
+            parse_many(buffer, stride, offset=7, count=301)
+
+    def test_parse_many_matches_parse(self):
+        records = [b'2016-02-29 23:59:59', b'1900-02-29 00:00:00', b'2000-02-29 00:00:00', b'0000-01-01 00:00:00', b'9999-12-31 23:59:59', b'2017-12-08 15:27:60', b'2017-04-31 00:00:00']
+        values = parse_many(b''.join(records))
+        assert values.tolist() == [parse(record) for record in records]
+
+    def test_tc(self):
+        assert tc.string_to_datetime(b'2017-12-08 15:27:00') == DT
+        assert tc.string_to_datetime(bytearray(b'2017-12-08')) == datetime.datetime(2017, 12, 8)
+        assert tc.string_to_datetime(b'2017-12-08T07:27:00Z') == datetime.datetime(2017, 12, 8, 7, 27, tzinfo=tz.UTC)
+        assert tc.string_to_datetime(b'08 Dec 2017', '%d %b %Y') == datetime.datetime(2017, 12, 8)
+        assert tc.string_to_datetime(b'\xff\xfe') is None
+        assert tc.string_to_utc_datetime(b'2017-12-08 15:27:00') == tc.string_to_utc_datetime('2017-12-08 15:27:00')
+        assert tc.buffer_to_datetime(b'id=0001|2017-12-08 15:27:00|GET', 8, 19) == DT
+        assert tc.buffer_to_datetimes(b'2017-12-08 15:27:002017-12-08 15:27:01').tolist() == [DT, DT.replace(second=1)]
@@ -0,0 +1,47 @@
+import datetime
+import random
+
+import pytest
+
+from TimeConvert import BusinessCalendar
+from TimeConvert import TimeConvert as tc
+
+
+class TestBusinessCalendar(object):
+
+    def test_busday(self):
+        calendar = tc.business_calendar(holidays=['2018-01-01', '2017-12-25'])
+        assert calendar.is_busday('2017-12-08')
+        assert not calendar.is_busday('2017-12-09')
+        assert not calendar.is_busday(datetime.date(2017, 12, 25))
+        assert calendar.busday_count('2017-12-01', '2018-01-01') == 20
+        assert calendar.busday_count('2018-01-01', '2017-12-01') == -19
+        assert calendar.next_busday('2017-12-29') == datetime.date(2018, 1, 2)
+        assert calendar.previous_busday('2018-01-02') == datetime.date(2017, 12, 29)
+        assert calendar.busday_offset('2017-12-22', 1) == datetime.date(2017, 12, 26)
+        assert calendar.busday_offset('2017-12-23', 0, roll='forward') == datetime.date(2017, 12, 26)
+        assert calendar.busday_offset('2017-12-23', 0, roll='backward') == datetime.date(2017, 12, 22)
+        assert calendar.busday_offset('2017-12-30', 0, roll='modifiedfollowing') == datetime.date(2017, 12, 29)
+        with pytest.raises(ValueError):
+            calendar.busday_offset('2017-12-23', 1)
+
+    def test_weekmask(self):
+        assert BusinessCalendar('Sun Mon Tue Wed Thu').weekmask == (True, True, True, True, False, False, True)
+        assert tc.busday_count('2017-12-08', '2017-12-31', weekmask='0000001') == tc.isoweekdaycount('2017-12-08', '2017-12-30')
+        with pytest.raises(ValueError):
+            BusinessCalendar('0000000')
+
+    def test_matches_numpy(self):
+        np = pytest.importorskip('numpy')
+        rnd = random.Random(3)
+        weekmask = '1011110'
+        holidays = sorted(set(datetime.date(2017, 1, 1) + datetime.timedelta(rnd.randint(0, 1000)) for _ in range(100)))
+        calendar = BusinessCalendar(weekmask, holidays)
+        starts = np.array([datetime.date(2017, 1, 1) + datetime.timedelta(rnd.randint(0, 1000)) for _ in range(500)], dtype='datetime64[D]')
+        ends = np.array([datetime.date(2017, 1, 1) + datetime.timedelta(rnd.randint(0, 1000)) for _ in range(500)], dtype='datetime64[D]')
+        expected = np.busday_count(starts, ends, weekmask=weekmask, holidays=holidays)
+        assert (calendar.busday_count_many(starts, ends) == expected).all()
+        assert calendar.busday_count_many(starts.tolist(), ends.tolist()) == expected.tolist()
+        for start, offset in zip(starts.tolist(), range(-250, 250)):
+            for roll in ('forward', 'backward', 'modifiedfollowing', 'modifiedpreceding'):
+                assert calendar.busday_offset(start, offset, roll=roll) == np.busday_offset(start, offset, roll=roll, weekmask=weekmask, holidays=holidays).tolist()
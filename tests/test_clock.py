@@ -0,0 +1,68 @@
+import datetime
+import threading
+import time
+
+from TimeConvert import CoarseClock, FrozenClock, StopWatch, TimeConvert, TimeType
+from TimeConvert import clock as clock_module
+from TimeConvert.convert import TimeConvertTools
+
+
+class TestClock(object):
+
+    def test_frozen_clock(self):
+        clock = FrozenClock(datetime.datetime(2017, 12, 8, 7, 27, 0))
+        tc = TimeConvertTools(timezone='Asia/Shanghai', clock=clock)
+        assert tc.utc_datetime() == datetime.datetime(2017, 12, 8, 7, 27, 0, tzinfo=datetime.timezone.utc)
+        assert tc.local_string() == '2017-12-08 15:27:00'
+        clock.advance(minutes=33)
+        assert tc.local_string() == '2017-12-08 16:00:00'
+        assert tc.utc_timestamp() - TimeConvert.datetime_to_timestamp(datetime.datetime(2017, 12, 8, 8, 0, 0)) == 0
+
+    def test_snapshot(self):
+        clock = FrozenClock(1512718020)
+        tc = TimeConvertTools(clock=clock)
+        with tc.snapshot() as now:
+            clock.advance(60)
+            assert now == 1512718020
+            assert tc.clock_time() == 1512718020
+            assert tc.utc_datetime() == datetime.datetime(2017, 12, 8, 7, 27, 0, tzinfo=datetime.timezone.utc)
+
+            # Snapshots are per context, other threads still read the clock
+            other = []
+            thread = threading.Thread(target=lambda: other.append(tc.clock_time()))
+            thread.start()
+            thread.join()
+            assert other == [1512718080]
+        assert tc.clock_time() == 1512718080
+
+    def test_thread_snapshot(self, monkeypatch):
+        # Python < 3.7 has no contextvars, snapshots are per thread
+        monkeypatch.setattr(clock_module, '_snapshot', clock_module._ThreadSnapshot())
+        clock = FrozenClock(1512718020)
+        tc = TimeConvertTools(clock=clock)
+        with tc.snapshot():
+            with tc.snapshot():
+                clock.advance(60)
+                assert tc.clock_time() == 1512718020
+            other = []
+            thread = threading.Thread(target=lambda: other.append(tc.clock_time()))
+            thread.start()
+            thread.join()
+            assert other == [1512718080]
+            assert tc.clock_time() == 1512718020
+        assert tc.clock_time() == 1512718080
+
+    def test_coarse_clock(self):
+        with CoarseClock(resolution=0.005) as clock:
+            first = clock.time()
+            assert abs(first - time.time()) < 1
+            time.sleep(0.05)
+            assert clock.time() > first
+
+    def test_stopwatch_clock(self):
+        clock = FrozenClock()
+        sw = StopWatch('clock', time_type=TimeType.second, clock=clock)
+        sw.start('task')
+        clock.advance(1.5)
+        sw.stop()
+        assert sw.get_last_task_time_seconds() == 1.5
@@ -0,0 +1,89 @@
+import datetime
+
+import pytest
+from dateutil import tz
+
+from TimeConvert import TimeConvert as tc
+
+
+pd = pytest.importorskip('pandas')
+
+from TimeConvert import columnar  # noqa: E402
+
+
+STRINGS = ['2017-12-08 15:27:00', '2017-01-01 00:00:00', '2016-02-29 23:59:59', '2017-12-08', 'invalid', None]
+ISO_STRINGS = STRINGS + ['2017-12-08T15:27:00Z', '2017-12-08T15:27:00.123', '2017-12-08T15:27:00', '2024-W05-3', '2017-12-08T23:27:00+08:00', '2017-12-08T25:00:00']
+STAMPS = [1512718020, 1483200000, 1456761599.5, 0, 2147483647]
+
+
+def scalars(values):
+    """Values of a column, nulls as None, timestamps as datetimes."""
+    return [None if pd.isna(value) else (value.to_pydatetime() if isinstance(value, pd.Timestamp) else value) for value in values]
+
+
+class TestColumnar(object):
+
+    def test_string_to_datetime(self):
+        assert scalars(columnar.string_to_datetime(pd.Series(STRINGS))) == [tc.string_to_datetime(string) if string else None for string in STRINGS]
+        expected = [tc.string_to_datetime(string) if string else None for string in ISO_STRINGS]
+        result = scalars(columnar.string_to_datetime(pd.Series(ISO_STRINGS)))
+        assert result == expected
+        assert [dt.utcoffset() for dt in result if dt] == [dt.utcoffset() for dt in expected if dt]
+        assert scalars(columnar.string_to_datetime(pd.Series(['2017-12-08', '2017-12-08 15:27:00']), format='%Y-%m-%d')) == [datetime.datetime(2017, 12, 8), None]
+
+    def test_string_to_local_utc_datetime(self):
+        for name in ('string_to_local_datetime', 'string_to_utc_datetime', 'utc_string_to_local_datetime', 'utc_string_to_utc_datetime'):
+            for strings in (STRINGS, ISO_STRINGS):
+                expected = [getattr(tc, name)(string) if string else None for string in strings]
+                result = scalars(getattr(columnar, name)(pd.Series(strings)))
+                assert result == expected
+                assert [dt.utcoffset() for dt in result if dt] == [dt.utcoffset() for dt in expected if dt]
+
+    def test_ambiguous_wall_clock(self):
+        strings = ['2017-11-05 01:30:00', '2017-03-12 02:30:00']
+        result = scalars(columnar.string_to_local_datetime(pd.Series(strings), timezone='America/New_York'))
+        # Aware datetimes of different tzinfo never compare equal within a fold, compare instants
+        assert result[0].timestamp() == datetime.datetime(2017, 11, 5, 1, 30, tzinfo=tz.gettz('America/New_York')).timestamp()
+        assert result[0].utcoffset() == datetime.timedelta(hours=-4)
+        assert result[1] is None
+
+    def test_to_utc_local_datetime(self):
+        values = pd.Series([datetime.datetime(2017, 12, 8, 15, 27), datetime.datetime(2017, 1, 1)])
+        aware = pd.Series([datetime.datetime(2017, 12, 8, 16, 27), datetime.datetime(2017, 1, 1, 1)]).dt.tz_localize('Asia/Tokyo')
+        for column in (values, aware):
+            datetimes = scalars(column)
+            assert scalars(columnar.to_utc_datetime(column)) == [tc.normalize(dt) for dt in datetimes]
+            assert scalars(columnar.to_local_datetime(column)) == [tc.normalize(dt, dttype='local') for dt in datetimes]
+            assert [str(dt.tzinfo) for dt in scalars(columnar.to_local_datetime(column))] == [tc.TIME_ZONE] * 2
+
+    def test_datetime_to_string(self):
+        dts = [datetime.datetime(2017, 12, 8, 15, 27), datetime.datetime(2016, 2, 29, 23, 59, 59)]
+        assert columnar.datetime_to_string(pd.Series(dts)).tolist() == [tc.datetime_to_string(dt) for dt in dts]
+        assert columnar.datetime_to_string(pd.Series(dts), format='%Y%m%d').tolist() == [tc.datetime_to_string(dt, '%Y%m%d') for dt in dts]
+
+    def test_timestamps(self):
+        expected = [tc.timestamp_to_local_datetime(stamp) for stamp in STAMPS]
+        assert scalars(columnar.timestamp_to_local_datetime(pd.Series(STAMPS))) == expected
+        assert columnar.datetime_to_timestamp(pd.Series(expected)).tolist() == [tc.datetime_to_timestamp(dt) for dt in expected]
+        aware = pd.Series(expected).dt.tz_localize('Asia/Tokyo')
+        assert columnar.datetime_to_timestamp(aware).tolist() == [tc.datetime_to_timestamp(dt) for dt in scalars(aware)]
+
+    def test_bucket(self):
+        dts = [datetime.datetime(2017, 12, 31, 23, 30), datetime.datetime(2018, 1, 1, 0, 30), datetime.datetime(2016, 2, 29)]
+        aware = pd.Series(dts).dt.tz_localize('UTC')
+        for granularity in ('day', 'week', 'month', 'quarter'):
+            for timezone in ('Asia/Shanghai', 'America/New_York'):
+                assert columnar.bucket(pd.Series(STAMPS), granularity, timezone).tolist() == tc.bucket(STAMPS, granularity, timezone)
+                assert columnar.bucket(aware, granularity, timezone).tolist() == tc.bucket(scalars(aware), granularity, timezone)
+            assert scalars(columnar.bucket(pd.Series(dts), granularity)) == tc.bucket(dts, granularity)
+            assert scalars(columnar.bucket(pd.Series(STRINGS), granularity)) == tc.bucket(STRINGS, granularity)
+            assert scalars(columnar.bucket(pd.Series(ISO_STRINGS), granularity, 'America/New_York')) == tc.bucket(ISO_STRINGS, granularity, 'America/New_York')
+
+    def test_pyarrow(self):
+        pa = pytest.importorskip('pyarrow')
+        result = columnar.utc_string_to_local_datetime(pa.chunked_array([STRINGS[:3], STRINGS[3:]]))
+        assert isinstance(result, pa.Array)
+        assert scalars(result.to_pandas()) == [tc.utc_string_to_local_datetime(string) if string else None for string in STRINGS]
+        buckets = columnar.bucket(pa.array(STAMPS), 'week')
+        assert isinstance(buckets, pa.Array)
+        assert buckets.to_pylist() == tc.bucket(STAMPS, 'week')
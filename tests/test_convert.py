@@ -1,14 +1,13 @@
 # -*- coding: utf-8 -*-
 
 import datetime
-import types
 
 import pytest
 from dateutil.tz import tz
 
-from TimeConvert import ISOWeek, Month, Quarter
+from TimeConvert import DateRange, ISOWeek, Month, MonthRange, Quarter, QuarterRange
 from TimeConvert import TimeConvert as tc
-from TimeConvert import Week
+from TimeConvert import Week, WeekRange
 
 
 class TestTimeConvertCommands(object):
@@ -486,7 +485,7 @@ class TestTimeConvertCommands(object):
 
     def test_date_range(self):
         dates = tc.date_range('2017-12-08', '2017-12-31')
-        assert isinstance(dates, types.GeneratorType)
+        assert isinstance(dates, DateRange)
         dates = [date for date in dates]
         assert isinstance(dates[0], datetime.date)
         assert dates[0] == datetime.date(2017, 12, 8)
@@ -512,7 +511,7 @@ class TestTimeConvertCommands(object):
 
     def test_week_range(self):
         weeks = tc.week_range('2017-12-08', '2017-12-31')
-        assert isinstance(weeks, types.GeneratorType)
+        assert isinstance(weeks, WeekRange)
         weeks = [week for week in weeks]
         assert isinstance(weeks[0], ISOWeek)
         assert weeks[0] == ISOWeek(2017, 49)
@@ -539,7 +538,7 @@ class TestTimeConvertCommands(object):
 
     def test_month_range(self):
         months = tc.month_range('2017-12-08', '2017-12-31')
-        assert isinstance(months, types.GeneratorType)
+        assert isinstance(months, MonthRange)
         months = [month for month in months]
         assert isinstance(months[0], Month)
         assert months[0] == Month(2017, 12)
@@ -566,7 +565,7 @@ class TestTimeConvertCommands(object):
 
     def test_quarter_range(self):
         quarters = tc.quarter_range('2017-12-08', '2017-12-31')
-        assert isinstance(quarters, types.GeneratorType)
+        assert isinstance(quarters, QuarterRange)
         quarters = [quarter for quarter in quarters]
         assert isinstance(quarters[0], Quarter)
         assert quarters[0] == Quarter(2017, 4)
@@ -0,0 +1,82 @@
+import copy
+import datetime
+import json
+import pickle
+
+import pytest
+
+from TimeConvert import Delta
+from TimeConvert import TimeConvert as tc
+
+
+class TestDelta(object):
+
+    def test_delta_fields(self):
+        delta = tc.timestamp_delta(1512718020, 1514705220 + 3723, interval=3600)
+        assert isinstance(delta, Delta)
+        assert delta['total_seconds'] == delta.total_seconds == 1990923
+        assert delta.get('days') == 23
+        assert delta.get('years', 0) == 0
+        assert 'hours' in delta
+        assert 'years' not in delta
+        assert delta == {
+            'sign': -1,
+            'weeks': 3,
+            'days': 23,
+            'hours': 1,
+            'minutes': 2,
+            'seconds': 3,
+            'total_seconds': 1990923,
+            'delta': -1990923,
+            'count_down_seconds': 1990923,
+            'interval': True,
+        }
+        assert list(delta)[0] == 'sign'
+        assert len(delta) == 10
+
+    def test_dict_compatibility(self):
+        delta = tc.timestamp_delta(1514705220, 1512718020)
+        assert delta['delta'] == 1987200
+        assert dict(delta) == tc.timestamp_delta(1514705220, 1512718020)
+        assert json.loads(json.dumps(delta)) == dict(delta)
+        assert pickle.loads(pickle.dumps(delta)) == delta
+        assert copy.copy(delta) == delta
+        assert {**delta}['weeks'] == 3
+        assert delta.pop('interval') is None
+        assert 'interval' not in delta
+
+    def test_seconds_between(self):
+        assert tc.seconds_between('2017-12-31 15:27:00', '2017-12-08 15:27:00') == 1987200
+        assert tc.seconds_between(1512718020, 1514705220) == -1987200
+        assert tc.seconds_between('2017-12-31 15:27:00', '2017-12-08 15:27:00') == tc.delta('2017-12-31 15:27:00', '2017-12-08 15:27:00')['delta']
+
+    def test_delta_many(self):
+        values1 = ['2017-12-31 15:27:00', datetime.datetime(2017, 12, 31, 15, 27, 0), 1514705220]
+        values2 = ['2017-12-08 15:27:00', datetime.datetime(2017, 12, 8, 15, 27, 0), 1512718020]
+        assert tc.delta_many(values1, values2) == [tc.seconds_between(value1, value2) for value1, value2 in zip(values1, values2)]
+        assert tc.delta_many([1514705220, 1512718020], 1512718020) == [1987200, 0]
+        assert tc.delta_many(1512718020, (1514705220, 1512718020)) == [-1987200, 0]
+
+    def test_delta_many_numpy(self):
+        np = pytest.importorskip('numpy')
+        stamps = np.arange(1512718020, 1514705220, 3600)
+        assert (tc.delta_many(stamps, stamps[::-1]) == stamps - stamps[::-1]).all()
+        assert tc.delta_many(stamps, '2017-12-08 15:27:00').tolist() == tc.delta_many(stamps.tolist(), '2017-12-08 15:27:00')
+
+    def test_countdown_many(self):
+        now = tc.utc_timestamp()
+        values = [now + 100, now - 100, tc.utc_datetime(seconds=100), tc.local_string(seconds=100), 'invalid']
+        countdowns = tc.countdown_many(values, now=now)
+        assert countdowns[:2] == [100, 0]
+        assert 99 <= countdowns[2] <= 100
+        assert 99 <= countdowns[3] <= 100
+        assert countdowns[4] is None
+        assert tc.countdown_many([1, 2]) == [0, 0]
+
+    def test_countdown_many_numpy(self):
+        np = pytest.importorskip('numpy')
+        now = tc.utc_timestamp()
+        stamps = np.arange(now - 1000, now + 1000)
+        countdowns = tc.countdown_many(stamps, now=now)
+        assert isinstance(countdowns, np.ndarray)
+        assert countdowns.tolist() == [tc.timestamp_countdown(stamp) if stamp <= now else stamp - now for stamp in stamps.tolist()]
@@ -0,0 +1,52 @@
+import datetime
+
+import pytest
+from dateutil.tz import tz
+
+from TimeConvert import TimeConvert as tc
+from TimeConvert.epoch import convert, from_datetime, to_datetime
+
+
+class TestEpoch(object):
+
+    def test_from_to_datetime(self):
+        dt = datetime.datetime(2017, 12, 8, 7, 27, 0, 999999)
+        assert from_datetime(dt) == 1512718020
+        assert from_datetime(dt, 'ms') == 1512718020999
+        assert from_datetime(dt, 'us') == 1512718020999999
+        assert from_datetime(dt, 'ns') == 1512718020999999000
+        assert from_datetime(dt.replace(tzinfo=tz.gettz('Asia/Shanghai')), 'us') == 1512718020999999 - 8 * 3600 * 10 ** 6
+        assert from_datetime(datetime.datetime(1969, 12, 31, 23, 59, 59, 500000), 'ms') == -500
+        for unit in ('s', 'ms', 'us', 'ns'):
+            assert to_datetime(from_datetime(dt, unit), unit) == (dt if unit in ('us', 'ns') else dt.replace(microsecond=dt.microsecond // 1000 * 1000 if unit == 'ms' else 0))
+        assert to_datetime(-500, 'ms') == datetime.datetime(1969, 12, 31, 23, 59, 59, 500000)
+        assert to_datetime(1512718020, tzinfo=tz.gettz('Asia/Shanghai')) == datetime.datetime(2017, 12, 8, 15, 27, tzinfo=tz.gettz('Asia/Shanghai'))
+        with pytest.raises(ValueError):
+            from_datetime(dt, 'minutes')
+
+    def test_convert(self):
+        assert convert(1512718020999999, 'us', 'ms') == 1512718020999
+        assert convert(1512718020, 's', 'ns') == 1512718020000000000
+        assert convert(-1, 'ms', 's') == -1
+        np = pytest.importorskip('numpy')
+        stamps = np.array([1512718020999999, -1], dtype=np.int64)
+        assert convert(stamps, 'us', 'ms').tolist() == [1512718020999, -1]
+        assert tc.datetimes_to_epochs(np.array(['2017-12-08T07:27:00.999999'], dtype='datetime64[us]'), 'ns').tolist() == [1512718020999999000]
+        assert tc.datetimes_to_epochs([datetime.datetime(2017, 12, 8, 7, 27)], 'ms').dtype == np.int64
+
+    def test_tc(self):
+        dt = datetime.datetime(2017, 12, 8, 7, 27, 0, 123456)
+        assert tc.epoch_to_datetime(tc.datetime_to_epoch(dt, 'us'), 'us') == dt
+        assert tc.epoch_to_datetime(1512718020, timezone='Asia/Shanghai').hour == 15
+        assert tc.epochs_to_datetimes([1512718020123, 0], 'ms') == [dt.replace(microsecond=123000), datetime.datetime(1970, 1, 1)]
+        assert tc.epoch_convert(1512718020, 's', 'ms') == 1512718020000
+
+    def test_exact_timestamps(self):
+        dt = tc.timestamp_to_local_datetime(13733815619).replace(microsecond=840775)
+        stamp = tc.datetime_to_timestamp(dt)
+        # Through a float, 13733815619840774
+        assert tc.utc_timestamp(utc_dt=dt, ms=True, micro=True) == stamp * 10 ** 6 + 840775
+        assert tc.local_timestamp(local_dt=dt, ms=True, milli=True) == stamp * 10 ** 3 + 840
+        assert tc.utc_timestamp(utc_dt=dt, micro=True) == stamp * 10 ** 6
+        assert isinstance(tc.utc_timestamp(utc_dt=dt, ms=True), float)
+        assert tc.seconds_to_microseconds(stamp) == stamp * 10 ** 6
@@ -0,0 +1,98 @@
+import random
+
+import pytest
+
+from TimeConvert import TimeConvert as tc
+from TimeConvert import epochfile
+from TimeConvert.zonetable import get_zone_table
+
+
+np = pytest.importorskip('numpy')
+
+
+def write(path, values):
+    np.asarray(values, dtype='<i8').tofile(str(path))
+
+
+def read(path):
+    return np.fromfile(str(path), dtype='<i8').tolist()
+
+
+class TestEpochFile(object):
+
+    def setup_method(self):
+        rnd = random.Random(40)
+        # Microseconds around DST transitions and over decades
+        self.seconds = [1509858000 + rnd.randint(-7200, 7200) for _ in range(50)] + [rnd.randint(0, 2 ** 31) for _ in range(50)]
+        self.micros = [stamp * 10 ** 6 + rnd.randint(0, 10 ** 6 - 1) for stamp in self.seconds]
+
+    def test_to_local_to_utc(self, tmp_path):
+        table = get_zone_table('America/New_York')
+        src, local, utc = tmp_path / 'src.bin', tmp_path / 'local.bin', tmp_path / 'utc.bin'
+        write(src, self.micros)
+        assert tc.convert_epoch_file(str(src), 'to_local', out=str(local), timezone='America/New_York', window=7) == 100
+        assert read(local) == [micro + table.utcoffset(stamp) * 10 ** 6 for micro, stamp in zip(self.micros, self.seconds)]
+        tc.convert_epoch_file(str(local), 'to_utc', out=str(utc), timezone='America/New_York', window=7)
+        expected = [micro - (micro // 10 ** 6 - table.utc_stamp(micro // 10 ** 6)) * 10 ** 6 for micro in read(local)]
+        assert read(utc) == expected
+        # Only the second occurrence of ambiguous wall-clock times moves to the first
+        assert sum(a != b for a, b in zip(read(utc), self.micros)) == sum(table.utc_stamp(table.local_stamp(stamp)) != stamp for stamp in self.seconds)
+        assert read(src) == self.micros
+
+    def test_in_place(self, tmp_path):
+        path = tmp_path / 'events.bin'
+        write(path, self.micros)
+        tc.convert_epoch_file(str(path), 'to_local', window=3)
+        table = tc.zone_table()
+        assert read(path) == [micro + table.utcoffset(stamp) * 10 ** 6 for micro, stamp in zip(self.micros, self.seconds)]
+
+    def test_bucket(self, tmp_path):
+        src, out = tmp_path / 'src.bin', tmp_path / 'out.bin'
+        write(src, self.micros)
+        for granularity in ('day', 'week', 'month', 'quarter'):
+            tc.convert_epoch_file(str(src), granularity, out=str(out), timezone='America/New_York', window=16)
+            assert read(out) == tc.bucket(self.seconds, granularity, timezone='America/New_York')
+
+    def test_to_unit(self, tmp_path):
+        src, out = tmp_path / 'src.bin', tmp_path / 'out.bin'
+        write(src, self.micros)
+        tc.convert_epoch_file(str(src), 'to_unit', out=str(out), to_unit='s')
+        assert read(out) == self.seconds
+        tc.convert_epoch_file(str(out), 'to_unit', unit='s', to_unit='ms')
+        assert read(out) == [stamp * 1000 for stamp in self.seconds]
+        tc.convert_epoch_file(str(src), 'to_unit', out=str(out), to_unit='ns')
+        assert read(out) == [micro * 1000 for micro in self.micros]
+        write(src, [-1, -1000])
+        tc.convert_epoch_file(str(src), 'to_unit', unit='ms', to_unit='s')
+        assert read(src) == [-1, -1]
+
+    def test_errors(self, tmp_path):
+        path = tmp_path / 'events.bin'
+        path.write_bytes(b'\0' * 12)
+        with pytest.raises(ValueError):
+            tc.convert_epoch_file(str(path), 'to_local')
+        write(path, [])
+        assert tc.convert_epoch_file(str(path), 'to_local') == 0
+        with pytest.raises(ValueError):
+            tc.convert_epoch_file(str(path), 'year')
+        with pytest.raises(ValueError):
+            tc.convert_epoch_file(str(path), 'to_unit', to_unit='ps')
+        write(path, self.micros)
+        link = tmp_path / 'link.bin'
+        link.symlink_to(path)
+        for out in (path, link, tmp_path / '.' / 'events.bin'):
+            with pytest.raises(ValueError, match='in place'):
+                tc.convert_epoch_file(str(path), 'to_unit', out=str(out), to_unit='s')
+        assert read(path) == self.micros
+
+    def test_without_numpy(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(epochfile, 'np', None)
+        with pytest.raises(ImportError, match='numpy'):
+            epochfile.convert_window([0], 'to_unit', to_unit='s')
+        with pytest.raises(ImportError, match='numpy'):
+            tc.convert_epoch_file(str(tmp_path / 'events.bin'), 'to_local')
+
+    def test_utc_stamps(self):
+        table = get_zone_table('America/New_York')
+        local_stamps = [table.local_stamp(stamp) for stamp in self.seconds] + [1489285800, 1509845400]
+        assert table.utc_stamps(local_stamps).tolist() == [table.utc_stamp(local_stamp) for local_stamp in local_stamps]
@@ -0,0 +1,67 @@
+import datetime
+import random
+
+import pytest
+from dateutil.tz import tz
+
+from TimeConvert import TimeConvert as tc
+from TimeConvert.fanout import FanOut
+
+
+ZONES = ['Asia/Shanghai', 'Asia/Singapore', 'Asia/Kolkata', 'Europe/London', 'Europe/Paris', 'America/New_York', 'America/Toronto', 'Australia/Lord_Howe', 'UTC']
+UTC_DT = datetime.datetime(2017, 12, 8, 7, 27, 0, 123456, tzinfo=tz.UTC)
+
+
+class TestFanOut(object):
+
+    def test_fan_out(self):
+        strings = tc.fan_out(UTC_DT, ZONES)
+        assert list(strings) == ZONES
+        assert strings['Asia/Shanghai'] == '2017-12-08 15:27:00'
+        assert strings['America/New_York'] == '2017-12-08 02:27:00'
+        for zone in ZONES:
+            assert strings[zone] == tc.datetime_to_string(UTC_DT.astimezone(tc.tzinfo(zone)))
+        dts = tc.fan_out(UTC_DT, ZONES, output='datetime')
+        for zone in ZONES:
+            assert dts[zone] == UTC_DT
+            assert dts[zone].replace(tzinfo=None) == UTC_DT.astimezone(tc.tzinfo(zone)).replace(tzinfo=None)
+            assert dts[zone].tzinfo is tc.tzinfo(zone)
+        assert tc.fan_out(UTC_DT, ZONES, output='isostring')['Asia/Kolkata'] == '2017-12-08T12:57:00.123456+05:30'
+        assert tc.fan_out(UTC_DT, ZONES, output='isostring')['UTC'] == '2017-12-08T07:27:00.123456+00:00'
+        assert tc.fan_out(UTC_DT, ZONES, output='naive')['Europe/Paris'] == datetime.datetime(2017, 12, 8, 8, 27, 0, 123456)
+        assert tc.fan_out(UTC_DT, ZONES, output='offset')['Australia/Lord_Howe'] == 11 * 3600
+        assert tc.fan_out(UTC_DT, ZONES, format='%H:%M %Z')['Europe/London'] == '07:27 GMT'
+
+    def test_inputs(self):
+        expected = tc.fan_out(UTC_DT, ZONES, output='naive')
+        assert tc.fan_out(1512718020.123456, ZONES, output='naive') == expected
+        assert tc.fan_out('2017-12-08 15:27:00', ZONES, output='naive', input_timezone='Asia/Shanghai') == tc.fan_out(1512718020, ZONES, output='naive')
+        assert tc.fan_out(datetime.datetime(2017, 12, 8, 2, 27), ZONES, input_timezone='America/New_York') == tc.fan_out(1512718020, ZONES)
+        assert tc.fan_out('invalid', ZONES) == dict.fromkeys(ZONES)
+        with pytest.raises(ValueError):
+            tc.fan_out(UTC_DT, ZONES, output='week')
+
+    def test_ambiguous(self):
+        # 01:30 happens twice in New York on 2017-11-05
+        first, second = tc.fan_out_many([1509859800, 1509863400], ['America/New_York'], output='datetime')['America/New_York']
+        assert first.replace(tzinfo=None) == second.replace(tzinfo=None) == datetime.datetime(2017, 11, 5, 1, 30)
+        assert (first.fold, second.fold) == (0, 1)
+        assert (first.timestamp(), second.timestamp()) == (1509859800, 1509863400)
+
+    def test_fan_out_many(self):
+        rnd = random.Random(49)
+        stamps = [rnd.randint(0, 2 ** 31) for _ in range(50)] + [None]
+        table = tc.fan_out_many(stamps, ZONES)
+        for zone in ZONES:
+            assert table[zone] == [tc.fan_out(stamp, [zone])[zone] if stamp is not None else None for stamp in stamps]
+            assert table[zone][:-1] == [datetime.datetime.fromtimestamp(stamp, tc.tzinfo(zone)).strftime(tc.DATETIME_FORMAT) for stamp in stamps[:-1]]
+        # Same offsets, same values, in separate lists
+        summer = tc.fan_out_many([1500000000], ['Asia/Shanghai', 'Asia/Singapore'])
+        assert summer['Asia/Shanghai'] == summer['Asia/Singapore'] and summer['Asia/Shanghai'] is not summer['Asia/Singapore']
+
+    def test_fan_out_class(self):
+        fan_out = FanOut([('Asia/Shanghai', tc.zone_table('Asia/Shanghai'), tc.tzinfo('Asia/Shanghai'))], output='offset')
+        assert fan_out(1512718020 * 10 ** 6) == {'Asia/Shanghai': 8 * 3600}
+        assert fan_out(None) == {'Asia/Shanghai': None}
+        with pytest.raises(ValueError):
+            FanOut([], output='string')
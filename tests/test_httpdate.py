@@ -0,0 +1,60 @@
+import random
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+
+from TimeConvert import FrozenClock
+from TimeConvert import TimeConvert as tc
+from TimeConvert.convert import TimeConvertTools
+from TimeConvert.httpdate import format_http_date, format_rfc2822, parse_http_date, parse_rfc2822
+
+
+class TestHTTPDate(object):
+
+    def test_format_http_date(self):
+        assert format_http_date(1512718020) == 'Fri, 08 Dec 2017 07:27:00 GMT'
+        assert format_http_date(1512718020.9) == 'Fri, 08 Dec 2017 07:27:00 GMT'
+        rnd = random.Random(45)
+        for stamp in [0, -1, 951782400] + [rnd.randint(-2 ** 31, 2 ** 33) for _ in range(200)]:
+            assert format_http_date(stamp) == formatdate(stamp, usegmt=True)
+            assert parse_http_date(format_http_date(stamp)) == stamp
+        assert tc.utc_string(utc_dt=tc.timestamp_to_utc_datetime(1512718020), format='%a, %d %b %Y %H:%M:%S GMT') == format_http_date(1512718020)
+
+    def test_cache(self):
+        assert format_http_date(1512718020) is format_http_date(1512718020.5)
+        results = []
+
+        def render():
+            results.extend(format_http_date(1512718020 + i % 3) for i in range(3000))
+        threads = [threading.Thread(target=render) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert set(results) == set(format_http_date(1512718020 + i) for i in range(3))
+
+    def test_parse_http_date(self):
+        assert parse_http_date('Sun, 06 Nov 1994 08:49:37 GMT') == 784111777
+        assert parse_http_date('Sunday, 06-Nov-94 08:49:37 GMT') == 784111777
+        assert parse_http_date('Sun Nov  6 08:49:37 1994') == 784111777
+        assert parse_http_date('Thursday, 01-Jan-70 00:00:00 GMT') == 0
+        assert parse_http_date('Wednesday, 01-Jan-25 00:00:00 GMT') == 1735689600
+        for string in ('Sun, 06 Nov 1994 08:49:37 +0000', 'Sun, 31 Nov 1994 08:49:37 GMT', 'Sun, 06 Nov 1994 24:00:00 GMT', 'invalid', ''):
+            assert parse_http_date(string) is None, string
+
+    def test_rfc2822(self):
+        assert format_rfc2822(1512718020) == 'Fri, 08 Dec 2017 07:27:00 +0000'
+        assert format_rfc2822(1512718020, 8 * 3600) == 'Fri, 08 Dec 2017 15:27:00 +0800'
+        assert format_rfc2822(1512718020, -(3 * 3600 + 1800)) == 'Fri, 08 Dec 2017 03:57:00 -0330'
+        for string in ('Fri, 08 Dec 2017 15:27:00 +0800', '8 Dec 2017 02:27 EST', 'Fri,  8 Dec 17 07:27:00 GMT', 'Fri, 08 Dec 2017 01:27:00 -0600'):
+            assert parse_rfc2822(string) == int(parsedate_to_datetime(string).timestamp()), string
+        assert parse_rfc2822('Fri, 08 Dec 2017 15:27:00 +0800') == 1512718020
+        assert parse_rfc2822('Fri, 32 Dec 2017 15:27:00 +0800') is None
+        assert parse_rfc2822('2017-12-08 15:27:00') is None
+
+    def test_tc(self):
+        converter = TimeConvertTools(clock=FrozenClock(1512718020))
+        assert converter.http_date() == 'Fri, 08 Dec 2017 07:27:00 GMT'
+        assert converter.rfc2822_date(timezone='Asia/Shanghai') == 'Fri, 08 Dec 2017 15:27:00 +0800'
+        assert converter.rfc2822_date(1512718020 - 180 * 86400, timezone='America/New_York') == 'Sun, 11 Jun 2017 03:27:00 -0400'
+        assert tc.http_date_to_timestamp(tc.http_date(1512718020)) == 1512718020
+        assert tc.rfc2822_to_timestamp(tc.rfc2822_date(1512718020)) == 1512718020
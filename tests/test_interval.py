@@ -0,0 +1,74 @@
+import datetime
+import random
+
+import pytest
+
+from TimeConvert import TimeConvert as tc
+from TimeConvert import TimeRangeIndex
+
+
+class TestTimeRangeIndex(object):
+
+    def test_stab_matches_between(self):
+        windows = [
+            ('2017-12-06 15:27:00', '2017-12-31 15:27:00', 'december'),
+            ('2017-12-31', '2017-12-06', 'reversed'),
+            ('2017-12-08 15:27:00', '2017-12-08 15:27:00', 'instant'),
+            ('2018-01-01', '2018-01-31', 'january'),
+        ]
+        index = tc.time_range_index(windows)
+        for value in ('2017-12-08 15:27:00', '2017-12-05', '2018-01-01', '2017-12-31 15:27:01'):
+            expected = [data for start, end, data in windows if tc.between(value, start, end)]
+            assert [time_range.data for time_range in index.stab(value)] == expected
+
+    def test_insert_delete(self):
+        rnd = random.Random(11)
+        index = TimeRangeIndex()
+        ranges = {}
+        for step in range(3000):
+            if ranges and rnd.random() < 0.3:
+                key = rnd.choice(sorted(ranges))
+                index.remove(key)
+                del ranges[key]
+            else:
+                start = rnd.randint(0, 10 ** 5)
+                # Mix of random and ever increasing ranges, the later forcing rebuilds
+                end = start + rnd.randint(0, 500) if step % 2 else step * 40
+                ranges[index.add(start, end)] = (min(start, end), max(start, end))
+            stamp = rnd.randint(0, 10 ** 5 + 500)
+            assert [time_range.key for time_range in index.stab(stamp)] == sorted(key for key, (start, end) in ranges.items() if start <= stamp <= end)
+        assert len(index) == len(ranges)
+
+    def test_normalization(self):
+        index = TimeRangeIndex(timezone='UTC')
+        key = index.add(datetime.datetime(2018, 1, 1), '2018-01-02 00:00:00', data={'id': 1})
+        assert index[key].start == 1514764800
+        assert index[key].end == 1514851200
+        assert index.stab(1514764800)[0].data == {'id': 1}
+        assert index.stab(datetime.date(2018, 1, 3)) == []
+        index.discard(key)
+        index.discard(key)
+        assert key not in index
+        with pytest.raises(KeyError):
+            index.remove(key)
+
+    def test_microseconds(self):
+        index = TimeRangeIndex(timezone='UTC')
+        first = index.add(datetime.datetime(2018, 1, 1, 0, 0, 0), datetime.datetime(2018, 1, 1, 0, 0, 0, 400000))
+        second = index.add(datetime.datetime(2018, 1, 1, 0, 0, 0, 600000), datetime.datetime(2018, 1, 1, 0, 0, 1))
+        assert index[first].end == 1514764800.4
+        assert [time_range.key for time_range in index.stab(datetime.datetime(2018, 1, 1, 0, 0, 0, 500000))] == []
+        assert [time_range.key for time_range in index.stab(datetime.datetime(2018, 1, 1, 0, 0, 0, 700000))] == [second]
+
+    def test_mostly_deleted(self):
+        def depth(node):
+            return 1 + max(depth(node.left), depth(node.right)) if node is not None else 0
+
+        index = TimeRangeIndex(((stamp, stamp + 10) for stamp in range(0, 40000, 20)))
+        keys = list(range(len(index)))
+        # Deleting all but the last ranges leaves a lopsided tree unless deletions trigger rebuilds
+        for key in keys[:-50]:
+            index.remove(key)
+        assert len(index) == 50
+        assert depth(index._TimeRangeIndex__root) <= 7
+        assert [time_range.key for time_range in index.stab(39985)] == [keys[-1]]
@@ -0,0 +1,93 @@
+import datetime
+
+from dateutil.tz import tz
+
+from TimeConvert import TimeConvert as tc
+from TimeConvert.convert import TimeConvertTools
+from TimeConvert.iso8601 import fixed_offset, parse
+
+
+DT = datetime.datetime(2017, 12, 8, 15, 27, 0)
+CST = datetime.timezone(datetime.timedelta(hours=8))
+
+
+class TestISO8601(object):
+
+    def test_calendar_dates(self):
+        assert parse('2017-12-08') == datetime.datetime(2017, 12, 8)
+        assert parse('20171208') == datetime.datetime(2017, 12, 8)
+        assert parse('2017-12-08T15:27:00') == DT
+        assert parse('2017-12-08 15:27') == DT
+        assert parse('20171208T152700') == DT
+        assert parse('2017-12-08T15') == DT.replace(minute=0)
+        assert parse('2017-12-08T24:00:00') == datetime.datetime(2017, 12, 9)
+
+    def test_fractions(self):
+        assert parse('2017-12-08T15:27:00.1') == DT.replace(microsecond=100000)
+        assert parse('2017-12-08T15:27:00,123456') == DT.replace(microsecond=123456)
+        assert parse('2017-12-08T15:27:00.123456789') == DT.replace(microsecond=123456)
+        assert parse(tc.datetime_to_string(DT.replace(microsecond=5), tc.DATETIME_ISOFORMAT)) == DT.replace(microsecond=5)
+
+    def test_offsets(self):
+        for string in ('2017-12-08T15:27:00+08:00', '2017-12-08T15:27:00+0800', '2017-12-08T15:27:00+08', '2017-12-08t07:27:00z', '2017-12-08T07:27:00Z', '2017-12-08T02:27:00-05:00'):
+            dt = parse(string)
+            assert dt == DT.replace(tzinfo=CST)
+        assert parse('2017-12-08T07:27:00Z').tzinfo is tz.UTC
+        assert parse('2017-12-08T07:27:00+00:00').tzinfo is tz.UTC
+        # Fixed offsets are interned
+        assert parse('2017-12-08T15:27:00+08:00').tzinfo is parse('2018-01-01T00:00:00+0800').tzinfo is fixed_offset(480)
+        assert parse('2017-12-08T15:27:00+05:45').utcoffset() == datetime.timedelta(hours=5, minutes=45)
+
+    def test_week_ordinal_dates(self):
+        assert parse('2024-W05-3') == datetime.datetime(2024, 1, 31)
+        assert parse('2024W053') == datetime.datetime(2024, 1, 31)
+        assert parse('2024-W05') == datetime.datetime(2024, 1, 29)
+        assert parse('2020-W53-7T12:00Z') == datetime.datetime(2021, 1, 3, 12, tzinfo=tz.UTC)
+        assert parse('2017-342') == datetime.datetime(2017, 12, 8)
+        assert parse('2016366') == datetime.datetime(2016, 12, 31)
+
+    def test_invalid(self):
+        for string in ('2017-13-08', '2017-12-32T00:00:00', '2017-1208', '2024-W00', '2024-W53-1', '2017-366', '2017-12-08T25:00', '2017-12-08T', 'invalid', ''):
+            assert parse(string) is None, string
+
+    def test_tc(self):
+        converter = TimeConvertTools(timezone='Asia/Shanghai')
+        assert converter.string_to_datetime('2017-12-08T15:27:00.123+08:00') == DT.replace(microsecond=123000, tzinfo=CST)
+        assert converter.string_to_datetime('2017-12-08 15:27:00') == DT
+        assert converter.string_to_datetime('2017-12-08T15:27:00', '%Y-%m-%d %H:%M:%S') is None
+        assert converter.to_utc_datetime('2017-12-08T15:27:00+08:00') == datetime.datetime(2017, 12, 8, 7, 27, tzinfo=tz.UTC)
+        assert converter.to_utc_datetime('2017-12-08T07:27:00Z').tzinfo == tz.UTC
+        assert converter.to_local_datetime('2017-12-08T07:27:00Z') == DT.replace(tzinfo=tz.gettz('Asia/Shanghai'))
+        assert converter.to_utc_datetime('not a date') is None
+        assert converter.string_to_utc_datetime('2017-12-08T16:27:00+09:00') == converter.string_to_utc_datetime('2017-12-08 15:27:00')
+        assert converter.isostring_to_datetime('2017-W49-5T15:27') == DT
+        assert converter.isostring_to_datetime('2017-12-08T15:27:00', dttype='utc') == datetime.datetime(2017, 12, 8, 7, 27, tzinfo=tz.UTC)
+
+    def test_tc_string_api(self):
+        # One payload string gives the same instant across the ``string_to_*`` API
+        converter = TimeConvertTools(timezone='Asia/Shanghai')
+        string = '2017-12-08T07:27:00Z'
+        assert converter.string_to_date(string) == datetime.date(2017, 12, 8)
+        assert converter.string_to_utc_date(string) == datetime.date(2017, 12, 8)
+        assert converter.string_to_local_date('2017-12-08T20:27:00Z') == datetime.date(2017, 12, 9)
+        assert converter.utc_string_to_utc_datetime(string) == datetime.datetime(2017, 12, 8, 7, 27, tzinfo=tz.UTC)
+        assert converter.utc_string_to_local_datetime(string) == DT.replace(tzinfo=tz.gettz('Asia/Shanghai'))
+        assert converter.utc_string_to_local_date('2017-12-08T20:27:00Z') == datetime.date(2017, 12, 9)
+        assert converter.string_to_utc_timestamp(string) == converter.string_to_utc_timestamp('2017-12-08 15:27:00')
+        assert converter.string_to_local_timestamp(string) == converter.string_to_timestamp(string) == converter.string_to_timestamp('2017-12-08 15:27:00')
+        assert converter.string_to_utc_timestamp('2017-12-08T15:27:00.123+08:00', ms=True) == converter.string_to_utc_timestamp(string) + 0.123
+        assert converter.string_to_timestamp('2017-12-08T07:27:00Z', '%Y-%m-%d %H:%M:%S') is None
+        assert converter.string_to_date('not a date') is None and converter.string_to_utc_timestamp('not a date') is None
+
+    def test_tc_default_lengths(self):
+        # ISO 8601 strings of 19 and 10 characters are tried after the default formats of their length
+        converter = TimeConvertTools(timezone='Asia/Shanghai')
+        assert converter.string_to_datetime('2017-12-08T15:27:00') == DT
+        assert converter.string_to_datetime('2024-W05-3') == datetime.datetime(2024, 1, 31)
+        assert converter.string_to_datetime('2017-12-08') == datetime.datetime(2017, 12, 8)
+        assert converter.to_utc_datetime('2017-12-08T15:27:00') == datetime.datetime(2017, 12, 8, 7, 27, tzinfo=tz.UTC)
+        assert converter.to_utc_datetime('2024-W05-3') == datetime.datetime(2024, 1, 30, 16, tzinfo=tz.UTC)
+        assert converter.string_to_date('2024-W05-3') == datetime.date(2024, 1, 31)
+        assert converter.string_to_utc_timestamp('2017-12-08T15:27:00') == converter.string_to_utc_timestamp('2017-12-08 15:27:00')
+        assert converter.string_to_datetime('2017-12-08T15:27:00', '%Y-%m-%d %H:%M:%S') is None
+        assert converter.string_to_datetime('2017-12-32') is None
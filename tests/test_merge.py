@@ -0,0 +1,84 @@
+import datetime
+import random
+from operator import itemgetter
+
+import pytest
+from dateutil.tz import tz
+
+from TimeConvert import TimeConvert as tc
+from TimeConvert.convert import TimeConvertTools
+from TimeConvert.merge import Stream, merge
+
+
+class TestMerge(object):
+
+    def test_zones_and_formats(self):
+        shanghai = ['2017-12-08 15:27:00 a1', '2017-12-08 15:27:02 a2', '2017-12-08 15:27:05 a3']
+        new_york = [{'time': '08/12/2017 02:27:01', 'id': 'b1'}, {'time': '08/12/2017 02:27:05', 'id': 'b2'}]
+        epochs = [(1512718019000, 'c1'), (1512718023500, 'c2')]
+        merged = list(merge([
+            Stream(shanghai, key=lambda line: line[:19], timezone='Asia/Shanghai'),
+            Stream(new_york, key=itemgetter('time'), timezone='America/New_York', format='%d/%m/%Y %H:%M:%S'),
+            Stream(epochs, key=itemgetter(0), input='timestamp_ms'),
+        ], unit='ms'))
+        assert [stamp for stamp, _ in merged] == [1512718019000, 1512718020000, 1512718021000, 1512718022000, 1512718023500, 1512718025000, 1512718025000]
+        records = [record for _, record in merged]
+        assert records[:3] == [epochs[0], shanghai[0], new_york[0]]
+        # Ties come in the order of the streams
+        assert records[-2:] == [shanghai[2], new_york[1]]
+
+    def test_offset_format(self):
+        offsets = ['2017-12-08 07:27:01+0000', '2017-12-08 15:27:03+0800']
+        shanghai = ['2017-12-08 15:27:00', '2017-12-08 15:27:02']
+        merged = list(merge([
+            Stream(offsets, format='%Y-%m-%d %H:%M:%S%z', timezone='Asia/Shanghai'),
+            Stream(shanghai, timezone='Asia/Shanghai'),
+        ], unit='s'))
+        assert merged == [(1512718020, shanghai[0]), (1512718021, offsets[0]), (1512718022, shanghai[1]), (1512718023, offsets[1])]
+
+    def test_mixed_inputs(self):
+        dts = [datetime.datetime(2017, 12, 8, 7, 27, tzinfo=tz.UTC), datetime.datetime(2017, 12, 8, 15, 28)]
+        merged = tc.merge_streams([
+            Stream(dts, input='datetime', timezone='Asia/Shanghai'),
+            Stream(['2017-12-08 15:27:30', 'invalid', '2017-12-08 15:29:00'], timezone='Asia/Shanghai'),
+            Stream(['2017-12-08T07:27:40Z', '2017-12-08T16:28:10+09:00'], format='auto'),
+        ], unit='s')
+        assert [stamp for stamp, _ in merged] == [1512718020, 1512718050, 1512718060, 1512718080, 1512718090, 1512718140]
+        assert merged.invalid == 1
+        # Plain iterables are streams of strings in the zone of the converter
+        assert list(merge([['2017-12-08 15:27:00']], unit='s', converter=TimeConvertTools(timezone='Asia/Shanghai'))) == [(1512718020, '2017-12-08 15:27:00')]
+
+    def test_lateness(self):
+        rnd = random.Random(50)
+        streams, expected = [], []
+        for index in range(5):
+            stamps = sorted(rnd.randint(1512718020, 1512718020 + 3600) for _ in range(200))
+            # Shuffled within 10 seconds
+            shuffled = sorted(stamps, key=lambda stamp: stamp + rnd.uniform(0, 10))
+            streams.append(Stream(shuffled, input='timestamp'))
+            expected.extend(stamps)
+        merged = list(merge(streams, lateness=10, unit='s'))
+        assert [stamp for stamp, _ in merged] == sorted(expected)
+
+    def test_late_policies(self):
+        stamps = [100, 110, 105, 130, 90, 140]
+        with pytest.raises(ValueError):
+            list(merge([Stream(stamps, input='timestamp')], lateness=10, unit='s'))
+        merged = tc.merge_streams([Stream(stamps, input='timestamp')], lateness=10, late='drop', unit='s')
+        assert [stamp for stamp, _ in merged] == [100, 105, 110, 130, 140]
+        assert merged.late == 1
+        merged = tc.merge_streams([Stream(stamps, input='timestamp')], lateness=10, late='emit', unit='s')
+        assert [stamp for stamp, _ in merged] == [100, 105, 110, 90, 130, 140]
+        with pytest.raises(ValueError):
+            tc.merge_streams([], late='sort')
+        with pytest.raises(ValueError):
+            Stream([], input='bytes')
+
+    def test_lazy(self):
+        def endless(start):
+            stamp = start
+            while True:
+                yield stamp
+                stamp += 2
+        merged = merge([Stream(endless(0), input='timestamp'), Stream(endless(1), input='timestamp')], unit='s')
+        assert [next(merged)[0] for _ in range(6)] == [0, 1, 2, 3, 4, 5]
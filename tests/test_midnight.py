@@ -0,0 +1,36 @@
+import datetime
+
+from TimeConvert import FrozenClock
+from TimeConvert import TimeConvert as tc
+from TimeConvert.convert import TimeConvertTools
+
+
+class TestDayBoundary(object):
+
+    def test_day_bounds(self):
+        start, end = tc.day_bounds('2017-12-08 15:27:00', timezone='Asia/Shanghai')
+        assert end - start == 86400
+        assert tc.day_start('2017-12-08 15:27:00', timezone='Asia/Shanghai') == datetime.datetime(2017, 12, 8, tzinfo=tc.tzinfo('Asia/Shanghai'))
+        assert tc.seconds_since_day_start('2017-12-08 15:27:00', timezone='Asia/Shanghai') == 55620
+        assert tc.seconds_until_day_end(datetime.datetime(2017, 12, 8, 7, 27, tzinfo=datetime.timezone.utc), timezone='Asia/Shanghai') == 30780
+        assert tc.day_bounds('invalid') is None
+
+    def test_dst_days(self):
+        # 23 hours on 2018-03-11 and 25 hours on 2018-11-04 in New York
+        start, end = tc.day_bounds('2018-03-11 12:00:00', timezone='America/New_York')
+        assert end - start == 23 * 3600
+        assert tc.seconds_since_day_start('2018-03-11 12:00:00', timezone='America/New_York') == 11 * 3600
+        assert tc.seconds_until_day_end('2018-11-04 12:00:00', timezone='America/New_York') == 12 * 3600
+        start, end = tc.day_bounds(datetime.date(2018, 11, 4), timezone='America/New_York')
+        assert end - start == 25 * 3600
+        # Midnight skipped, the day starts at the 00:00 -> 01:00 transition
+        assert tc.day_start('2018-11-04 12:00:00', timezone='America/Sao_Paulo') == datetime.datetime(2018, 11, 4, 1, tzinfo=tc.tzinfo('America/Sao_Paulo'))
+        assert tc.seconds_since_day_start('2018-11-04 12:00:00', timezone='America/Sao_Paulo') == 11 * 3600
+
+    def test_seconds_since_midnight(self):
+        converter = TimeConvertTools(timezone='America/New_York', clock=FrozenClock(datetime.datetime(2018, 3, 11, 16)))
+        assert converter.local_seconds_since_midnight() == 11 * 3600
+        assert converter.seconds_until_midnight() == 12 * 3600
+        assert converter.seconds_until_midnight(utc=True) == 8 * 3600
+        assert converter.local_seconds_since_midnight(datetime.datetime(2018, 3, 11, 12)) == 11 * 3600
+        assert tc.local_seconds_since_midnight(datetime.datetime(2017, 12, 8, 15, 27)) == 55620
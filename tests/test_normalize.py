@@ -0,0 +1,41 @@
+import datetime
+
+from dateutil import tz
+
+from TimeConvert import TimeConvert as tc
+from TimeConvert.normalize import AWARE, NAIVE, UTC
+
+
+class TestNormalizer(object):
+
+    def test_classify(self):
+        normalizer = tc.normalizer('Asia/Shanghai')
+        assert normalizer.classify(datetime.datetime(2017, 12, 8, 15, 27)) == NAIVE
+        assert normalizer.classify(datetime.datetime(2017, 12, 8, 7, 27, tzinfo=tz.UTC)) == UTC
+        assert normalizer.classify(datetime.datetime(2017, 12, 8, 16, 27, tzinfo=tz.gettz('Asia/Tokyo'))) == AWARE
+
+    def test_normalize_many(self):
+        utc_dt = datetime.datetime(2017, 12, 8, 7, 27, tzinfo=tz.UTC)
+        values = [
+            datetime.datetime(2017, 12, 8, 15, 27),
+            utc_dt,
+            datetime.datetime(2017, 12, 8, 7, 27, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2017, 12, 8, 16, 27, tzinfo=tz.gettz('Asia/Tokyo')),
+            datetime.datetime(2017, 12, 8, 2, 27, tzinfo=tz.gettz('America/New_York')),
+            '2017-12-08 15:27:00',
+            datetime.date(2017, 12, 8),
+            'invalid',
+            None,
+        ]
+        dts = tc.normalize_many(values, timezone='Asia/Shanghai')
+        assert dts[:6] == [utc_dt] * 6
+        assert all(dt.tzinfo == tz.UTC for dt in dts[:7])
+        assert dts[6] == datetime.datetime(2017, 12, 7, 16, tzinfo=tz.UTC)
+        assert dts[7:] == [None, None]
+        local_dts = tc.normalize_many(values[:6], dttype='local', timezone='Asia/Shanghai')
+        assert [dt.replace(tzinfo=None) for dt in local_dts] == [datetime.datetime(2017, 12, 8, 15, 27)] * 6
+        assert tc.normalize(values[3], dttype='local', timezone='Asia/Tokyo') is values[3]
+
+    def test_make_naive(self):
+        assert tc.make_naive(datetime.datetime(2017, 12, 8, 16, 27, tzinfo=tz.gettz('Asia/Tokyo')), timezone='Asia/Shanghai') == datetime.datetime(2017, 12, 8, 15, 27)
+        assert tc.make_naive(datetime.datetime(2017, 12, 8, 15, 27, tzinfo=tz.gettz('Asia/Shanghai')), timezone='Asia/Shanghai') == datetime.datetime(2017, 12, 8, 15, 27)
@@ -0,0 +1,80 @@
+import datetime
+
+import pytest
+from dateutil.tz import tz
+
+from TimeConvert import ISOWeek, Month, Quarter
+from TimeConvert import TimeConvert as tc
+
+
+STRINGS = ['2017-12-08 15:27:00', '2016-02-29 23:59:59', '2000-01-01 00:00:00']
+
+
+class TestPlan(object):
+
+    def test_string_to_datetime(self):
+        local = tc.compile(input='str', to='local')
+        assert local.map(STRINGS) == [tc.string_to_local_datetime(string) for string in STRINGS]
+        utc = tc.compile(input='str', to='utc')
+        assert utc.map(STRINGS) == [tc.string_to_utc_datetime(string) for string in STRINGS]
+        assert all(dt.tzinfo == tz.UTC for dt in utc.map(STRINGS))
+        assert local.map(['invalid', None, '2017-12-08']) == [None, None, None]
+        assert tc.compile(input_format='%Y-%m-%d', output='date')('2017-12-08') == datetime.date(2017, 12, 8)
+
+    def test_timezones(self):
+        plan = tc.compile(input='str', input_timezone='UTC', to='local', timezone='America/New_York', output='string')
+        assert plan('2017-12-08 15:27:00') == '2017-12-08 10:27:00'
+        assert plan.timezone == 'America/New_York' and plan.input_timezone == 'UTC'
+        to_utc = tc.compile(input='datetime', input_timezone='Asia/Shanghai', to='utc', output='naive')
+        assert to_utc(datetime.datetime(2017, 12, 8, 15, 27)) == datetime.datetime(2017, 12, 8, 7, 27)
+        assert to_utc(datetime.datetime(2017, 12, 8, 16, 27, tzinfo=tz.gettz('Asia/Tokyo'))) == datetime.datetime(2017, 12, 8, 7, 27)
+
+    def test_offset_format(self):
+        # Strings parsed with ``%z`` are instants, ``input_timezone`` is for naive values only
+        format = '%Y-%m-%d %H:%M:%S%z'
+        assert tc.compile(input='str', input_format=format, timezone='Asia/Shanghai', output='timestamp')('2017-12-08 07:27:00+0000') == 1512718020
+        assert tc.compile(input='str', input_format=format, timezone='Asia/Shanghai', output='string')('2017-12-08 07:27:00+0000') == '2017-12-08 15:27:00'
+        assert tc.compile(input='str', input_format=format, input_timezone='America/New_York', to='utc', output='timestamp_ms')('2017-12-08 15:27:00+0800') == 1512718020000
+        assert tc.compile(input='str', input_format='%Y-%m-%d %H:%M:%S %Z', timezone='Asia/Shanghai', output='timestamp')('2017-12-08 15:27:00 UTC') == 1512718020
+
+    def test_shift(self):
+        dts = [tc.string_to_local_datetime(string) for string in STRINGS]
+        assert tc.compile(shift={'days': 1, 'hours': 2}).map(STRINGS) == [dt + datetime.timedelta(days=1, hours=2) for dt in dts]
+        assert tc.compile(input='datetime', to='utc', shift={'months': 1}).map(dts) == [tc.utc_datetime(dt, months=1) for dt in dts]
+        assert len(tc.compile(shift={'days': 0}).steps) == len(tc.compile().steps)
+
+    def test_outputs(self):
+        dt = datetime.datetime(2017, 12, 8, 15, 27, 0, 123456)
+        stamp = tc.datetime_to_timestamp(dt)
+        assert tc.compile(input='datetime', output='timestamp')(dt) == stamp
+        assert tc.compile(input='datetime', output='timestamp_ms')(dt) == stamp * 1000 + 123
+        assert tc.compile(input='datetime', output='timestamp_us')(dt) == tc.local_timestamp(local_dt=dt, ms=True, micro=True)
+        assert tc.compile(input='datetime', output='timestamp_ns')(dt) == (stamp * 10 ** 6 + 123456) * 1000
+        assert tc.compile(input='datetime', output='isostring')(dt) == tc.datetime_to_string(dt, tc.DATETIME_ISOFORMAT)
+        assert tc.compile(input='datetime', output='isoweek')(dt) == ISOWeek(2017, 49)
+        assert tc.compile(input='datetime', output='month')(dt) == Month(2017, 12)
+        assert tc.compile(input='datetime', output='quarter')(dt) == Quarter(2017, 4)
+        assert tc.compile(input='date', output='timestamp')(dt.date()) == tc.date_to_timestamp(dt.date())
+
+    def test_epoch_fast_path(self):
+        strings = ['2017-11-05 00:59:59', '2017-11-05 01:30:00', '2017-11-05 02:00:00', '2017-03-12 02:30:00', '2017-03-12 03:00:00', '1950-06-01 12:00:00']
+        fast = tc.compile(timezone='America/New_York', output='timestamp_us')
+        dts = tc.compile(timezone='America/New_York').map(strings)
+        assert fast.map(strings) == [int(dt.timestamp()) * 10 ** 6 for dt in dts]
+        assert len(fast.steps) == 2
+
+    def test_timestamps(self):
+        stamps = [1512718020, 1456761599, 0]
+        assert tc.compile(input='timestamp', to='local').map(stamps) == [tc.utc_timestamp_to_local_datetime(stamp) for stamp in stamps]
+        assert tc.compile(input='timestamp_ms', to='utc', output='timestamp_ms').map([-1, 1512718020123]) == [-1, 1512718020123]
+        assert tc.compile(input='timestamp_us', timezone='Asia/Shanghai', output='naive')(1512718020123456) == datetime.datetime(2017, 12, 8, 15, 27, 0, 123456)
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            tc.compile(input='bytes')
+        with pytest.raises(ValueError):
+            tc.compile(to='Asia/Shanghai')
+        with pytest.raises(ValueError):
+            tc.compile(output='week')
+        with pytest.raises(ValueError):
+            tc.compile(shift={'day': 1})
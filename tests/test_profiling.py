@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from TimeConvert import StopWatch
+from TimeConvert import TimeConvert as tc
+from TimeConvert import profile
+from TimeConvert.convert import TimeConvertTools
+
+
+class TestProfiling(object):
+
+    def test_profile(self):
+        original = TimeConvertTools.__dict__['string_to_datetime']
+        with profile() as profiler:
+            assert TimeConvertTools.__dict__['string_to_datetime'] is not original
+            tc.utc_yearweek(mode=0)
+            tc.string_to_datetime('2017-12-08 15:27:00')
+        assert TimeConvertTools.__dict__['string_to_datetime'] is original
+        assert profiler.counts['parse'] == 1
+        assert profiler.counts['shift'] >= 1
+        assert profiler.counts['format'] >= 1
+        assert profiler.counts['epoch'] == 0
+        assert profiler.nanoseconds['shift'] >= profiler.self_nanoseconds['shift'] > 0
+        # Calls after the block are not recorded
+        tc.string_to_datetime('2017-12-08 15:27:00')
+        assert profiler.counts['parse'] == 1
+
+    def test_overlapping(self):
+        original = TimeConvertTools.__dict__['string_to_datetime']
+        first = profile().start()
+        try:
+            with pytest.raises(RuntimeError):
+                profile().start()
+            with pytest.raises(RuntimeError):
+                first.start()
+        finally:
+            first.stop()
+        assert TimeConvertTools.__dict__['string_to_datetime'] is original
+        with profile():
+            pass
+        assert TimeConvertTools.__dict__['string_to_datetime'] is original
+
+    def test_report(self):
+        with profile() as profiler:
+            tc.utc_yearweek(mode=0)
+        report = profiler.report()
+        assert isinstance(report, StopWatch)
+        assert report.get_task_count() == len([stage for stage, count in profiler.counts.items() if count])
+        assert 'shift (' in report.pretty_print()
+
+    def test_environment(self):
+        env = dict(os.environ, TIMECONVERT_PROFILE='1', PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        result = subprocess.run([sys.executable, '-c', 'from TimeConvert import tc; tc.utc_string()'], env=env, capture_output=True, text=True)
+        assert result.returncode == 0
+        assert 'StopWatch [TimeConvert]' in result.stderr
+        assert 'format (1 calls)' in result.stderr
@@ -0,0 +1,77 @@
+import datetime
+
+import pytest
+
+from TimeConvert import FiscalQuarter, Quarter
+from TimeConvert import TimeConvert as tc
+
+
+class TestQuarter(object):
+
+    def test_boundaries(self):
+        assert Quarter(2017, 1).start_date == datetime.date(2017, 1, 1)
+        assert Quarter(2017, 1).end_date == datetime.date(2017, 3, 31)
+        assert Quarter(2017, 2).end_date == datetime.date(2017, 6, 30)
+        assert Quarter(2017, 3).end_date == datetime.date(2017, 9, 30)
+        assert Quarter(2017, 4).start_date == datetime.date(2017, 10, 1)
+        assert Quarter(2017, 4).end_date == datetime.date(2017, 12, 31)
+
+    def test_from_date(self):
+        assert [Quarter.from_date(datetime.date(2017, m, 1)).quarter for m in range(1, 13)] == [1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4]
+        assert Quarter.from_date(datetime.datetime(2017, 12, 8, 15, 27)) == Quarter(2017, 4)
+        assert Quarter.from_dates([datetime.date(2017, 2, 1), datetime.date(2018, 7, 31)]) == [Quarter(2017, 1), Quarter(2018, 3)]
+
+    def test_ordinal(self):
+        assert Quarter(1, 1).toordinal() == 1
+        for quarter in (Quarter(1, 4), Quarter(2017, 3), Quarter(9999, 4)):
+            assert Quarter.fromordinal(quarter.toordinal()) == quarter
+        with pytest.raises(ValueError):
+            Quarter.fromordinal(0)
+
+    def test_quarter_range(self):
+        quarters = list(Quarter.quarter_range(datetime.date(2017, 11, 1), Quarter(2018, 2)))
+        assert quarters == [Quarter(2017, 4), Quarter(2018, 1), Quarter(2018, 2)]
+        assert list(Quarter.quarters_of_year(2017))[-1] == Quarter(2017, 4)
+
+    def test_contains(self):
+        assert Quarter(2017, 4).contains(datetime.date(2017, 12, 31))
+        assert not Quarter(2017, 4).contains(datetime.date(2018, 1, 1))
+
+
+class TestFiscalQuarter(object):
+
+    def test_from_date(self):
+        assert FiscalQuarter.from_date(datetime.date(2023, 10, 1), start_month=10) == FiscalQuarter(2024, 1, 10)
+        assert FiscalQuarter.from_date(datetime.date(2024, 9, 30), start_month=10) == FiscalQuarter(2024, 4, 10)
+        assert FiscalQuarter.from_date(datetime.date(2024, 4, 1), start_month=4) == FiscalQuarter(2025, 1, 4)
+        assert FiscalQuarter.from_date(datetime.date(2024, 3, 31), start_month=4) == FiscalQuarter(2024, 4, 4)
+        assert FiscalQuarter.from_date(datetime.date(2024, 5, 1)) == FiscalQuarter(2024, 2, 1)
+
+    def test_from_dates(self):
+        dates = [datetime.date(2023, 1, 1) + datetime.timedelta(days=n) for n in range(0, 800, 13)]
+        for start_month in range(1, 13):
+            assert FiscalQuarter.from_dates(dates, start_month) == [FiscalQuarter.from_date(date, start_month) for date in dates]
+
+    def test_boundaries(self):
+        quarter = FiscalQuarter(2024, 1, 10)
+        assert quarter.start_date == datetime.date(2023, 10, 1)
+        assert quarter.end_date == datetime.date(2023, 12, 31)
+        assert (quarter + 1).start_date == datetime.date(2024, 1, 1)
+        assert (quarter + 3).end_date == datetime.date(2024, 9, 30)
+        assert FiscalQuarter(2024, 4, 12).end_date == datetime.date(2024, 11, 30)
+        assert FiscalQuarter(2024, 4, 12).start_date == datetime.date(2024, 9, 1)
+
+    def test_contains_and_ordinal(self):
+        for start_month in range(1, 13):
+            quarter = FiscalQuarter(2020, 3, start_month)
+            assert quarter.contains(quarter.start_date)
+            assert quarter.contains(quarter.end_date)
+            assert not quarter.contains(quarter.end_date + datetime.timedelta(days=1))
+            assert FiscalQuarter.fromordinal(quarter.toordinal(), start_month) == quarter
+            assert (quarter + 5) - quarter == 5
+
+    def test_tc_quarter_range(self):
+        quarters = list(tc.quarter_range('2023-09-08', '2024-01-31', start_month=10))
+        assert quarters == [FiscalQuarter(2023, 4, 10), FiscalQuarter(2024, 1, 10), FiscalQuarter(2024, 2, 10)]
+        quarters = list(tc.quarter_range('2023-09-08', '2024-01-31', return_type='str', start_month=10))
+        assert quarters[0] == {'quarter': 'FY2023Q4', 'start': '2023-07-01', 'end': '2023-09-30'}
@@ -0,0 +1,103 @@
+import datetime
+from array import array
+
+import pytest
+
+from TimeConvert import DateRange, FiscalQuarter, ISOWeek, Month, Quarter
+from TimeConvert import TimeConvert as tc
+
+
+class TestPeriodRange(object):
+
+    def test_date_range_sequence(self):
+        dates = tc.date_range('2000-01-01', '2030-01-01')
+        assert len(dates) == 10958
+        assert dates[0] == datetime.date(2000, 1, 1)
+        assert dates[-1] == datetime.date(2029, 12, 31)
+        assert datetime.date(2017, 12, 8) in dates
+        assert datetime.date(2030, 1, 1) not in dates
+        assert dates.index(datetime.date(2000, 1, 11)) == 10
+        assert next(reversed(dates)) == datetime.date(2029, 12, 31)
+        assert list(dates[10:13]) == [datetime.date(2000, 1, 11), datetime.date(2000, 1, 12), datetime.date(2000, 1, 13)]
+        assert isinstance(dates[::7], DateRange)
+        assert len(dates[::7]) == 1566
+
+    def test_date_range_step(self):
+        dates = tc.date_range('2017-12-01', '2017-12-31', include_end=True, step=7)
+        assert list(dates) == [datetime.date(2017, 12, d) for d in (1, 8, 15, 22, 29)]
+        assert datetime.date(2017, 12, 2) not in dates
+        assert not tc.date_range('2017-12-31', '2017-12-01')
+
+    def test_date_range_string(self):
+        dates = tc.date_range('2017-12-08', '2017-12-31', return_type='str', return_format='%Y%m%d')
+        assert dates[1] == '20171209'
+        assert '20171209' in dates
+        assert '2017-12-09' not in dates
+        assert dates.index('20171210') == 2
+
+    def test_date_range_datetimes(self):
+        # Datetime bounds keep the time of day, over whole elapsed days
+        dts = tc.date_range(datetime.datetime(2017, 12, 8, 10), datetime.datetime(2017, 12, 10, 9))
+        assert list(dts) == [datetime.datetime(2017, 12, 8, 10)]
+        dts = tc.date_range(datetime.datetime(2017, 12, 8, 10), datetime.datetime(2017, 12, 10, 9), include_end=True)
+        assert list(dts) == [datetime.datetime(2017, 12, 8, 10), datetime.datetime(2017, 12, 9, 10)]
+        assert datetime.datetime(2017, 12, 9, 10) in dts
+        assert datetime.datetime(2017, 12, 9, 11) not in dts and datetime.date(2017, 12, 9) not in dts
+        assert list(dts[1:]) == [datetime.datetime(2017, 12, 9, 10)]
+        assert tc.date_range(datetime.datetime(2017, 12, 8, 10), datetime.datetime(2017, 12, 10, 11), return_type='str', return_format='%Y%m%d%H')[-1] == '2017120910'
+        assert not tc.date_range(datetime.datetime(2017, 12, 8, 10), datetime.datetime(2017, 12, 7))
+
+    def test_invalid_bounds(self):
+        with pytest.raises(ValueError, match='start_date'):
+            tc.date_range('2017-13-01', '2018-01-01')
+        with pytest.raises(ValueError, match='end_date'):
+            tc.month_range('2017-12-01', '20180101')
+
+    def test_period_ranges(self):
+        weeks = tc.week_range('2017-01-01', '2017-12-31')
+        assert len(weeks) == 53
+        assert weeks[0] == ISOWeek(2016, 52)
+        assert ISOWeek(2017, 10) in weeks
+
+        months = tc.month_range('2000-01-15', '2017-12-08', step=12)
+        assert len(months) == 18
+        assert months[-1] == Month(2017, 1)
+        assert Month(2001, 1) in months
+        assert Month(2001, 2) not in months
+
+        quarters = tc.quarter_range('2017-01-01', '2017-12-31', return_type='string')
+        assert quarters[3] == {'quarter': '2017Q4', 'start': '2017-10-01', 'end': '2017-12-31'}
+        assert list(reversed(tc.quarter_range('2017-01-01', '2017-12-31')))[0] == Quarter(2017, 4)
+
+        quarters = tc.quarter_range('2023-09-08', '2024-01-31', start_month=10)
+        assert FiscalQuarter(2024, 1, 10) in quarters
+        assert Quarter(2024, 1) not in quarters
+
+    def test_index_errors(self):
+        dates = tc.date_range('2017-12-08', '2017-12-31')
+        with pytest.raises(IndexError):
+            dates[23]
+        with pytest.raises(ValueError):
+            dates.index(datetime.date(2018, 1, 1))
+
+    def test_array_outputs(self):
+        dates = tc.date_range('2010-01-01', '2020-01-01')
+        ordinals = dates.to_ordinals()
+        assert isinstance(ordinals, array)
+        assert ordinals.typecode == 'i'
+        assert len(ordinals) == len(dates)
+        assert ordinals[-1] == datetime.date(2019, 12, 31).toordinal()
+        assert tc.date_range('1970-01-01', '1970-01-03', return_type='epoch') == array('q', [0, 86400])
+        assert list(tc.week_range('2017-12-08', '2017-12-31').to_ordinals()) == [week.monday().toordinal() for week in tc.week_range('2017-12-08', '2017-12-31')]
+        assert list(tc.month_range('2017-11-08', '2018-02-01', return_type='ordinal')) == [datetime.date(2017, 11, 1).toordinal(), datetime.date(2017, 12, 1).toordinal(), datetime.date(2018, 1, 1).toordinal(), datetime.date(2018, 2, 1).toordinal()]
+        assert list(tc.quarter_range('2023-09-08', '2024-01-31', start_month=10).to_epochs()) == [tc.date_range('2023-07-01', '2023-07-02').to_epochs()[0], 1696118400, 1704067200]
+        with pytest.raises(ValueError):
+            dates.to_array('week')
+
+    def test_datetime64_outputs(self):
+        np = pytest.importorskip('numpy')
+        days = tc.date_range('2010-01-01', '2020-01-01', return_type='datetime64')
+        assert days.dtype == np.dtype('datetime64[D]')
+        assert days.tolist() == list(tc.date_range('2010-01-01', '2020-01-01'))
+        months = tc.month_range('2017-11-08', '2018-02-01').to_datetime64()
+        assert months.tolist() == [month.start_date for month in tc.month_range('2017-11-08', '2018-02-01')]
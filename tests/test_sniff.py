@@ -0,0 +1,63 @@
+import datetime
+
+from dateutil.tz import tz
+
+from TimeConvert import TimeConvert as tc
+from TimeConvert.sniff import CATALOGUE, StreamParser, sniff
+
+
+DT = datetime.datetime(2017, 12, 8, 15, 27, 0)
+
+
+class TestSniff(object):
+
+    def test_catalogue(self):
+        samples = {
+            'datetime': ('2017-12-08 15:27:00', DT),
+            'date': ('2017-12-08', DT.replace(hour=0, minute=0)),
+            'iso8601': ('2017-12-08T15:27:00.5+08:00', DT.replace(microsecond=500000, tzinfo=tz.tzoffset(None, 8 * 3600))),
+            'compact_datetime': ('20171208152700', DT),
+            'compact_date': ('20171208', DT.replace(hour=0, minute=0)),
+            'slash_datetime': ('2017/12/08 15:27:00', DT),
+            'slash_date': ('2017/12/08', DT.replace(hour=0, minute=0)),
+            'epoch_us': ('1512718020123456', datetime.datetime(2017, 12, 8, 7, 27, 0, 123456, tzinfo=tz.UTC)),
+            'epoch_ms': ('1512718020123', datetime.datetime(2017, 12, 8, 7, 27, 0, 123000, tzinfo=tz.UTC)),
+            'epoch_s': ('1512718020.5', datetime.datetime(2017, 12, 8, 7, 27, 0, 500000, tzinfo=tz.UTC)),
+        }
+        assert set(samples) == set(layout.name for layout in CATALOGUE)
+        for name, (string, dt) in samples.items():
+            layout = sniff([string])
+            assert layout.name == name
+            assert layout.parse(string) == dt
+            if layout.format:
+                assert datetime.datetime.strptime(string, layout.format) == dt
+        assert sniff(['2017-12-08T15:27:00Z']).parse('2017-12-08T15:27:00Z') == DT.replace(tzinfo=tz.UTC)
+        assert sniff(['2017-12-08 15:27:00.123', '2017-12-08T15:27:00-0500']).name == 'iso8601'
+
+    def test_sniff_majority(self):
+        assert sniff(['', None, '2017-12-08', '2017-12-09', '2017/12/10']).name == 'date'
+        assert sniff(['invalid', 'Friday']) is None
+        assert sniff([]) is None
+
+    def test_stream_parser(self):
+        parser = StreamParser(sample=2)
+        values = ['20171208152700', '20171209000000', '2017-12-10 00:00:00', '20171399000000', 'invalid', None]
+        dts = parser.parse_many(values)
+        assert parser.layout.name == 'compact_datetime'
+        assert dts == [DT, datetime.datetime(2017, 12, 9), datetime.datetime(2017, 12, 10), None, None, None]
+        assert parser.fallbacks == 1
+        # Called one value at a time, the first value locks the layout in
+        parser = StreamParser()
+        assert parser.parse('2017/12/08 15:27:00') == DT
+        assert parser.layout.name == 'slash_datetime'
+
+    def test_tc(self):
+        assert tc.sniff_format(['2017-12-08 15:27:00']).format == tc.DATETIME_FORMAT
+        assert tc.parse_many(['1512718020', '1512718021']) == [datetime.datetime(2017, 12, 8, 7, 27, second, tzinfo=tz.UTC) for second in (0, 1)]
+        assert tc.stream_parser(layout=CATALOGUE[0]).parse('2017-12-08 15:27:00') == DT
+
+    def test_plan(self):
+        plan = tc.compile(input='str', input_format='auto', input_timezone='Asia/Shanghai', to='utc', output='timestamp')
+        assert plan.map(['20171208152700', '20171208152701', '2017-12-08T15:27:00+09:00', '1512718020']) == [1512718020, 1512718021, 1512714420, 1512718020]
+        assert plan.parser.layout.name == 'compact_datetime'
+        assert tc.compile(input_format='auto', timezone='Asia/Shanghai', output='naive')('2017-12-08T07:27:00Z') == DT
@@ -0,0 +1,102 @@
+import datetime
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+from dateutil.tz import tz
+
+from TimeConvert.convert import TimeConvertTools
+from TimeConvert.tzbackend import ENV_VAR, FixedBackend, ZoneInfoBackend, get_backend
+
+
+STAMPS = [0, 1512718020, 1489302000, 1489305600, 1509858000, 1509861600] + [random.Random(47).randint(-2 ** 31, 2 ** 32) for _ in range(100)]
+
+
+class TestTZBackend(object):
+
+    def test_get_backend(self, monkeypatch):
+        monkeypatch.delenv(ENV_VAR, raising=False)
+        assert get_backend().name == 'dateutil'
+        assert get_backend('zoneinfo') is get_backend('zoneinfo')
+        monkeypatch.setenv(ENV_VAR, 'zoneinfo')
+        assert get_backend() is get_backend('zoneinfo')
+        assert TimeConvertTools().tz_backend.name == 'zoneinfo'
+        assert TimeConvertTools(tz_backend='dateutil').tz_backend.name == 'dateutil'
+        backend = FixedBackend()
+        assert TimeConvertTools(timezone='UTC', tz_backend=backend).tz_backend is backend
+        with pytest.raises(ValueError):
+            get_backend('pytz')
+
+    def test_zoneinfo(self):
+        dateutil_tc = TimeConvertTools(timezone='America/New_York', tz_backend='dateutil')
+        zoneinfo_tc = TimeConvertTools(timezone='America/New_York', tz_backend='zoneinfo')
+        assert zoneinfo_tc.tzinfo() is ZoneInfoBackend().gettz('America/New_York')
+        assert zoneinfo_tc.tzinfo('Nowhere/Atlantis') is None
+        for stamp in STAMPS:
+            local_dt = zoneinfo_tc.epoch_to_datetime(stamp, timezone=zoneinfo_tc.TIME_ZONE)
+            assert local_dt.replace(tzinfo=None) == dateutil_tc.epoch_to_datetime(stamp, timezone=dateutil_tc.TIME_ZONE).replace(tzinfo=None)
+            utc_dt = zoneinfo_tc.to_utc_datetime(local_dt)
+            assert utc_dt.tzinfo is datetime.timezone.utc
+            assert zoneinfo_tc.is_utc_datetime(utc_dt)
+            assert utc_dt.timestamp() == stamp
+            assert zoneinfo_tc.local_string(utc_dt=utc_dt) == dateutil_tc.local_string(utc_dt=dateutil_tc.to_utc_datetime(local_dt))
+            assert zoneinfo_tc.make_naive(utc_dt) == dateutil_tc.make_naive(utc_dt)
+        assert zoneinfo_tc.is_utc_datetime(datetime.datetime(2017, 12, 8, tzinfo=tz.UTC))
+        assert zoneinfo_tc.to_utc_datetime(datetime.datetime(2017, 12, 8, tzinfo=tz.UTC)).tzinfo is datetime.timezone.utc
+        assert zoneinfo_tc.make_aware(datetime.datetime(2017, 12, 8)).tzinfo is zoneinfo_tc.tzinfo()
+        assert zoneinfo_tc.is_local_datetime(zoneinfo_tc.local_datetime())
+
+    def test_gaps(self):
+        # 02:30 does not exist in New York on 2017-03-12, PEP 495 takes the offset before the gap, dateutil the one after
+        wall = datetime.datetime(2017, 3, 12, 2, 30)
+        for backend, stamp in (('zoneinfo', 1489303800), ('dateutil', 1489300200)):
+            converter = TimeConvertTools(timezone='America/New_York', tz_backend=backend)
+            assert converter.to_utc_datetime(wall).timestamp() == stamp
+            assert converter.compile(output='timestamp')(wall.strftime(converter.DATETIME_FORMAT)) == stamp
+
+    def test_fixed(self):
+        backend = FixedBackend()
+        assert backend.gettz('UTC') is datetime.timezone.utc
+        assert backend.gettz('+08:00').utcoffset(None) == datetime.timedelta(hours=8)
+        assert backend.gettz('UTC-0530').utcoffset(None) == -datetime.timedelta(hours=5, minutes=30)
+        assert backend.gettz('Etc/GMT-8').utcoffset(None) == datetime.timedelta(hours=8)
+        assert backend.gettz('+08:00') is backend.gettz('+08:00')
+        for name in ('Asia/Shanghai', '+24:00', 'UTC+', ''):
+            assert backend.gettz(name) is None, name
+        converter = TimeConvertTools(timezone='+08:00', tz_backend=backend)
+        assert converter.epoch_to_datetime(1512718020, timezone='+08:00').replace(tzinfo=None) == datetime.datetime(2017, 12, 8, 15, 27)
+        assert converter.to_utc_datetime(datetime.datetime(2017, 12, 8, 15, 27)) == datetime.datetime(2017, 12, 8, 7, 27, tzinfo=datetime.timezone.utc)
+        assert converter.zone_table().utcoffset(1512718020) == 8 * 3600
+
+    def test_unresolved_zone(self, monkeypatch):
+        # Named zones, such as the default zone of the host, are unknown to the fixed backend
+        with pytest.raises(ValueError, match='Europe/Paris'):
+            TimeConvertTools(timezone='Europe/Paris', tz_backend='fixed')
+        monkeypatch.setenv(ENV_VAR, 'fixed')
+        monkeypatch.setattr(TimeConvertTools, '_TimeConvertTools__get_base_time_zone', lambda self: 'Asia/Shanghai')
+        # The default zone of the host falls back to UTC, only zones asked for raise
+        assert TimeConvertTools().TIME_ZONE == 'UTC'
+        assert TimeConvertTools().to_local_datetime(datetime.datetime(2017, 12, 8, 7, 27, tzinfo=tz.UTC)).utcoffset() == datetime.timedelta(0)
+        with pytest.raises(ValueError, match='Asia/Shanghai'):
+            TimeConvertTools(timezone='Asia/Shanghai')
+        assert TimeConvertTools(timezone='+08:00').TIME_ZONE == '+08:00'
+        # dateutil keeps falling back to the system zone
+        assert TimeConvertTools(timezone='Nowhere/Atlantis', tz_backend='dateutil').tzinfo() is None
+
+    def test_import(self):
+        env = dict(os.environ, TIMECONVERT_TZ_BACKEND='fixed', TZ='Asia/Shanghai', PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        result = subprocess.run([sys.executable, '-c', 'from TimeConvert import tc; print(tc.tz_backend.name, tc.TIME_ZONE)'], env=env, capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == ['fixed', 'UTC']
+
+    def test_zone_table_cache(self):
+        # Tables are cached per backend, whatever the order of the calls
+        dateutil_tc = TimeConvertTools(timezone='Europe/Paris', tz_backend='dateutil')
+        fixed_tc = TimeConvertTools(timezone='+01:00', tz_backend='fixed')
+        assert dateutil_tc.zone_table().transitions
+        with pytest.raises(ValueError):
+            fixed_tc.zone_table('Europe/Paris')
+        assert fixed_tc.zone_table('UTC') is not dateutil_tc.zone_table('UTC')
+        assert TimeConvertTools(timezone='Europe/Paris', tz_backend='zoneinfo').zone_table().utcoffsets(STAMPS).tolist() == dateutil_tc.zone_table().utcoffsets(STAMPS).tolist()
@@ -0,0 +1,129 @@
+import datetime
+import multiprocessing
+import os
+import pickle
+import random
+import subprocess
+import sys
+
+import pytest
+from dateutil.tz import tz
+
+from TimeConvert.convert import TimeConvertTools
+from TimeConvert.zonestore import TableTZInfo, ZoneStore, attach_shared_memory, build, create_shared_memory, open_file
+from TimeConvert.zonetable import get_zone_table
+
+
+ZONES = ['Asia/Shanghai', 'America/New_York', 'Europe/London', 'Australia/Lord_Howe', 'UTC']
+STAMPS = [1489301999, 1489302000, 1509857999, 1509861600, 1509865200] + [random.Random(48).randint(-2 ** 31, 2 ** 32) for _ in range(300)]
+
+
+def _worker_offsets(name):
+    store = attach_shared_memory(name)
+    table = store.table('America/New_York')
+    offsets = [table.utcoffset(stamp) for stamp in STAMPS]
+    del table
+    store.close()
+    return offsets
+
+
+class TestZoneStore(object):
+
+    def test_roundtrip(self):
+        store = ZoneStore(build(ZONES))
+        assert store.names() == ZONES
+        assert 'Asia/Shanghai' in store and 'Asia/Tokyo' not in store
+        for name in ZONES:
+            table, compiled = store.table(name), get_zone_table(name)
+            assert list(table.transitions) == list(compiled.transitions)
+            assert list(table.offsets) == list(compiled.offsets)
+            assert table.utcoffsets(STAMPS).tolist() == compiled.utcoffsets(STAMPS).tolist()
+        assert store.table('Asia/Shanghai') is store.table('Asia/Shanghai')
+        with pytest.raises(KeyError):
+            store.table('Asia/Tokyo')
+        with pytest.raises(ValueError):
+            ZoneStore(b'\0' * 64)
+
+    def test_tzinfo(self):
+        backend = ZoneStore(build(ZONES)).backend()
+        for name in ZONES:
+            tzinfo, reference = backend.gettz(name), tz.gettz(name)
+            for stamp in STAMPS:
+                dt = datetime.datetime.fromtimestamp(stamp, tzinfo)
+                expected = datetime.datetime.fromtimestamp(stamp, reference)
+                assert dt.replace(tzinfo=None) == expected.replace(tzinfo=None)
+                assert dt.utcoffset() == expected.utcoffset()
+                assert dt.fold == expected.fold
+                assert dt.timestamp() == stamp
+        assert backend.gettz('Asia/Tokyo') is None
+        assert ZoneStore(build(ZONES)).backend('dateutil').gettz('Asia/Tokyo') == tz.gettz('Asia/Tokyo')
+        converter = TimeConvertTools(timezone='America/New_York', tz_backend=backend)
+        assert converter.to_utc_datetime(datetime.datetime(2017, 12, 8, 2, 27)) == datetime.datetime(2017, 12, 8, 7, 27, tzinfo=datetime.timezone.utc)
+        assert converter.normalizer().to_local(datetime.datetime(2017, 11, 5, 6, 30, tzinfo=tz.UTC)).fold == 1
+        assert converter.local_string(utc_dt=datetime.datetime(2017, 12, 8, 7, 27, tzinfo=tz.UTC)) == '2017-12-08 02:27:00'
+
+    def test_pickle(self):
+        store = ZoneStore(build(ZONES))
+        dt = TimeConvertTools(tz_backend=store.backend(), timezone='America/New_York').local_datetime()
+        copy = pickle.loads(pickle.dumps(dt))
+        assert copy == dt and copy.tzinfo is dt.tzinfo
+        ambiguous = datetime.datetime.fromtimestamp(1509863400, store.tzinfo('America/New_York'))
+        assert pickle.loads(pickle.dumps(ambiguous)).timestamp() == 1509863400
+        data, stamp = pickle.dumps(dt), dt.timestamp()
+        store.close()
+        # Without an open store holding the zone, it is compiled
+        copy = pickle.loads(data)
+        assert copy.timestamp() == stamp and isinstance(copy.tzinfo, TableTZInfo)
+
+    def test_close(self, tmp_path):
+        path = str(tmp_path / 'zones.bin')
+        converter = TimeConvertTools()
+        converter.share_zone_tables(['America/New_York'], path=path)
+        store = converter.attach_zone_tables(path=path)
+        table = converter.zone_table('America/New_York')
+        assert table is store.table('America/New_York')
+        assert table.utcoffsets(STAMPS).tolist() == get_zone_table('America/New_York', backend='zoneinfo').utcoffsets(STAMPS).tolist()
+        store.tzinfo('America/New_York')
+        store.close()
+        assert store.owner.closed
+        # Installed tables are dropped, the zone is compiled again
+        assert converter.zone_table('America/New_York') is not table
+        with pytest.raises(ValueError):
+            table.utcoffset(0)
+
+    def test_file(self, tmp_path):
+        path = str(tmp_path / 'zones.bin')
+        converter = TimeConvertTools()
+        assert converter.share_zone_tables(['Asia/Kolkata', 'America/New_York'], path=path) is None
+        store = open_file(path)
+        assert store.names() == ['Asia/Kolkata', 'America/New_York']
+        assert store.table('Asia/Kolkata').transitions.readonly
+        store = converter.attach_zone_tables(path=path)
+        assert converter.zone_table('Asia/Kolkata') is store.table('Asia/Kolkata')
+
+    def test_shared_memory(self):
+        store = create_shared_memory(ZONES)
+        try:
+            context = multiprocessing.get_context('fork')
+            with context.Pool(2) as pool:
+                results = pool.map(_worker_offsets, [store.owner.name] * 2)
+            expected = get_zone_table('America/New_York').utcoffsets(STAMPS).tolist()
+            assert results == [expected, expected]
+        finally:
+            store.close()
+            store.unlink()
+
+    def test_shared_memory_processes(self):
+        # Processes of their own, each with its own resource tracker, attach one after the other
+        store = create_shared_memory(ZONES)
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        code = 'import sys; from TimeConvert.zonestore import attach_shared_memory; store = attach_shared_memory(sys.argv[1]); print(store.names()); store.close()'
+        try:
+            for _ in range(2):
+                result = subprocess.run([sys.executable, '-c', code, store.owner.name], env=env, capture_output=True, text=True)
+                assert result.returncode == 0, result.stderr
+                assert result.stdout.strip() == str(ZONES)
+                assert 'leaked' not in result.stderr
+        finally:
+            store.close()
+            store.unlink()